@@ -0,0 +1,294 @@
+"""Benchmarki gorących ścieżek symulacji w kilku skalach.
+
+Mierzy operacje magazynu, test bankructwa, generator zamówień,
+``run_day``, budowanie ``SupplierOrderDraft`` i
+``SupplierFulfillmentSimulation.run_for_day`` dla podanych rozmiarów
+katalogu i liczby zamówień dziennie. Wyniki są zapisywane jako JSON
+i porównywane z baseline (``benchmarks/baseline.json``). Baseline jest
+zależny od maszyny - przed porównaniem na innym sprzęcie trzeba go
+zapisać na nowo.
+
+Uruchomienie z katalogu projektu::
+
+    python -m benchmarks.hot_paths --sizes 10 1000 100000 1000000 \\
+        --orders 100 10000 --output bench.json
+    python -m benchmarks.hot_paths --save-baseline   # nowy baseline
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.feasibility_index import FeasibilityIndex
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_fulfillment_simulation import SupplierFulfillmentSimulation
+from src.shop_ops.supplier_order import SupplierOrder
+from src.shop_ops.supplier_order_draft import SupplierOrderDraft
+from src.shop_ops.supplier_order_line import SupplierOrderLine
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.headless_simulation import is_shop_bankrupt
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+DEFAULT_SIZES = (10, 1000, 100_000)
+DEFAULT_ORDERS = (100, 10_000)
+MAX_DRAFT_LINES = 10_000
+# setup budujący pełny magazyn kosztuje O(katalog); liczba powtórzeń
+# jest tak dobrana, by łącznie budować co najwyżej tyle pozycji magazynu
+SETUP_BUDGET = 1_000_000
+
+
+def create_catalog(size: int) -> list[Product]:
+    return [Product(name=f"P{i}", purchase_price=10, sell_price=15,
+                    space=0.001)
+            for i in range(size)]
+
+
+def create_stocked_warehouse(products: list[Product],
+                             quantity: int = 1_000_000) -> Warehouse:
+    warehouse = Warehouse(capacity=float('inf'))
+    for product in products:
+        warehouse.add_stock(product, quantity)
+    return warehouse
+
+
+def _time_loops(setup, action, loops: int) -> float:
+    # stan budowany tuż przed każdym wywołaniem - w pamięci jest naraz
+    # tylko jeden (np. jeden pełny magazyn), a setup nie jest mierzony
+    elapsed = 0.0
+    for _ in range(loops):
+        state = setup()
+        start = time.perf_counter()
+        action(state)
+        elapsed += time.perf_counter() - start
+        del state
+    return elapsed
+
+
+def measure(setup, action, operations: int, repeat: int,
+            min_time: float = 0.02, max_loops: int = 1000) -> float:
+    """Najlepszy z `repeat` czasów w nanosekundach na operację.
+
+    Jak w ``timeit``: liczba powtórzeń rośnie, aż pomiar trwa co najmniej
+    `min_time` sekund albo osiągnie `max_loops`. Czas ``setup`` nie jest
+    wliczany; dla kosztownych setupów `max_loops` ogranicza czas całego
+    pomiaru.
+    """
+    loops = 1
+    while True:
+        elapsed = _time_loops(setup, action, loops)
+        if elapsed >= min_time or loops >= max_loops:
+            break
+        loops = min(loops * 10, max_loops)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time_loops(setup, action, loops))
+    return best * 1e9 / (operations * loops)
+
+
+def heavy_setup_loops(catalog_size: int) -> int:
+    return max(1, min(1000, SETUP_BUDGET // max(catalog_size, 1)))
+
+
+def warehouse_benchmarks(products: list[Product],
+                         repeat: int) -> dict[str, float]:
+    n = len(products)
+    warehouse = create_stocked_warehouse(products)
+
+    def add_all(state):
+        for product in products:
+            state.add_stock(product, 1)
+
+    def remove_all(state):
+        for product in products:
+            state.remove_stock(product, 1)
+
+    def get_all(state):
+        for product in products:
+            state.get_quantity(product)
+
+    def used_space(state):
+        for _ in range(n):
+            state.get_used_space()
+
+    def bankruptcy_check(state):
+        shop, index = state
+        is_shop_bankrupt(shop, products, index)
+
+    empty_shop = (Shop(Warehouse(capacity=float('inf')), budget=0),
+                  FeasibilityIndex(products))
+    return {
+        'warehouse.add_stock': measure(
+            lambda: Warehouse(capacity=float('inf')), add_all, n, repeat),
+        'warehouse.remove_stock': measure(
+            lambda: create_stocked_warehouse(products), remove_all, n,
+            repeat, max_loops=heavy_setup_loops(n)),
+        'warehouse.get_quantity': measure(
+            lambda: warehouse, get_all, n, repeat),
+        'warehouse.get_used_space': measure(
+            lambda: warehouse, used_space, n, repeat),
+        # pusty sklep bez budżetu - najgorszy przypadek testu bankructwa
+        'bankruptcy.is_shop_bankrupt': measure(
+            lambda: empty_shop, bankruptcy_check, 1, repeat),
+    }
+
+
+def create_generator(orders_per_day: int) -> CustomerOrderGenerator:
+    return CustomerOrderGenerator(min_orders_per_day=orders_per_day,
+                                  max_orders_per_day=orders_per_day + 1,
+                                  min_quantity_per_order=1,
+                                  max_quantity_per_order=5,
+                                  seed=123)
+
+
+def demand_benchmarks(products: list[Product],
+                      orders_per_day: int,
+                      repeat: int) -> dict[str, float]:
+    def generate(generator):
+        generator.generate_orders(products)
+
+    def run_day(state):
+        simulation, shop = state
+        simulation.run_day(shop=shop, products=products)
+
+    def run_day_setup():
+        warehouse = create_stocked_warehouse(products)
+        simulation = CustomerDemandSimulation(create_generator(orders_per_day))
+        return simulation, Shop(warehouse, budget=0)
+
+    return {
+        'generator.generate_orders': measure(
+            lambda: create_generator(orders_per_day), generate,
+            orders_per_day, repeat),
+        'demand.run_day': measure(run_day_setup, run_day, orders_per_day,
+                                  repeat,
+                                  max_loops=heavy_setup_loops(len(products))),
+    }
+
+
+def supplier_benchmarks(products: list[Product],
+                        orders_per_day: int,
+                        repeat: int) -> dict[str, float]:
+    lines = products[:MAX_DRAFT_LINES]
+    shop = Shop(Warehouse(capacity=float('inf')), budget=float('inf'))
+
+    def build_draft(draft):
+        for product in lines:
+            draft.add_line(shop, product, 1)
+
+    def deliver_setup():
+        # jedno zamówienie na każdy dzień; wszystkie czekają w harmonogramie
+        fulfillment = SupplierFulfillmentSimulation()
+        product = products[0]
+        for day in range(orders_per_day):
+            fulfillment.add_order(SupplierOrder(
+                [SupplierOrderLine(product, 1)], delivery_day=day))
+        return fulfillment, Shop(Warehouse(capacity=float('inf')))
+
+    def deliver(state):
+        fulfillment, delivery_shop = state
+        for day in range(orders_per_day):
+            fulfillment.run_for_day(delivery_shop, current_day=day)
+
+    return {
+        'draft.add_line': measure(SupplierOrderDraft, build_draft,
+                                  len(lines), repeat),
+        'fulfillment.run_for_day': measure(deliver_setup, deliver,
+                                           orders_per_day, repeat),
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES,
+              orders=DEFAULT_ORDERS,
+              repeat: int = 3) -> dict:
+    results = []
+    for size in sizes:
+        products = create_catalog(size)
+        for name, ns in warehouse_benchmarks(products, repeat).items():
+            results.append({'name': name, 'catalog_size': size,
+                            'orders_per_day': None, 'ns_per_op': ns})
+        for orders_per_day in orders:
+            timings = demand_benchmarks(products, orders_per_day, repeat)
+            timings.update(supplier_benchmarks(products, orders_per_day,
+                                               repeat))
+            for name, ns in timings.items():
+                results.append({'name': name, 'catalog_size': size,
+                                'orders_per_day': orders_per_day,
+                                'ns_per_op': ns})
+    return {'python': platform.python_version(),
+            'machine': platform.machine(),
+            'results': results}
+
+
+def _key(result: dict) -> tuple:
+    return result['name'], result['catalog_size'], result['orders_per_day']
+
+
+def find_regressions(current: dict,
+                     baseline: dict,
+                     tolerance: float = 0.25) -> list[dict]:
+    """Wyniki wolniejsze od baseline o więcej niż `tolerance` (ułamek)."""
+    baseline_by_key = {_key(r): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        reference = baseline_by_key.get(_key(result))
+        if reference is None:
+            continue
+        ratio = result['ns_per_op'] / reference['ns_per_op']
+        if ratio > 1 + tolerance:
+            regressions.append({**result,
+                                'baseline_ns_per_op': reference['ns_per_op'],
+                                'ratio': ratio})
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=list(DEFAULT_SIZES))
+    parser.add_argument('--orders', type=int, nargs='+',
+                        default=list(DEFAULT_ORDERS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='plik JSON z wynikami')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.sizes, args.orders, args.repeat)
+    report = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report)
+    else:
+        print(report)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            file.write(report)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Brak baseline ({args.baseline}) - pominięto porównanie.",
+              file=sys.stderr)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = find_regressions(current, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} "
+              f"size={regression['catalog_size']} "
+              f"orders={regression['orders_per_day']}: "
+              f"{regression['baseline_ns_per_op']:.0f} -> "
+              f"{regression['ns_per_op']:.0f} ns/op "
+              f"(x{regression['ratio']:.2f})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Pomiar pamięci na jedno zamówienie klienta (tracemalloc).
+
+Porównuje obecny ``CustomerOrder`` (``__slots__``) z odpowiednikiem
+opartym na ``__dict__``, czyli układem sprzed zmiany.
+
+Uruchomienie z katalogu projektu::
+
+    python -m benchmarks.memory_per_order
+"""
+import tracemalloc
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.product import Product
+
+
+class DictCustomerOrder:
+    """Układ atrybutów jak w CustomerOrder, ale z __dict__."""
+    _next_id = 1
+
+    def __init__(self, product: Product, quantity: int) -> None:
+        self.id = DictCustomerOrder._next_id
+        DictCustomerOrder._next_id += 1
+        self.product = product
+        self.quantity = quantity
+        self.status = CustomerOrderStatus.PENDING
+
+
+def bytes_per_object(factory, count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # sama lista też zajmuje pamięć; nie wliczamy jej do obiektów
+    list_size = objects.__sizeof__()
+    return (after - before - list_size) / count
+
+
+def main(count: int = 200_000) -> None:
+    product = Product(name="Mleko", purchase_price=10, sell_price=15,
+                      space=0.1)
+    dict_bytes = bytes_per_object(lambda: DictCustomerOrder(product, 5),
+                                  count)
+    slots_bytes = bytes_per_object(lambda: CustomerOrder(product, 5), count)
+    print(f"orders:            {count}")
+    print(f"__dict__ (before): {dict_bytes:.1f} B/order")
+    print(f"__slots__ (after): {slots_bytes:.1f} B/order")
+    print(f"saved:             {1 - slots_bytes / dict_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import math
+import random
+import numpy as np
+
+
+def zipf_weights(num_products: int, exponent: float = 1.0) -> list[float]:
+    """Wagi 1 / k^exponent dla produktów o pozycjach k = 1..num_products."""
+    if num_products <= 0:
+        raise ValueError('Number of products must be > 0')
+
+    if exponent < 0:
+        raise ValueError('Exponent must be >= 0')
+
+    return [1.0 / (rank ** exponent) for rank in range(1, num_products + 1)]
+
+
+class AliasTable:
+    """Tablica aliasów Walkera (wariant Vose) dla rozkładu dyskretnego.
+
+    Budowa kosztuje O(n), a każde losowanie O(1) niezależnie od liczby
+    produktów: losujemy kolumnę i jedną liczbą decydujemy, czy zwrócić ją
+    samą, czy jej alias.
+    """
+
+    def __init__(self, weights) -> None:
+        weights = [float(w) for w in weights]
+        n = len(weights)
+        if n == 0:
+            raise ValueError('Weights must not be empty')
+
+        if any(not math.isfinite(w) or w < 0 for w in weights):
+            raise ValueError('Weights must be finite and >= 0')
+
+        total = math.fsum(weights)
+        if total <= 0:
+            raise ValueError('Sum of weights must be > 0')
+
+        scaled = [w * n / total for w in weights]
+        self._prob: list[float] = [1.0] * n
+        self._alias: list[int] = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # to, co zostało (błędy zaokrągleń), ma prawdopodobieństwo 1
+
+        self._prob_array: np.ndarray | None = None
+        self._alias_array: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._prob)
+
+    def sample(self, rng: random.Random) -> int:
+        x = rng.random() * len(self._prob)
+        column = int(x)
+        if x - column < self._prob[column]:
+            return column
+        return self._alias[column]
+
+    def sample_array(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Wersja wektorowa ``sample`` dla ``np.random.Generator``."""
+        if self._prob_array is None:
+            self._prob_array = np.array(self._prob, dtype=np.float64)
+            self._alias_array = np.array(self._alias, dtype=np.int64)
+        x = rng.random(size) * len(self._prob)
+        columns = x.astype(np.int64)
+        keep = (x - columns) < self._prob_array[columns]
+        return np.where(keep, columns, self._alias_array[columns])
@@ -0,0 +1,176 @@
+import numpy as np
+from src.shop_ops.product import Product
+from src.shop_ops.warehouse import SpaceTotal
+
+
+class ArrayWarehouse:
+    """Magazyn kolumnowy: stany, miejsce i ceny trzymane w tablicach NumPy.
+
+    Każdy produkt dostaje gęsty numer slotu przy pierwszej rejestracji.
+    Publiczne API jest takie samo jak w ``Warehouse``, a dodatkowo
+    ``get_quantities`` i ``apply_deltas`` działają na tablicach id produktów.
+    """
+
+    def __init__(self, capacity: float, initial_slots: int = 16) -> None:
+        if initial_slots <= 0:
+            raise ValueError('Initial slots must be > 0')
+
+        self._capacity: float = capacity
+        self._size: int = 0
+        self._quantities = np.zeros(initial_slots, dtype=np.int64)
+        self._spaces = np.zeros(initial_slots, dtype=np.float64)
+        self._purchase_prices = np.zeros(initial_slots, dtype=np.float64)
+        self._sell_prices = np.zeros(initial_slots, dtype=np.float64)
+        # product.id -> slot, -1 oznacza brak produktu w magazynie
+        self._slot_of_id = np.full(initial_slots, -1, dtype=np.int64)
+        self._used_space = SpaceTotal()
+        self._stocked_count: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow_slots(self, needed: int) -> None:
+        capacity = len(self._quantities)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        for name in ('_quantities', '_spaces',
+                     '_purchase_prices', '_sell_prices'):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def _grow_id_index(self, max_id: int) -> None:
+        length = len(self._slot_of_id)
+        if max_id < length:
+            return
+        new_index = np.full(max(max_id + 1, length * 2), -1, dtype=np.int64)
+        new_index[:length] = self._slot_of_id
+        self._slot_of_id = new_index
+
+    def _slot(self, product_id: int) -> int:
+        if 0 <= product_id < len(self._slot_of_id):
+            return int(self._slot_of_id[product_id])
+        return -1
+
+    def _slots(self, product_ids) -> np.ndarray:
+        ids = np.asarray(product_ids, dtype=np.int64)
+        slots = np.full(ids.shape, -1, dtype=np.int64)
+        in_range = (ids >= 0) & (ids < len(self._slot_of_id))
+        slots[in_range] = self._slot_of_id[ids[in_range]]
+        return slots
+
+    def register_columns(self,
+                         product_ids,
+                         purchase_prices,
+                         sell_prices,
+                         spaces) -> None:
+        ids = np.asarray(product_ids, dtype=np.int64)
+        if ids.ndim != 1:
+            raise ValueError('Product ids must be a 1-D array')
+        if len(ids) == 0:
+            return
+        if len(np.unique(ids)) != len(ids):
+            raise ValueError('Product ids must be unique')
+        if ids.min() < 0:
+            raise ValueError('Product ids must be non-negative')
+
+        self._grow_id_index(int(ids.max()))
+        new_mask = self._slot_of_id[ids] < 0
+        new_ids = ids[new_mask]
+        start = self._size
+        end = start + len(new_ids)
+        self._grow_slots(end)
+
+        self._slot_of_id[new_ids] = np.arange(start, end, dtype=np.int64)
+        self._purchase_prices[start:end] = np.asarray(
+            purchase_prices, dtype=np.float64)[new_mask]
+        self._sell_prices[start:end] = np.asarray(
+            sell_prices, dtype=np.float64)[new_mask]
+        self._spaces[start:end] = np.asarray(
+            spaces, dtype=np.float64)[new_mask]
+        self._size = end
+
+    def register_product(self, product: Product) -> int:
+        if self._slot(product.id) < 0:
+            self.register_columns([product.id],
+                                  [product.purchase_price],
+                                  [product.sell_price],
+                                  [product.space])
+        return self._slot(product.id)
+
+    def get_quantity(self, product: Product) -> int:
+        slot = self._slot(product.id)
+        if slot < 0:
+            return 0
+        return int(self._quantities[slot])
+
+    def get_quantities(self, product_ids) -> np.ndarray:
+        slots = self._slots(product_ids)
+        result = np.zeros(slots.shape, dtype=np.int64)
+        known = slots >= 0
+        result[known] = self._quantities[slots[known]]
+        return result
+
+    def add_stock(self, product: Product, quantity: int) -> None:
+        if quantity <= 0:
+            raise ValueError('Quantity must be > 0')
+
+        slot = self.register_product(product)
+        if self._quantities[slot] == 0:
+            self._stocked_count += 1
+        self._quantities[slot] += quantity
+        self._used_space.add(float(self._spaces[slot]), quantity)
+
+    def remove_stock(self, product: Product, quantity: int) -> None:
+        if quantity <= 0:
+            raise ValueError('Quantity must be > 0')
+
+        slot = self._slot(product.id)
+        if slot < 0:
+            raise ValueError('Product not found in Warehouse')
+
+        if self._quantities[slot] < quantity:
+            raise ValueError('Not enough stock')
+        self._quantities[slot] -= quantity
+        if self._quantities[slot] == 0:
+            self._stocked_count -= 1
+        self._used_space.add(float(self._spaces[slot]), -quantity)
+
+    def apply_deltas(self, product_ids, deltas) -> None:
+        """Zmienia stany wielu produktów naraz (wszystko albo nic).
+
+        Powtórzone id są sumowane. Wszystkie produkty muszą być wcześniej
+        zarejestrowane, a żaden stan nie może spaść poniżej zera.
+        """
+        slots = self._slots(product_ids)
+        delta_array = np.asarray(deltas, dtype=np.int64)
+        if slots.shape != delta_array.shape:
+            raise ValueError('Product ids and deltas must have the same shape')
+        if np.any(slots < 0):
+            raise ValueError('Product not found in Warehouse')
+
+        net = np.zeros(self._size, dtype=np.int64)
+        np.add.at(net, slots, delta_array)
+        if np.any(self._quantities[:self._size] + net < 0):
+            raise ValueError('Not enough stock')
+
+        changed = np.flatnonzero(net)
+        before = self._quantities[changed]
+        after = before + net[changed]
+        self._stocked_count += (int(np.count_nonzero(after))
+                                - int(np.count_nonzero(before)))
+        self._quantities[:self._size] += net
+        for space, delta in zip(self._spaces[changed].tolist(),
+                                net[changed].tolist()):
+            self._used_space.add(space, delta)
+
+    def get_stocked_count(self) -> int:
+        return self._stocked_count
+
+    def get_used_space(self) -> float:
+        return self._used_space.value()
+
+    def get_available_space(self) -> float:
+        return self._capacity - self.get_used_space()
@@ -0,0 +1,100 @@
+from collections import deque
+from typing import Iterable
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.product import Product
+
+
+class BackorderBook:
+    """Kolejki FIFO niezrealizowanych zamówień klientów, osobno na produkt.
+
+    Zamówienie czeka w kolejce swojego produktu razem z dniem przyjęcia.
+    Po dostawie ``drain`` przechodzi tylko kolejki dostarczonych produktów
+    i z każdej zdejmuje jednym ruchem najdłuższy prefiks, który mieści się
+    w stanie magazynu - koszt to O(dostarczone produkty + zdjęte zamówienia).
+    """
+
+    def __init__(self) -> None:
+        # product.id -> kolejka (zamówienie, dzień przyjęcia); puste kolejki
+        # są usuwane, więc słownik zawiera tylko produkty z zaległościami
+        self._queues: dict[int, deque[tuple[CustomerOrder, int]]] = {}
+        self._waiting_quantity: dict[int, int] = {}
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, order: CustomerOrder, day: int) -> None:
+        product_id = order.product.id
+        queue = self._queues.get(product_id)
+        if queue is None:
+            queue = self._queues[product_id] = deque()
+            self._waiting_quantity[product_id] = 0
+        queue.append((order, day))
+        self._waiting_quantity[product_id] += order.quantity
+        self._count += 1
+        order.status = CustomerOrderStatus.BACKORDERED
+
+    def has_waiting(self, product: Product) -> bool:
+        return product.id in self._queues
+
+    def queue_length(self, product: Product) -> int:
+        queue = self._queues.get(product.id)
+        return 0 if queue is None else len(queue)
+
+    def waiting_quantity(self, product: Product) -> int:
+        return self._waiting_quantity.get(product.id, 0)
+
+    def oldest_age(self, product: Product, current_day: int) -> int:
+        """Ile dni czeka najstarsze zamówienie produktu (0 bez kolejki)."""
+        queue = self._queues.get(product.id)
+        if queue is None:
+            return 0
+        return current_day - queue[0][1]
+
+    def max_age(self, current_day: int) -> int:
+        """Wiek najstarszego zamówienia we wszystkich kolejkach."""
+        if not self._queues:
+            return 0
+        return current_day - min(queue[0][1]
+                                 for queue in self._queues.values())
+
+    def drain(self, shop, products: Iterable[Product]) -> list[CustomerOrder]:
+        """Realizuje zaległe zamówienia dostarczonych produktów.
+
+        Kolejność w kolejce jest zachowana: zdejmowane są zamówienia od
+        początku, dopóki suma ilości mieści się w stanie. Towar jest
+        wydawany jednym ``remove_stock`` na produkt, a sprzedaż rejestrowana
+        w kolejności zamówień.
+        """
+        drained: list[CustomerOrder] = []
+        seen: set[int] = set()
+        for product in products:
+            queue = self._queues.get(product.id)
+            if queue is None or product.id in seen:
+                continue
+            seen.add(product.id)
+
+            available = shop.warehouse.get_quantity(product)
+            total = 0
+            taken = 0
+            for order, _ in queue:
+                if total + order.quantity > available:
+                    break
+                total += order.quantity
+                taken += 1
+            if taken == 0:
+                continue
+
+            shop.warehouse.remove_stock(product, total)
+            orders = [queue.popleft()[0] for _ in range(taken)]
+            for order in orders:
+                order.status = CustomerOrderStatus.FULFILLED
+            shop.register_sales(order.total_order_value() for order in orders)
+
+            self._count -= taken
+            self._waiting_quantity[product.id] -= total
+            if not queue:
+                del self._queues[product.id]
+                del self._waiting_quantity[product.id]
+            drained.extend(orders)
+        return drained
@@ -0,0 +1,260 @@
+import csv
+import os
+from collections.abc import Sequence
+from itertools import repeat
+import numpy as np
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.product import Product
+from src.shop_ops.simulation_context import allocate_ids
+
+COLUMNS = ('name', 'purchase_price', 'sell_price', 'space')
+NUMERIC_COLUMNS = COLUMNS[1:]
+
+
+class Catalog:
+    """Katalog produktów trzymany kolumnowo.
+
+    Ceny i miejsce są w tablicach float64 (z pliku ``.npy`` mapowanych
+    w pamięci), nazwy w surowej postaci. Obiekt Product powstaje dopiero
+    przy pierwszym ``product(i)`` i jest zapamiętywany. Id produktów są
+    rezerwowane od razu jako ciągły zakres, więc ``register_in`` może
+    zarejestrować cały katalog w ArrayWarehouse bez tworzenia obiektów.
+    """
+
+    def __init__(self, names, purchase_prices, sell_prices, spaces) -> None:
+        self.purchase_prices = np.asarray(purchase_prices, dtype=np.float64)
+        self.sell_prices = np.asarray(sell_prices, dtype=np.float64)
+        self.spaces = np.asarray(spaces, dtype=np.float64)
+        n = len(names)
+        if not (len(self.purchase_prices) == len(self.sell_prices)
+                == len(self.spaces) == n):
+            raise ValueError('Catalog columns must have the same length')
+
+        self._names = names
+        self._first_id: int = allocate_ids(Product, n)
+        self._products: dict[int, Product] = {}
+        self.products = CatalogProducts(self)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def ids(self) -> np.ndarray:
+        return np.arange(self._first_id, self._first_id + len(self),
+                         dtype=np.int64)
+
+    def name(self, index: int) -> str:
+        name = self._names[index]
+        if isinstance(name, bytes):
+            return name.decode('utf-8')
+        return name
+
+    def names(self) -> list[str]:
+        """Wszystkie nazwy naraz - szybciej niż ``name(i)`` w pętli."""
+        if isinstance(self._names, _EncodedNames):
+            return self._names.decode_all()
+        return [name.decode('utf-8') if isinstance(name, bytes) else name
+                for name in self._names]
+
+    def product(self, index: int) -> Product:
+        if not 0 <= index < len(self):
+            raise IndexError('Catalog index out of range')
+
+        product = self._products.get(index)
+        if product is None:
+            product = Product._with_id(self._first_id + index,
+                                       name=self.name(index),
+                                       purchase_price=float(
+                                           self.purchase_prices[index]),
+                                       sell_price=float(
+                                           self.sell_prices[index]),
+                                       space=float(self.spaces[index]))
+            self._products[index] = product
+        return product
+
+    def index_of(self, product: Product) -> int:
+        index = product.id - self._first_id
+        if not 0 <= index < len(self):
+            raise ValueError('Product is not in catalog')
+        return index
+
+    def materialized_count(self) -> int:
+        return len(self._products)
+
+    def register_in(self, warehouse: ArrayWarehouse) -> None:
+        warehouse.register_columns(self.ids,
+                                   self.purchase_prices,
+                                   self.sell_prices,
+                                   self.spaces)
+
+
+class CatalogProducts(Sequence):
+    """Lista produktów katalogu; element powstaje przy pierwszym odczycie."""
+
+    def __init__(self, catalog: Catalog) -> None:
+        self._catalog = catalog
+
+    def __len__(self) -> int:
+        return len(self._catalog)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._catalog.product(i)
+                    for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._catalog.product(index)
+
+
+class _EncodedNames:
+    """Nazwy UTF-8 sklejone w jeden bufor z tablicą przesunięć."""
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray) -> None:
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return self._data[start:stop].tobytes()
+
+    def decode_all(self) -> list[str]:
+        # cały bufor dekodowany raz zamiast wycinka numpy na każdą nazwę;
+        # przesunięcie w znakach = przesunięcie w bajtach minus liczba
+        # wcześniejszych bajtów kontynuacji UTF-8 (10xxxxxx)
+        data = np.asarray(self._data)
+        continuation = np.flatnonzero((data & 0xC0) == 0x80)
+        offsets = np.asarray(self._offsets)
+        starts = (offsets - np.searchsorted(continuation, offsets)).tolist()
+        text = data.tobytes().decode('utf-8')
+        return [text[start:stop] for start, stop in zip(starts, starts[1:])]
+
+
+def read_csv_catalog(path: str) -> Catalog:
+    """Wczytuje CSV z nagłówkiem zawierającym kolumny COLUMNS."""
+    with open(path, 'rb') as file:
+        header = file.readline().decode('utf-8-sig').strip().split(',')
+        data = file.read()
+
+    if b'"' in data:
+        # pola w cudzysłowach - wolniejsza, ale pełna obsługa formatu CSV
+        return _read_quoted_csv(path)
+
+    positions = _column_positions(header)
+    width = len(header)
+    # puste wiersze są pomijane tak samo jak w _read_quoted_csv
+    lines = [line for line in data.replace(b'\r\n', b'\n').split(b'\n')
+             if line]
+    separators = list(map(bytes.count, lines, repeat(b',')))
+    if separators.count(width - 1) != len(lines):
+        raise ValueError('Malformed catalog file')
+
+    # wszystkie pola pliku w jednej liście: wiersz po wierszu, po `width`
+    fields = b','.join(lines).split(b',') if lines else []
+    count = len(lines)
+    columns = {}
+    for column in NUMERIC_COLUMNS:
+        values = fields[positions[column]::width]
+        try:
+            columns[column] = np.fromiter(map(float, values),
+                                          dtype=np.float64, count=count)
+        except ValueError:
+            raise ValueError(f'Invalid value in column {column}') from None
+    return _catalog_from_columns(fields[positions['name']::width], columns)
+
+
+def _read_quoted_csv(path: str) -> Catalog:
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        positions = _column_positions(header)
+        rows = [row for row in reader if row]
+    if any(len(row) != len(header) for row in rows):
+        raise ValueError('Malformed catalog file')
+
+    columns = {}
+    for column in NUMERIC_COLUMNS:
+        position = positions[column]
+        try:
+            columns[column] = np.fromiter(
+                (float(row[position]) for row in rows),
+                dtype=np.float64, count=len(rows))
+        except ValueError:
+            raise ValueError(f'Invalid value in column {column}') from None
+    return _catalog_from_columns([row[positions['name']] for row in rows],
+                                 columns)
+
+
+def _catalog_from_columns(names, columns: dict) -> Catalog:
+    return Catalog(names=names,
+                   purchase_prices=columns['purchase_price'],
+                   sell_prices=columns['sell_price'],
+                   spaces=columns['space'])
+
+
+def _column_positions(header) -> dict[str, int]:
+    header = [name.strip() for name in header]
+    missing = [column for column in COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f'Missing catalog columns: {", ".join(missing)}')
+    return {column: header.index(column) for column in COLUMNS}
+
+
+def read_parquet_catalog(path: str) -> Catalog:
+    """Wczytuje Parquet (wymaga pyarrow); plik jest mapowany w pamięci."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('Reading Parquet catalogs requires pyarrow') \
+            from None
+
+    table = pq.read_table(path, columns=list(COLUMNS), memory_map=True)
+    return Catalog(
+        names=table.column('name').to_pylist(),
+        purchase_prices=table.column('purchase_price').to_numpy(),
+        sell_prices=table.column('sell_price').to_numpy(),
+        spaces=table.column('space').to_numpy())
+
+
+def save_catalog(catalog: Catalog, directory: str) -> None:
+    """Zapisuje katalog jako pliki .npy, które ``read_array_catalog``
+    mapuje w pamięci bez parsowania."""
+    os.makedirs(directory, exist_ok=True)
+    encoded = [catalog.name(i).encode('utf-8') for i in range(len(catalog))]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded], out=offsets[1:])
+    np.save(os.path.join(directory, 'name_data.npy'),
+            np.frombuffer(b''.join(encoded), dtype=np.uint8))
+    np.save(os.path.join(directory, 'name_offsets.npy'), offsets)
+    for column in NUMERIC_COLUMNS:
+        np.save(os.path.join(directory, f'{column}.npy'),
+                getattr(catalog, column + 's'))
+
+
+def read_array_catalog(directory: str) -> Catalog:
+    def load(name):
+        return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+
+    return Catalog(names=_EncodedNames(load('name_data'),
+                                       load('name_offsets')),
+                   purchase_prices=load('purchase_price'),
+                   sell_prices=load('sell_price'),
+                   spaces=load('space'))
+
+
+def load_catalog(path: str) -> Catalog:
+    """Wybiera czytnik po rozszerzeniu: .csv, .parquet/.pq albo katalog
+    zapisany przez ``save_catalog``."""
+    if os.path.isdir(path):
+        return read_array_catalog(path)
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return read_csv_catalog(path)
+
+    if extension in ('.parquet', '.pq'):
+        return read_parquet_catalog(path)
+
+    raise ValueError(f'Unsupported catalog format: {extension}')
@@ -0,0 +1,175 @@
+import numpy as np
+from src.shop_ops.catalog import Catalog
+from src.shop_ops.product import Product
+
+SORT_KEYS = ('purchase_price', 'sell_price', 'margin', 'margin_percentage',
+             'space')
+
+
+class CatalogIndex:
+    """Indeks produktów: id i nazwa w O(1), zakresy wartości w O(log n).
+
+    Dla każdego klucza z SORT_KEYS trzymana jest kolumna wartości i jej
+    permutacja sortująca. Zapytanie o przedział to dwa ``searchsorted``,
+    a zapytanie o kilka przedziałów zaczyna od najwęższego z nich
+    i filtruje tylko jego kandydatów. Wyniki są pozycjami na liście
+    produktów; obiekty Product są pobierane dopiero na końcu (dla Catalog
+    tworzone leniwie).
+    """
+
+    def __init__(self,
+                 products,
+                 ids,
+                 names,
+                 purchase_prices,
+                 sell_prices,
+                 spaces) -> None:
+
+        self._products = products
+        # nazwy są czytane raz, przy budowie słownika w find_by_name
+        self._names = names
+        self._position_of_name: dict[str, int] | None = None
+        # nazwy występujące więcej niż raz -> wszystkie ich pozycje
+        self._repeated_names: dict[str, list[int]] = {}
+
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids) and ids.min() < 0:
+            raise ValueError('Product ids must be non-negative')
+        size = int(ids.max()) + 1 if len(ids) else 0
+        # product.id -> pozycja na liście, -1 oznacza brak produktu
+        self._position_of_id = np.full(size, -1, dtype=np.int64)
+        self._position_of_id[ids] = np.arange(len(ids), dtype=np.int64)
+        if np.count_nonzero(self._position_of_id >= 0) != len(ids):
+            raise ValueError('Product ids must be unique')
+
+        purchase = np.asarray(purchase_prices, dtype=np.float64)
+        sell = np.asarray(sell_prices, dtype=np.float64)
+        # te same działania co Product.margin / margin_percentage
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns = {'purchase_price': purchase,
+                       'sell_price': sell,
+                       'margin': sell - purchase,
+                       'margin_percentage': (sell - purchase) / purchase,
+                       'space': np.asarray(spaces, dtype=np.float64)}
+        self._columns = columns
+        self._order = {key: np.argsort(values, kind='stable')
+                       for key, values in columns.items()}
+        self._sorted = {key: columns[key][order]
+                        for key, order in self._order.items()}
+
+    @classmethod
+    def from_products(cls, products: list[Product]) -> 'CatalogIndex':
+        return cls(products,
+                   ids=[p.id for p in products],
+                   names=[p.name for p in products],
+                   purchase_prices=[p.purchase_price for p in products],
+                   sell_prices=[p.sell_price for p in products],
+                   spaces=[p.space for p in products])
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog) -> 'CatalogIndex':
+        """Indeks na kolumnach katalogu, bez tworzenia obiektów Product."""
+        return cls(catalog.products,
+                   ids=catalog.ids,
+                   names=_decoded_names(catalog),
+                   purchase_prices=catalog.purchase_prices,
+                   sell_prices=catalog.sell_prices,
+                   spaces=catalog.spaces)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def position_of(self, product_id: int) -> int:
+        if 0 <= product_id < len(self._position_of_id):
+            position = int(self._position_of_id[product_id])
+            if position >= 0:
+                return position
+        raise ValueError('Product not found in catalog')
+
+    def get_by_id(self, product_id: int) -> Product:
+        return self._products[self.position_of(product_id)]
+
+    def find_by_name(self, name: str) -> list[Product]:
+        """Wszystkie produkty o danej nazwie (nazwy nie muszą być unikalne).
+        Słownik nazw powstaje przy pierwszym wyszukiwaniu."""
+        if self._position_of_name is None:
+            self._build_name_index()
+        if name in self._repeated_names:
+            positions = self._repeated_names[name]
+        elif name in self._position_of_name:
+            positions = [self._position_of_name[name]]
+        else:
+            positions = []
+        return [self._products[position] for position in positions]
+
+    def _build_name_index(self) -> None:
+        names = list(self._names)
+        # wpisy od końca, więc dla powtórzonej nazwy zostaje pierwsza pozycja
+        position_of_name = dict(zip(reversed(names),
+                                    range(len(names) - 1, -1, -1)))
+        if len(position_of_name) < len(names):
+            for position, name in enumerate(names):
+                first = position_of_name[name]
+                if first != position:
+                    self._repeated_names.setdefault(name, [first]).append(
+                        position)
+        self._position_of_name = position_of_name
+        self._names = None
+
+    def _range_positions(self, key: str, low, high) -> np.ndarray:
+        if key not in SORT_KEYS:
+            raise ValueError(f'Unknown sort key: {key}')
+
+        values = self._sorted[key]
+        start = 0 if low is None else np.searchsorted(values, low, 'left')
+        stop = (len(values) if high is None
+                else np.searchsorted(values, high, 'right'))
+        return self._order[key][start:stop]
+
+    def range_positions(self,
+                        key: str,
+                        low: float | None = None,
+                        high: float | None = None) -> np.ndarray:
+        """Pozycje produktów z low <= wartość <= high, rosnąco po `key`."""
+        return self._range_positions(key, low, high).copy()
+
+    def range(self,
+              key: str,
+              low: float | None = None,
+              high: float | None = None) -> list[Product]:
+        return [self._products[position]
+                for position in self._range_positions(key, low,
+                                                      high).tolist()]
+
+    def query_positions(self, **bounds) -> np.ndarray:
+        """Pozycje produktów spełniających wszystkie przedziały naraz, np.
+        ``query_positions(margin=(5, None), space=(None, 0.3))``; wynik
+        w kolejności listy produktów."""
+        if not bounds:
+            return np.arange(len(self), dtype=np.int64)
+
+        candidates = {key: self._range_positions(key, low, high)
+                      for key, (low, high) in bounds.items()}
+        driving_key = min(candidates, key=lambda key: len(candidates[key]))
+        positions = candidates[driving_key]
+        for key, (low, high) in bounds.items():
+            if key == driving_key:
+                continue
+            values = self._columns[key][positions]
+            keep = np.ones(len(positions), dtype=bool)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            positions = positions[keep]
+        return np.sort(positions)
+
+    def query(self, **bounds) -> list[Product]:
+        return [self._products[position]
+                for position in self.query_positions(**bounds).tolist()]
+
+
+def _decoded_names(catalog: Catalog):
+    # generator - nazwy są dekodowane hurtem dopiero przy budowie słownika
+    # w find_by_name, a nie przy tworzeniu indeksu
+    yield from catalog.names()
@@ -1,15 +1,82 @@
 from src.shop_ops.customer_order_generator import CustomerOrderGenerator
-from src.shop_ops.day_result import DayResult
+import numpy as np
+from src.shop_ops.customer_order import CustomerOrderStatus
+from src.shop_ops.day_result import DayResult, DaySummary
+from src.shop_ops.demand_fulfillment import (fulfill_demand_in_bulk,
+                                             fulfill_orders_in_bulk)
+from src.shop_ops.demand_statistics import DemandStatistics
 
 
 class CustomerDemandSimulation:
-    def __init__(self, order_generator: CustomerOrderGenerator):
+    def __init__(self,
+                 order_generator: CustomerOrderGenerator,
+                 batched: bool = False,
+                 statistics: DemandStatistics | None = None):
         self._generator = order_generator
+        # batched=True: zamówienia grupowane po produkcie i realizowane hurtowo
+        self._batched = batched
+        # statystyki popytu aktualizowane po każdym dniu (opcjonalne)
+        self.statistics = statistics
+
+    def run_day(self, shop, products, summary_only: bool = False):
+        if self._batched and shop.backorders is not None:
+            raise ValueError('Batched fulfillment does not support backorders')
+
+        if (self.statistics is not None
+                and self.statistics.num_products != len(products)):
+            # sprawdzane przed realizacją, aby błąd nie zostawił pół dnia
+            raise ValueError('Statistics must have one entry per product')
+
+        if summary_only and shop.backorders is None:
+            # bez kolejek zaległości obiekty zamówień nie są potrzebne
+            return self._run_day_summary(shop, products)
 
-    def run_day(self, shop, products):
         current_day = shop.day_number
         starting_budget = shop.budget
         orders = self._generator.generate_orders(products)
+        if summary_only or self.statistics is not None:
+            # sprawdzamy produkty przed realizacją, aby nie zmieniać stanu
+            product_indices = self._product_indices(orders, products)
+        backordered_count = 0
+        if shop.backorders is not None:
+            fulfilled_count, rejected_count, backordered_count = \
+                self._fulfill_with_backorders(shop, orders)
+        elif self._batched:
+            fulfilled_count, rejected_count = fulfill_orders_in_bulk(shop,
+                                                                     orders)
+        else:
+            fulfilled_count, rejected_count = self._fulfill_sequentially(
+                shop, orders)
+
+        if self.statistics is not None:
+            self.statistics.observe_orders(
+                product_indices, [order.quantity for order in orders])
+
+        day_revenue = shop.get_today_revenue()
+        shop.start_new_day()
+        ending_budget = shop.budget
+        if summary_only:
+            # zamówienia nie są przechowywane - zostają tylko agregaty
+            return self._summarize_orders(orders, product_indices,
+                                          len(products),
+                                          day_number=current_day,
+                                          fulfilled_count=fulfilled_count,
+                                          rejected_count=rejected_count,
+                                          backordered_count=backordered_count,
+                                          day_revenue=day_revenue,
+                                          starting_budget=starting_budget,
+                                          ending_budget=ending_budget)
+        day_result = DayResult(day_number=current_day,
+                               orders=orders,
+                               fulfilled_count=fulfilled_count,
+                               rejected_count=rejected_count,
+                               day_revenue=day_revenue,
+                               starting_budget=starting_budget,
+                               ending_budget=ending_budget,
+                               backordered_count=backordered_count)
+        return day_result
+
+    def _fulfill_sequentially(self, shop, orders) -> tuple[int, int]:
         fulfilled_count = 0
         rejected_count = 0
         for order in orders:
@@ -20,15 +87,97 @@ class CustomerDemandSimulation:
             else:
                 order.reject_order()
                 rejected_count += 1
+        return fulfilled_count, rejected_count
+
+    def _fulfill_with_backorders(self, shop, orders) -> tuple[int, int, int]:
+        """Jak _fulfill_sequentially, ale niezrealizowane zamówienie trafia
+        do kolejki produktu. Gdy kolejka nie jest pusta, nowe zamówienie
+        staje na jej końcu, nawet jeśli reszta stanu by wystarczyła."""
+        backorders = shop.backorders
+        fulfilled_count = 0
+        backordered_count = 0
+        for order in orders:
+            if (not backorders.has_waiting(order.product)
+                    and order.can_be_fulfilled(shop.warehouse)):
+                order.fulfill_order(shop.warehouse)
+                shop.register_sale(order.total_order_value())
+                fulfilled_count += 1
+            else:
+                backorders.add(order, shop.day_number)
+                backordered_count += 1
+        return fulfilled_count, 0, backordered_count
+
+    def _product_indices(self, orders, products) -> np.ndarray:
+        index_of = {product.id: i for i, product in enumerate(products)}
+        try:
+            return np.fromiter((index_of[order.product.id]
+                                for order in orders),
+                               dtype=np.int64, count=len(orders))
+        except KeyError:
+            raise ValueError('Order product is not in products list') from None
+
+    def _run_day_summary(self, shop, products) -> DaySummary:
+        """run_day(summary_only=True) na tablicach: popyt z
+        ``generate_order_arrays``, realizacja hurtowa (z tym samym wynikiem
+        co obsługa po kolei), bez tworzenia obiektów CustomerOrder."""
+        current_day = shop.day_number
+        starting_budget = shop.budget
+        demand = self._generator.generate_order_arrays(len(products))
+        indices = demand.product_indices
+        quantities = demand.quantities
+        if len(indices) and (indices.min() < 0
+                             or indices.max() >= len(products)):
+            raise ValueError('Order product is not in products list')
+
+        fulfilled = fulfill_demand_in_bulk(shop, products, indices, quantities)
+        if self.statistics is not None:
+            self.statistics.observe_orders(indices, quantities)
 
         day_revenue = shop.get_today_revenue()
         shop.start_new_day()
-        ending_budget = shop.budget
-        day_result = DayResult(day_number=current_day,
-                               orders=orders,
+        prices = np.fromiter((products[i].sell_price
+                              for i in indices.tolist()),
+                             dtype=np.float64, count=len(indices))
+        fulfilled_count = int(np.count_nonzero(fulfilled))
+        return self._summarize(indices, quantities, prices * quantities,
+                               fulfilled, ~fulfilled, len(products),
+                               day_number=current_day,
                                fulfilled_count=fulfilled_count,
-                               rejected_count=rejected_count,
+                               rejected_count=len(indices) - fulfilled_count,
                                day_revenue=day_revenue,
                                starting_budget=starting_budget,
-                               ending_budget=ending_budget)
-        return day_result
+                               ending_budget=shop.budget)
+
+    def _summarize_orders(self, orders, indices, n, **totals) -> DaySummary:
+        quantities = np.fromiter((order.quantity for order in orders),
+                                 dtype=np.int64, count=len(orders))
+        values = np.fromiter((order.total_order_value() for order in orders),
+                             dtype=np.float64, count=len(orders))
+        fulfilled = np.fromiter(
+            (order.status == CustomerOrderStatus.FULFILLED
+             for order in orders),
+            dtype=bool, count=len(orders))
+        rejected = np.fromiter(
+            (order.status == CustomerOrderStatus.REJECTED
+             for order in orders),
+            dtype=bool, count=len(orders))
+        return self._summarize(indices, quantities, values, fulfilled,
+                               rejected, n, **totals)
+
+    def _summarize(self, indices, quantities, values, fulfilled, rejected, n,
+                   **totals) -> DaySummary:
+        requested = np.bincount(indices, weights=quantities, minlength=n)
+        fulfilled_quantities = np.bincount(indices[fulfilled],
+                                           weights=quantities[fulfilled],
+                                           minlength=n)
+        revenue = np.bincount(indices[fulfilled], weights=values[fulfilled],
+                              minlength=n)
+        requested = requested.astype(np.int64)
+        fulfilled_quantities = fulfilled_quantities.astype(np.int64)
+        return DaySummary(requested_quantities=requested,
+                          fulfilled_quantities=fulfilled_quantities,
+                          rejected_quantities=np.bincount(
+                              indices[rejected], weights=quantities[rejected],
+                              minlength=n).astype(np.int64),
+                          revenue_by_product=revenue,
+                          **totals)
@@ -1,5 +1,6 @@
 from enum import Enum
 from src.shop_ops.product import Product
+from src.shop_ops.simulation_context import allocate_id
 from src.shop_ops.warehouse import Warehouse
 
 
@@ -7,9 +8,11 @@ class CustomerOrderStatus(Enum):
     PENDING = 1
     FULFILLED = 2
     REJECTED = 3
+    BACKORDERED = 4
 
 
 class CustomerOrder:
+    __slots__ = ('id', 'product', 'quantity', 'status')
     _next_id = 1
 
     def __init__(self,
@@ -17,8 +20,7 @@ class CustomerOrder:
                  quantity: int,
                  status: CustomerOrderStatus = CustomerOrderStatus.PENDING):
 
-        self.id = CustomerOrder._next_id
-        CustomerOrder._next_id += 1
+        self.id = allocate_id(CustomerOrder)
         self.product = product
 
         if quantity <= 0:
@@ -1,6 +1,9 @@
+from src.shop_ops.alias_table import AliasTable, zipf_weights
 from src.shop_ops.product import Product
 from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.demand_batch import DemandBatch
 import random
+import numpy as np
 
 
 class CustomerOrderGenerator:
@@ -9,7 +12,9 @@ class CustomerOrderGenerator:
                  max_orders_per_day: int,
                  min_quantity_per_order: int,
                  max_quantity_per_order: int,
-                 seed=123):
+                 seed=123,
+                 weights=None,
+                 zipf_exponent: float | None = None):
 
         if min_orders_per_day <= 0:
             raise ValueError('Minimum Quantity must be > 0')
@@ -29,22 +34,112 @@ class CustomerOrderGenerator:
         self.min_quantity_per_order: int = min_quantity_per_order
         self.max_quantity_per_order: int = max_quantity_per_order
         self._rng = random.Random(seed)
+        # osobny strumień dla trybu wsadowego: np.random.default_rng(seed),
+        # niezależny od strumienia random.Random używanego w generate_orders
+        self._np_rng = np.random.default_rng(seed)
+        # popularność produktów; bez wag losowanie jest jednostajne
+        self._alias_table: AliasTable | None = None
+        self._weights = None
+        self._zipf_exponent: float | None = None
+        if weights is not None and zipf_exponent is not None:
+            raise ValueError('Use either weights or Zipf exponent')
+        if weights is not None:
+            self.set_weights(weights)
+        if zipf_exponent is not None:
+            self.set_zipf(zipf_exponent)
+
+    def set_weights(self, weights) -> None:
+        """Wagi popularności, po jednej na produkt (w kolejności listy
+        produktów). Tablica aliasów jest budowana tylko przy zmianie wag."""
+        weights = list(weights)
+        if weights == self._weights:
+            return
+        self._alias_table = AliasTable(weights)
+        self._weights = weights
+        self._zipf_exponent = None
+
+    def set_zipf(self, exponent: float = 1.0) -> None:
+        """Popularność według prawa Zipfa: produkt k na liście ma wagę
+        1 / k^exponent. Tablica powstaje przy pierwszym losowaniu, gdy
+        znana jest liczba produktów."""
+        if exponent < 0:
+            raise ValueError('Exponent must be >= 0')
+        self._alias_table = None
+        self._weights = None
+        self._zipf_exponent = exponent
+
+    def set_uniform(self) -> None:
+        self._alias_table = None
+        self._weights = None
+        self._zipf_exponent = None
+
+    def _product_sampler(self, num_products: int) -> AliasTable | None:
+        if self._zipf_exponent is not None:
+            table = self._alias_table
+            if table is None or len(table) != num_products:
+                self._alias_table = AliasTable(
+                    zipf_weights(num_products, self._zipf_exponent))
+        elif self._alias_table is not None:
+            if len(self._alias_table) != num_products:
+                raise ValueError('Weights must match the number of products')
+        return self._alias_table
 
     def generate_orders(self, products: list[Product]) -> list[CustomerOrder]:
         if len(products) == 0:
             raise ValueError('Products list must not be empty')
 
-        order_list: list[CustomerOrder] = []
+        return [CustomerOrder(product=products[index],
+                              quantity=quantity,
+                              status=CustomerOrderStatus.PENDING)
+                for index, quantity in self._draw_orders(len(products))]
+
+    def generate_order_arrays(self, num_products: int) -> DemandBatch:
+        """Te same zamówienia co ``generate_orders`` (ten sam strumień
+        ``random.Random``), ale jako tablice, bez obiektów CustomerOrder."""
+        if num_products <= 0:
+            raise ValueError('Number of products must be > 0')
+
+        indices = []
+        quantities = []
+        for index, quantity in self._draw_orders(num_products):
+            indices.append(index)
+            quantities.append(quantity)
+        return DemandBatch(product_indices=np.array(indices, dtype=np.int64),
+                           quantities=np.array(quantities, dtype=np.int64))
+
+    def _draw_orders(self, num_products: int):
+        """Losuje zamówienia dnia jako pary (pozycja produktu, ilość)."""
         n = self._rng.randrange(self.min_orders_per_day,
                                 self.max_orders_per_day + 1)
 
+        sampler = self._product_sampler(num_products)
         for _ in range(n):
-            product = products[self._rng.randint(0, len(products) - 1)]
+            if sampler is None:
+                index = self._rng.randint(0, num_products - 1)
+            else:
+                index = sampler.sample(self._rng)
             quantity = self._rng.randrange(
                 self.min_quantity_per_order,
                 self.max_quantity_per_order + 1)
-            order_list.append(
-                CustomerOrder(product=product,
-                              quantity=quantity,
-                              status=CustomerOrderStatus.PENDING))
-        return order_list
+            yield index, quantity
+
+    def generate_order_batch(self, num_products: int) -> DemandBatch:
+        """Losuje popyt dnia wektorowo, bez tworzenia obiektów CustomerOrder.
+
+        Dla tego samego ``seed`` kolejne wywołania dają zawsze te same tablice.
+        """
+        if num_products <= 0:
+            raise ValueError('Number of products must be > 0')
+
+        n = int(self._np_rng.integers(self.min_orders_per_day,
+                                      self.max_orders_per_day + 1))
+        sampler = self._product_sampler(num_products)
+        if sampler is None:
+            product_indices = self._np_rng.integers(0, num_products, size=n)
+        else:
+            product_indices = sampler.sample_array(self._np_rng, n)
+        quantities = self._np_rng.integers(self.min_quantity_per_order,
+                                           self.max_quantity_per_order + 1,
+                                           size=n)
+        return DemandBatch(product_indices=product_indices,
+                           quantities=quantities)
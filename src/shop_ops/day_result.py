@@ -1,5 +1,6 @@
 
 from dataclasses import dataclass
+import numpy as np
 from src.shop_ops.customer_order import CustomerOrder
 
 
@@ -12,3 +13,23 @@ class DayResult:
     day_revenue: float
     starting_budget: float
     ending_budget: float
+    backordered_count: int = 0
+    # zaległe zamówienia zrealizowane tego dnia przez dostawy
+    backorders_filled_count: int = 0
+
+
+@dataclass
+class DaySummary:
+    """Wynik dnia bez listy zamówień; tablice indeksowane pozycją produktu."""
+    day_number: int
+    fulfilled_count: int
+    rejected_count: int
+    day_revenue: float
+    starting_budget: float
+    ending_budget: float
+    requested_quantities: np.ndarray
+    fulfilled_quantities: np.ndarray
+    rejected_quantities: np.ndarray
+    revenue_by_product: np.ndarray
+    backordered_count: int = 0
+    backorders_filled_count: int = 0
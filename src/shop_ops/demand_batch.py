@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+import numpy as np
+from src.shop_ops.product import Product
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+
+
+@dataclass
+class DemandBatch:
+    """Popyt jednego dnia jako równoległe tablice (indeks produktu, ilość)."""
+    product_indices: np.ndarray
+    quantities: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.product_indices)
+
+    def to_orders(self, products: list[Product]) -> list[CustomerOrder]:
+        return [CustomerOrder(product=products[index],
+                              quantity=quantity,
+                              status=CustomerOrderStatus.PENDING)
+                for index, quantity in zip(self.product_indices.tolist(),
+                                           self.quantities.tolist())]
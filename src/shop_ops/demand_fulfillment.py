@@ -0,0 +1,145 @@
+import numpy as np
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+
+
+def allocate_first_come_first_served(slots: np.ndarray,
+                                     quantities: np.ndarray,
+                                     stock: np.ndarray) -> np.ndarray:
+    """Zwraca maskę zamówień przyjętych przy obsłudze po kolei.
+
+    Wynik jest identyczny z pętlą "przyjmij, jeśli stan >= ilość", ale liczony
+    grupami produktów: w każdej rundzie przyjmowany jest prefiks, którego suma
+    skumulowana mieści się w stanie, a pierwsze zamówienie ponad próg jest
+    odrzucane. Zamówienia większe od reszty stanu odpadają od razu, więc
+    zwykle wystarczają 1-2 rundy.
+    """
+    n = len(slots)
+    accepted_sorted = np.zeros(n, dtype=bool)
+    if n == 0:
+        return accepted_sorted
+
+    order = np.argsort(slots, kind='stable')
+    slots_sorted = slots[order]
+    quantities_sorted = quantities[order]
+    remaining = np.array(stock, dtype=np.int64)
+    undecided = np.ones(n, dtype=bool)
+
+    while True:
+        positions = np.flatnonzero(undecided)
+        if len(positions) == 0:
+            break
+        s = slots_sorted[positions]
+        q = quantities_sorted[positions]
+
+        fits = q <= remaining[s]
+        undecided[positions[~fits]] = False
+        positions, s, q = positions[fits], s[fits], q[fits]
+        if len(positions) == 0:
+            break
+
+        group_start = np.empty(len(s), dtype=bool)
+        group_start[0] = True
+        group_start[1:] = s[1:] != s[:-1]
+        cumulative = np.cumsum(q)
+        starts = np.flatnonzero(group_start)
+        sizes = np.diff(np.append(starts, len(s)))
+        offsets = np.repeat(cumulative[starts] - q[starts], sizes)
+        ok = cumulative - offsets <= remaining[s]
+
+        # pierwsze zamówienie ponad próg w grupie jest na pewno odrzucone,
+        # późniejsze (mniejsze) mogą jeszcze zmieścić się w reszcie stanu
+        first_over = ~ok
+        first_over[1:] &= group_start[1:] | ok[:-1]
+
+        accepted_sorted[positions[ok]] = True
+        undecided[positions[ok | first_over]] = False
+        remaining -= np.bincount(s[ok], weights=q[ok],
+                                 minlength=len(remaining)).astype(np.int64)
+
+    accepted = np.empty(n, dtype=bool)
+    accepted[order] = accepted_sorted
+    return accepted
+
+
+def fulfill_orders_in_bulk(shop: Shop,
+                           orders: list[CustomerOrder]) -> tuple[int, int]:
+    """Realizuje zamówienia dnia hurtowo i zwraca (zrealizowane, odrzucone)."""
+    if not orders:
+        return 0, 0
+
+    product_ids = np.fromiter((order.product.id for order in orders),
+                              dtype=np.int64, count=len(orders))
+    quantities = np.fromiter((order.quantity for order in orders),
+                             dtype=np.int64, count=len(orders))
+    unique_ids, first_index, slots = np.unique(product_ids,
+                                               return_index=True,
+                                               return_inverse=True)
+    products = [orders[i].product for i in first_index.tolist()]
+    accepted = _take_stock(shop.warehouse, products, unique_ids, slots,
+                           quantities)
+
+    accepted_list = accepted.tolist()
+    values = []
+    for order, is_accepted in zip(orders, accepted_list):
+        if is_accepted:
+            order.status = CustomerOrderStatus.FULFILLED
+            values.append(order.total_order_value())
+        else:
+            order.reject_order()
+    shop.register_sales(values)
+
+    fulfilled_count = len(values)
+    return fulfilled_count, len(orders) - fulfilled_count
+
+
+def fulfill_demand_in_bulk(shop: Shop,
+                           products: list[Product],
+                           product_indices: np.ndarray,
+                           quantities: np.ndarray) -> np.ndarray:
+    """Jak ``fulfill_orders_in_bulk``, ale popyt jest podany tablicami
+    (pozycja produktu na liście, ilość) i nie powstają obiekty
+    CustomerOrder. Zwraca maskę zrealizowanych zamówień."""
+    if len(product_indices) == 0:
+        return np.zeros(0, dtype=bool)
+
+    positions, slots = np.unique(product_indices, return_inverse=True)
+    demand_products = [products[i] for i in positions.tolist()]
+    product_ids = np.fromiter((product.id for product in demand_products),
+                              dtype=np.int64, count=len(demand_products))
+    accepted = _take_stock(shop.warehouse, demand_products, product_ids,
+                           slots, quantities)
+
+    prices = np.fromiter((product.sell_price for product in demand_products),
+                         dtype=np.float64, count=len(demand_products))
+    # ta sama wartość co total_order_value(), sprzedaż w kolejności zamówień
+    values = prices[slots[accepted]] * quantities[accepted]
+    shop.register_sales(values.tolist())
+    return accepted
+
+
+def _take_stock(warehouse, products, product_ids, slots,
+                quantities) -> np.ndarray:
+    """Wydaje towar przyjętym zamówieniom; `slots` wskazuje produkt
+    zamówienia na liście `products` (id w `product_ids`)."""
+    if isinstance(warehouse, ArrayWarehouse):
+        stock = warehouse.get_quantities(product_ids)
+    else:
+        stock = np.array([warehouse.get_quantity(p) for p in products],
+                         dtype=np.int64)
+
+    accepted = allocate_first_come_first_served(slots, quantities, stock)
+
+    removed = np.bincount(slots[accepted], weights=quantities[accepted],
+                          minlength=len(products)).astype(np.int64)
+    if isinstance(warehouse, ArrayWarehouse):
+        # produkty nigdy nieprzyjęte do magazynu są nieznane apply_deltas
+        taken = removed > 0
+        warehouse.apply_deltas(product_ids[taken], -removed[taken])
+    else:
+        for product, quantity in zip(products, removed.tolist()):
+            if quantity > 0:
+                warehouse.remove_stock(product, quantity)
+    return accepted
@@ -0,0 +1,136 @@
+import numpy as np
+
+
+class DemandStatistics:
+    """Bieżące statystyki dziennego popytu (zamówionych sztuk) na produkt.
+
+    Każdy dzień to jedna obserwacja dla wszystkich produktów (także zero).
+    Trzymane są: średnia i wariancja metodą Welforda, wygładzanie
+    wykładnicze poziomu i trendu (Holt) oraz ostatnie `window` dni w buforze
+    cyklicznym z sumami. Pamięć nie rośnie z długością symulacji, a zapytania
+    nie przeglądają historii. Tablice indeksowane pozycją produktu na liście.
+    """
+
+    def __init__(self,
+                 num_products: int,
+                 window: int = 7,
+                 alpha: float = 0.3,
+                 beta: float = 0.1) -> None:
+
+        if num_products <= 0:
+            raise ValueError('Number of products must be > 0')
+
+        if window <= 0:
+            raise ValueError('Window must be > 0')
+
+        if not 0 < alpha <= 1 or not 0 < beta <= 1:
+            raise ValueError('Smoothing factors must be in (0, 1]')
+
+        self.num_products: int = num_products
+        self.window: int = window
+        self.alpha: float = alpha
+        self.beta: float = beta
+        self.days_observed: int = 0
+
+        self._mean = np.zeros(num_products)
+        self._m2 = np.zeros(num_products)
+        self._level = np.zeros(num_products)
+        self._trend = np.zeros(num_products)
+        # ostatnie `window` dni; sumy całkowite, więc bez błędów zaokrągleń
+        self._recent = np.zeros((window, num_products), dtype=np.int64)
+        self._recent_sum = np.zeros(num_products, dtype=np.int64)
+        self._recent_sum_sq = np.zeros(num_products, dtype=np.int64)
+
+    def observe(self, quantities) -> None:
+        """Dodaje jeden dzień: zamówione ilości dla każdego produktu."""
+        x = np.asarray(quantities, dtype=np.int64)
+        if x.shape != (self.num_products,):
+            raise ValueError('Quantities must have one value per product')
+
+        if np.any(x < 0):
+            raise ValueError('Quantity must be >= 0')
+
+        self.days_observed += 1
+        delta = x - self._mean
+        self._mean += delta / self.days_observed
+        self._m2 += delta * (x - self._mean)
+
+        if self.days_observed == 1:
+            self._level[:] = x
+        else:
+            previous_level = self._level
+            self._level = (self.alpha * x
+                           + (1 - self.alpha) * (previous_level + self._trend))
+            self._trend = (self.beta * (self._level - previous_level)
+                           + (1 - self.beta) * self._trend)
+
+        slot = (self.days_observed - 1) % self.window
+        oldest = self._recent[slot]
+        self._recent_sum += x - oldest
+        self._recent_sum_sq += x * x - oldest * oldest
+        self._recent[slot] = x
+
+    def observe_orders(self, product_indices, quantities) -> None:
+        """Dzień podany jako zamówienia (pozycja produktu, ilość)."""
+        self.observe(np.bincount(np.asarray(product_indices, dtype=np.int64),
+                                 weights=np.asarray(quantities),
+                                 minlength=self.num_products))
+
+    # Zapytania: bez `index` tablica dla wszystkich produktów, z `index`
+    # pojedyncza wartość liczona w O(1).
+
+    def mean(self, index: int | None = None):
+        return _select(self._mean, index)
+
+    def variance(self, index: int | None = None):
+        """Wariancja z próby od początku symulacji (0 przed drugim dniem)."""
+        if self.days_observed < 2:
+            return self._zeros(index)
+        return _select(self._m2, index) / (self.days_observed - 1)
+
+    def std(self, index: int | None = None):
+        if index is None:
+            return np.sqrt(self.variance())
+        return self.variance(index) ** 0.5
+
+    def smoothed(self, index: int | None = None):
+        """Wygładzony wykładniczo poziom popytu."""
+        return _select(self._level, index)
+
+    def trend(self, index: int | None = None):
+        """Wygładzona zmiana popytu z dnia na dzień."""
+        return _select(self._trend, index)
+
+    def rolling_mean(self, index: int | None = None):
+        days = min(self.days_observed, self.window)
+        if days == 0:
+            return self._zeros(index)
+        return _select(self._recent_sum, index) / days
+
+    def rolling_variance(self, index: int | None = None):
+        days = min(self.days_observed, self.window)
+        if days < 2:
+            return self._zeros(index)
+        total = _select(self._recent_sum, index)
+        total_sq = _select(self._recent_sum_sq, index)
+        return (total_sq - total ** 2 / days) / (days - 1)
+
+    def forecast(self, index: int | None = None, horizon: int = 1):
+        """Prognoza popytu na dzień za `horizon` dni (poziom + trend)."""
+        if horizon <= 0:
+            raise ValueError('Horizon must be > 0')
+        value = self.smoothed(index) + horizon * self.trend(index)
+        if index is None:
+            return np.maximum(value, 0.0)
+        return max(value, 0.0)
+
+    def _zeros(self, index: int | None):
+        if index is None:
+            return np.zeros(self.num_products)
+        return 0.0
+
+
+def _select(values: np.ndarray, index: int | None):
+    if index is None:
+        return values.copy()
+    return float(values[index])
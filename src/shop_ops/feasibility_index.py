@@ -0,0 +1,31 @@
+from bisect import bisect_right
+from src.shop_ops.product import Product
+
+
+class FeasibilityIndex:
+    """Odpowiada, czy da się kupić choć jedną sztukę któregoś produktu.
+
+    Produkty są posortowane rosnąco po cenie zakupu, a dla każdej pozycji
+    trzymane jest najmniejsze miejsce wśród produktów nie droższych od niej.
+    Zapytanie to jedno wyszukiwanie binarne zamiast przeglądu katalogu.
+    """
+
+    def __init__(self, products: list[Product]) -> None:
+        by_price = sorted(products, key=lambda p: p.purchase_price)
+        self._prices: list[float] = [p.purchase_price for p in by_price]
+        # _min_space[i] = najmniejsze miejsce wśród by_price[0..i]
+        self._min_space: list[float] = []
+        for product in by_price:
+            if self._min_space and self._min_space[-1] <= product.space:
+                self._min_space.append(self._min_space[-1])
+            else:
+                self._min_space.append(product.space)
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def can_buy_any(self, budget: float, available_space: float) -> bool:
+        affordable = bisect_right(self._prices, budget)
+        if affordable == 0:
+            return False
+        return available_space >= self._min_space[affordable - 1]
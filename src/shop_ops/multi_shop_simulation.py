@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+import numpy as np
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.demand_batch import DemandBatch
+from src.shop_ops.demand_fulfillment import allocate_first_come_first_served
+from src.shop_ops.product import Product
+from src.shop_ops.warehouse import space_units_array, units_to_space
+
+
+@dataclass
+class MultiShopDayResult:
+    """Wynik dnia dla wszystkich sklepów; tablice indeksowane numerem sklepu."""
+    day_number: np.ndarray
+    fulfilled_count: np.ndarray
+    rejected_count: np.ndarray
+    day_revenue: np.ndarray
+    starting_budget: np.ndarray
+    ending_budget: np.ndarray
+
+
+class MultiShopSimulation:
+    """Wiele sklepów z tym samym katalogiem, stan trzymany w tablicach.
+
+    Jeden ``run_day`` odpowiada wywołaniu CustomerDemandSimulation.run_day
+    dla każdego sklepu osobno: zamówienia są obsługiwane po kolei w obrębie
+    sklepu, a budżety i przychody sumowane w tej samej kolejności.
+    """
+
+    def __init__(self,
+                 products: list[Product],
+                 initial_stock,
+                 budgets,
+                 capacities,
+                 num_shops: int) -> None:
+
+        if num_shops <= 0:
+            raise ValueError('Number of shops must be > 0')
+
+        self.products = products
+        self.num_shops = num_shops
+        self.purchase_prices = np.array([p.purchase_price for p in products],
+                                        dtype=np.float64)
+        self.sell_prices = np.array([p.sell_price for p in products],
+                                    dtype=np.float64)
+        self.spaces = np.array([p.space for p in products], dtype=np.float64)
+        self._space_units, self._space_scale = space_units_array(self.spaces)
+
+        shape = (num_shops, len(products))
+        stock = np.broadcast_to(np.asarray(initial_stock, dtype=np.int64),
+                                shape)
+        if np.any(stock < 0):
+            raise ValueError('Initial stock must be >= 0')
+        self.stock = np.array(stock)
+
+        self.budget = np.array(np.broadcast_to(
+            np.asarray(budgets, dtype=np.float64), (num_shops,)))
+        self.capacity = np.array(np.broadcast_to(
+            np.asarray(capacities, dtype=np.float64), (num_shops,)))
+        self.day_number = np.ones(num_shops, dtype=np.int64)
+        self.total_revenue = np.zeros(num_shops)
+        self.revenue_history: list[np.ndarray] = []
+
+    @property
+    def used_space(self) -> np.ndarray:
+        # liczone ze stanów, dokładnie jak Warehouse.get_used_space - suma
+        # prowadzona na bieżąco gromadziłaby błędy zaokrągleń
+        units = self.stock.astype(object).dot(self._space_units)
+        return units_to_space(units, self._space_scale)
+
+    def get_available_space(self) -> np.ndarray:
+        return self.capacity - self.used_space
+
+    def add_stock(self, shop_indices, product_indices, quantities) -> None:
+        """Dostawy dla wielu sklepów naraz (wiersze stosowane po kolei)."""
+        shops = np.asarray(shop_indices, dtype=np.int64)
+        items = np.asarray(product_indices, dtype=np.int64)
+        amounts = np.asarray(quantities, dtype=np.int64)
+        if np.any(amounts <= 0):
+            raise ValueError('Quantity must be > 0')
+        np.add.at(self.stock, (shops, items), amounts)
+
+    def run_day(self, demand: list[DemandBatch]) -> MultiShopDayResult:
+        if len(demand) != self.num_shops:
+            raise ValueError('Demand must contain one batch per shop')
+
+        counts = np.array([len(batch) for batch in demand], dtype=np.int64)
+        shops = np.repeat(np.arange(self.num_shops), counts)
+        items = np.concatenate(
+            [batch.product_indices for batch in demand]).astype(np.int64)
+        quantities = np.concatenate(
+            [batch.quantities for batch in demand]).astype(np.int64)
+        # indeks spoza katalogu trafiłby w flat_slots w wiersz innego sklepu
+        if np.any((items < 0) | (items >= len(self.products))):
+            raise ValueError('Product index out of range')
+
+        # tylko pary (sklep, produkt), których dotyczą dzisiejsze zamówienia
+        flat_slots = shops * len(self.products) + items
+        touched, slots = np.unique(flat_slots, return_inverse=True)
+        flat_stock = self.stock.reshape(-1)
+        accepted = allocate_first_come_first_served(slots, quantities,
+                                                    flat_stock[touched])
+
+        removed = np.bincount(slots[accepted], weights=quantities[accepted],
+                              minlength=len(touched)).astype(np.int64)
+        flat_stock[touched] -= removed
+
+        accepted_shops = shops[accepted]
+        accepted_items = items[accepted]
+        accepted_quantities = quantities[accepted]
+        values = self.sell_prices[accepted_items] * accepted_quantities
+        starting_budget = self.budget.copy()
+        day_revenue = np.zeros(self.num_shops)
+        np.add.at(day_revenue, accepted_shops, values)
+        np.add.at(self.budget, accepted_shops, values)
+
+        fulfilled = np.bincount(accepted_shops, minlength=self.num_shops)
+        day_number = self.day_number.copy()
+        self.revenue_history.append(day_revenue)
+        self.total_revenue += day_revenue
+        self.day_number += 1
+
+        return MultiShopDayResult(day_number=day_number,
+                                  fulfilled_count=fulfilled,
+                                  rejected_count=counts - fulfilled,
+                                  day_revenue=day_revenue,
+                                  starting_budget=starting_budget,
+                                  ending_budget=self.budget.copy())
+
+    def run_day_with_generators(
+            self,
+            generators: list[CustomerOrderGenerator]) -> MultiShopDayResult:
+        """Popyt z generate_order_batch osobnego generatora każdego sklepu."""
+        return self.run_day([generator.generate_order_batch(len(self.products))
+                             for generator in generators])
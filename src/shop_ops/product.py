@@ -1,4 +1,8 @@
+from src.shop_ops.simulation_context import allocate_id
+
+
 class Product:
+    __slots__ = ('id', 'name', 'purchase_price', 'sell_price', 'space')
     _next_id = 1
 
     def __init__(self,
@@ -7,13 +11,28 @@ class Product:
                  sell_price: float,
                  space: float):
 
-        self.id = Product._next_id
-        Product._next_id += 1
+        self.id = allocate_id(Product)
         self.name = name
         self.purchase_price = purchase_price
         self.sell_price = sell_price
         self.space = space
 
+    @classmethod
+    def _with_id(cls,
+                 product_id: int,
+                 name: str,
+                 purchase_price: float,
+                 sell_price: float,
+                 space: float) -> 'Product':
+        """Produkt z id zarezerwowanym wcześniej (np. przez Catalog)."""
+        product = cls.__new__(cls)
+        product.id = product_id
+        product.name = name
+        product.purchase_price = purchase_price
+        product.sell_price = sell_price
+        product.space = space
+        return product
+
     def margin(self) -> float:
         return float(self.sell_price - self.purchase_price)
 
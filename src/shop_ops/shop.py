@@ -1,27 +1,79 @@
+from array import array
+from collections.abc import Sequence
+from functools import reduce
+from operator import add
+from typing import Iterable
+from src.shop_ops.backorder_book import BackorderBook
 from src.shop_ops.warehouse import Warehouse
 
 
+class RevenueHistory(Sequence):
+    """Przychody kolejnych dni tylko do odczytu (widok na tablicę sklepu)."""
+
+    def __init__(self, revenues: array) -> None:
+        self._revenues = revenues
+
+    def __len__(self) -> int:
+        return len(self._revenues)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._revenues[index])
+        return self._revenues[index]
+
+
 class Shop:
-    def __init__(self, warehouse: Warehouse, budget: float = 10000) -> None:
+    def __init__(self,
+                 warehouse: Warehouse,
+                 budget: float = 10000,
+                 backorders: BackorderBook | None = None) -> None:
         self.warehouse: Warehouse = warehouse
         self.budget: float = budget
+        # None = zamówienia, których nie da się zrealizować, przepadają
+        self.backorders: BackorderBook | None = backorders
         self.day_number: int = 1
         self.today_revenue: float = 0
-        self.revenue_history: list[float] = []
+        # przychody dni i ich sumy prefiksowe w zwartych tablicach typu
+        # double; _revenue_prefix[i] = suma przychodów z pierwszych i dni
+        self._revenue_history: array = array('d')
+        self._revenue_prefix: array = array('d', [0.0])
+
+    @property
+    def revenue_history(self) -> RevenueHistory:
+        return RevenueHistory(self._revenue_history)
 
     def register_sale(self, amount: float) -> None:
         self.today_revenue += amount
         self.budget += amount
 
+    def register_sales(self, amounts: Iterable[float]) -> None:
+        # dodawanie po kolei, tak jak w register_sale (ta sama wartość float)
+        amounts = list(amounts)
+        self.today_revenue = reduce(add, amounts, self.today_revenue)
+        self.budget = reduce(add, amounts, self.budget)
+
     def get_today_revenue(self) -> float:
         return self.today_revenue
 
     def get_total_revenue(self) -> float:
-        total_revenue = 0
-        for revenue in self.revenue_history:
-            total_revenue += revenue
-        return total_revenue
-        # [total_revenue += revenue for revenue in self.revenue_history]
+        return self._revenue_prefix[-1]
+
+    def get_revenue_range(self, start: int, stop: int) -> float:
+        """Suma przychodów z dni historii o indeksach start..stop-1."""
+        if not 0 <= start <= stop <= len(self._revenue_history):
+            raise ValueError('Invalid history range')
+        return self._revenue_prefix[stop] - self._revenue_prefix[start]
+
+    def get_rolling_average(self, window: int) -> float:
+        """Średni przychód z ostatnich `window` dni (lub wszystkich, jeśli
+        historia jest krótsza)."""
+        if window <= 0:
+            raise ValueError('Window must be > 0')
+        days = min(window, len(self._revenue_history))
+        if days == 0:
+            return 0.0
+        stop = len(self._revenue_history)
+        return self.get_revenue_range(stop - days, stop) / days
 
     def is_bankrupt(self) -> bool:
         if self.budget < 0:
@@ -29,6 +81,8 @@ class Shop:
         return False
 
     def start_new_day(self) -> None:
-        self.revenue_history.append(self.today_revenue)
+        self._revenue_history.append(self.today_revenue)
+        self._revenue_prefix.append(self._revenue_prefix[-1]
+                                    + self.today_revenue)
         self.day_number += 1
         self.today_revenue = 0
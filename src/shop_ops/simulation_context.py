@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import random
+
+
+class SimulationContext:
+    """Własne liczniki id i strumienie losowe jednej symulacji.
+
+    Aktywny kontekst jest trzymany w ContextVar, więc każdy wątek (i każde
+    zadanie asyncio) widzi swój własny. Bez aktywnego kontekstu klasy
+    domenowe używają jak dotąd globalnych liczników ``_next_id``.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        self.seed = seed
+        self._next_ids: dict[str, int] = {}
+
+    def allocate_id(self, owner: str, count: int = 1) -> int:
+        """Rezerwuje `count` kolejnych id i zwraca pierwsze z nich."""
+        next_id = self._next_ids.get(owner, 1)
+        self._next_ids[owner] = next_id + count
+        return next_id
+
+    def get_next_ids(self) -> dict[str, int]:
+        return dict(self._next_ids)
+
+    def set_next_ids(self, next_ids: dict[str, int]) -> None:
+        self._next_ids = dict(next_ids)
+
+    def derive_seed(self, stream: str) -> int:
+        """Ziarno strumienia `stream`, zależne tylko od seed i nazwy."""
+        return random.Random(f"{self.seed}:{stream}").getrandbits(64)
+
+    def random(self, stream: str) -> random.Random:
+        return random.Random(self.derive_seed(stream))
+
+    @contextmanager
+    def activate(self):
+        token = _current_context.set(self)
+        try:
+            yield self
+        finally:
+            _current_context.reset(token)
+
+
+_current_context: ContextVar[SimulationContext | None] = ContextVar(
+    'simulation_context', default=None)
+
+
+def current_context() -> SimulationContext | None:
+    return _current_context.get()
+
+
+def allocate_id(cls) -> int:
+    return allocate_ids(cls, 1)
+
+
+def allocate_ids(cls, count: int) -> int:
+    """Rezerwuje ciągły zakres `count` id klasy `cls`; zwraca pierwsze."""
+    if count < 0:
+        raise ValueError('Count must be >= 0')
+
+    context = _current_context.get()
+    if context is None:
+        next_id = cls._next_id
+        cls._next_id += count
+        return next_id
+    return context.allocate_id(cls.__name__, count)
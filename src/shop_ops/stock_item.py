@@ -1,12 +1,13 @@
 from src.shop_ops.product import Product
+from src.shop_ops.simulation_context import allocate_id
 
 
 class StockItem:
+    __slots__ = ('id', 'product', 'quantity')
     _next_id = 1
 
     def __init__(self, product: Product, quantity: int):
-        self.id = Product._next_id
-        StockItem._next_id += 1
+        self.id = allocate_id(StockItem)
         self.product = product
         self.quantity: int = quantity
 
@@ -1,23 +1,85 @@
 from typing import Iterable
+from src.shop_ops.customer_order import CustomerOrder
 from src.shop_ops.shop import Shop
 from src.shop_ops.supplier_order import SupplierOrder, SupplierOrderStatus
 
 
 class SupplierFulfillmentSimulation:
-    def __init__(self, supplier_orders: Iterable[SupplierOrder]) -> None:
-        self.supplier_orders = list(supplier_orders)
+    def __init__(self, supplier_orders: Iterable[SupplierOrder] = ()) -> None:
+        # zamówienia oczekujące pogrupowane po dniu dostawy;
+        # dostarczone zamówienia znikają ze struktury
+        self._orders_by_day: dict[int, list[SupplierOrder]] = {}
+        self._pending_count: int = 0
+        # ostatni dzień przekazany do run_for_day (None przed pierwszym)
+        self._last_day: int | None = None
+        for supplier_order in supplier_orders:
+            self.add_order(supplier_order)
+
+    @property
+    def supplier_orders(self) -> tuple[SupplierOrder, ...]:
+        """Oczekujące zamówienia (dostarczone nie są już przechowywane).
+
+        Krotka tylko do odczytu - nowe zamówienia dodaje się przez
+        ``add_order``.
+        """
+        return tuple(self.pending_orders())
+
+    def add_order(self, supplier_order: SupplierOrder) -> None:
+        if supplier_order.status != SupplierOrderStatus.ORDERED:
+            return
+        if (self._last_day is not None
+                and supplier_order.delivery_day <= self._last_day):
+            # dostawy tego dnia zostały już zrealizowane
+            raise ValueError('Delivery day has already passed')
+        day_orders = self._orders_by_day.setdefault(
+            supplier_order.delivery_day, [])
+        day_orders.append(supplier_order)
+        self._pending_count += 1
+
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    def pending_orders(self) -> list[SupplierOrder]:
+        return [supplier_order
+                for day in sorted(self._orders_by_day)
+                for supplier_order in self._orders_by_day[day]]
 
     def run_for_day(self, shop: Shop, current_day: int) -> list[SupplierOrder]:
+        """Dostarcza zamówienia z dnia `current_day`. Zaległe zamówienia
+        klientów zrealizowane przy dostawie są w ``filled_backorders``
+        każdego zwróconego zamówienia. Zamówienia z pominiętych dni nie są
+        dostarczane - wypadają z harmonogramu."""
         if not isinstance(current_day, int):
             raise ValueError('current_day must an Integer')
 
         if current_day < 0:
             raise ValueError('delivery_day must be non-negative')
 
+        if self._last_day is None or current_day > self._last_day + 1:
+            self._drop_orders_before(current_day)
+        if self._last_day is None or current_day > self._last_day:
+            self._last_day = current_day
+
+        day_orders = self._orders_by_day.pop(current_day, None)
+        if day_orders is None:
+            return []
+        self._pending_count -= len(day_orders)
+
         delivered_today = []
-        for supplier_order in self.supplier_orders:
-            if (supplier_order.status == SupplierOrderStatus.ORDERED and
-                    supplier_order.delivery_day == current_day):
+        for supplier_order in day_orders:
+            # status mógł zostać zmieniony poza symulacją
+            if supplier_order.status == SupplierOrderStatus.ORDERED:
                 supplier_order.deliver(shop)
                 delivered_today.append(supplier_order)
         return delivered_today
+
+    def _drop_orders_before(self, day: int) -> None:
+        for overdue_day in [d for d in self._orders_by_day if d < day]:
+            self._pending_count -= len(self._orders_by_day.pop(overdue_day))
+
+
+def filled_backorders(delivered: list[SupplierOrder]) -> list[CustomerOrder]:
+    """Zaległe zamówienia klientów zrealizowane przez podane dostawy."""
+    return [customer_order
+            for supplier_order in delivered
+            for customer_order in supplier_order.filled_backorders]
@@ -1,4 +1,5 @@
 from typing import Iterable
+from src.shop_ops.customer_order import CustomerOrder
 from src.shop_ops.supplier_order_line import SupplierOrderLine
 from src.shop_ops.shop import Shop
 from enum import Enum
@@ -30,11 +31,15 @@ class SupplierOrder:
         self.lines: list[SupplierOrderLine] = lines_list
         self.status = SupplierOrderStatus.ORDERED
         self.delivery_day = delivery_day
+        # zaległe zamówienia klientów zrealizowane przy tej dostawie
+        self.filled_backorders: list[CustomerOrder] = []
 
     def total_cost(self) -> float:
         return sum(line.line_cost() for line in self.lines)
 
-    def deliver(self, shop: Shop) -> None:
+    def deliver(self, shop: Shop) -> list[CustomerOrder]:
+        """Dodaje towar do magazynu; przy włączonych zaległościach od razu
+        realizuje kolejki dostarczonych produktów i zwraca te zamówienia."""
 
         if self.status != SupplierOrderStatus.ORDERED:
             raise ValueError("Supplier order cannot be delivered"
@@ -43,3 +48,7 @@ class SupplierOrder:
         for line in self.lines:
             shop.warehouse.add_stock(line.product, line.quantity)
         self.status = SupplierOrderStatus.DELIVERED
+        if shop.backorders is not None:
+            self.filled_backorders = shop.backorders.drain(
+                shop, (line.product for line in self.lines))
+        return self.filled_backorders
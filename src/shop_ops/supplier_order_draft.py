@@ -5,8 +5,15 @@ from src.shop_ops.supplier_order_line import SupplierOrderLine
 
 
 class SupplierOrderDraft:
-    def __init__(self) -> None:
+    def __init__(self, merge_lines: bool = False) -> None:
         self.lines: list[SupplierOrderLine] = []
+        # merge_lines=True: kolejne dodania tego samego produktu
+        # zwiększają ilość w istniejącej pozycji
+        self._merge_lines: bool = merge_lines
+        self._lines_by_product: dict[int, SupplierOrderLine] = {}
+        # sumy aktualizowane przy każdym dodaniu pozycji
+        self._total_cost: float = 0
+        self._total_space: float = 0
 
     def add_line(self,
                  shop: Shop,
@@ -14,8 +21,10 @@ class SupplierOrderDraft:
                  quantity: int) -> SupplierOrderLine:
 
         new_line = SupplierOrderLine(product, quantity)
-        new_total_cost = self.total_cost() + new_line.line_cost()
-        new_total_space = self.total_space() + product.space * quantity
+        line_cost = new_line.line_cost()
+        line_space = product.space * quantity
+        new_total_cost = self._total_cost + line_cost
+        new_total_space = self._total_space + line_space
         budget = shop.budget
         available_space = shop.warehouse.get_available_space()
 
@@ -25,14 +34,23 @@ class SupplierOrderDraft:
         if new_total_cost > budget:
             raise ValueError("Not enough budget for this line")
 
+        self._total_cost = new_total_cost
+        self._total_space = new_total_space
+
+        existing_line = self._lines_by_product.get(product.id)
+        if self._merge_lines and existing_line is not None:
+            existing_line.quantity += quantity
+            return existing_line
+
         self.lines.append(new_line)
+        self._lines_by_product.setdefault(product.id, new_line)
         return new_line
 
     def total_cost(self) -> float:
-        return sum(line.line_cost() for line in self.lines)
+        return self._total_cost
 
     def total_space(self) -> float:
-        return sum(line.product.space * line.quantity for line in self.lines)
+        return self._total_space
 
     def confirm(self, shop: Shop, delivery_day: int) -> SupplierOrder:
         if not self.lines:
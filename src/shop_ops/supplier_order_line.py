@@ -2,6 +2,8 @@ from src.shop_ops.product import Product
 
 
 class SupplierOrderLine:
+    __slots__ = ('product', 'quantity', 'unit_price')
+
     def __init__(self, product: Product, quantity: int) -> None:
 
         if not isinstance(quantity, int):
@@ -1,49 +1,120 @@
+import numpy as np
 from src.shop_ops.stock_item import StockItem
 from src.shop_ops.product import Product
 
+class SpaceTotal:
+    """Dokładna suma miejsca zajętego przez towar.
+
+    Miejsce jest sumowane w liczbach całkowitych (jednostki 1/scale, scale
+    to największy dotąd mianownik potęgi dwójki), więc kolejne add/remove
+    nie gromadzą błędów zaokrągleń, a po wydaniu całego towaru suma to 0.0.
+    """
+
+    def __init__(self) -> None:
+        self._units: int = 0
+        self._scale: int = 1
+        # space -> jednostki przy obecnej skali (as_integer_ratio jest drogie)
+        self._units_of: dict[float, int] = {}
+        self._value: float | None = 0.0
+
+    def add(self, space: float, quantity: int) -> None:
+        units = self._units_of.get(space)
+        if units is None:
+            units = self._register(space)
+        self._units += units * quantity
+        self._value = None
+
+    def _register(self, space: float) -> int:
+        numerator, denominator = space.as_integer_ratio()
+        if denominator > self._scale:
+            factor = denominator // self._scale
+            self._units *= factor
+            self._units_of = {known: units * factor
+                              for known, units in self._units_of.items()}
+            self._scale = denominator
+        units = numerator * (self._scale // denominator)
+        self._units_of[space] = units
+        return units
+
+    def value(self) -> float:
+        if self._value is None:
+            # dzielenie int / int zaokrągla wynik dokładny tylko raz
+            self._value = self._units / self._scale
+        return self._value
+
+
+def space_units_array(spaces) -> tuple[np.ndarray, int]:
+    """Jednostki SpaceTotal dla stałego katalogu w silnikach tablicowych.
+
+    Zwraca jednostki (tablica obiektów - int Pythona, bez przepełnień) i
+    wspólną skalę: największy mianownik w katalogu.
+    """
+    ratios = [value.as_integer_ratio() for value in
+              np.asarray(spaces, dtype=np.float64).tolist()]
+    scale = max((denominator for _, denominator in ratios), default=1)
+    units = np.empty(len(ratios), dtype=object)
+    units[:] = [numerator * (scale // denominator)
+                for numerator, denominator in ratios]
+    return units, scale
+
+
+def units_to_space(units: np.ndarray, scale: int) -> np.ndarray:
+    # float(int) zaokrągla raz, a dzielenie przez potęgę dwójki (ldexp) jest
+    # dokładne - wynik jak SpaceTotal.value, bez dzielenia dużych liczb
+    return np.ldexp(units.astype(np.float64), -(scale.bit_length() - 1))
+
 
 class Warehouse:
     def __init__(self, capacity: float) -> None:
-        self._items: list[StockItem] = []
+        # indeks po product.id -> O(1) zamiast przeszukiwania listy
+        self._items: dict[int, StockItem] = {}
         self._capacity: float = capacity
+        # zajęte miejsce aktualizowane przy każdej zmianie stanu
+        self._used_space = SpaceTotal()
+        # liczba produktów z dodatnim stanem
+        self._stocked_count: int = 0
 
     def get_quantity(self, product: Product) -> int:
-        for item in self._items:
-            if item.product == product:
-                return item.quantity
-        return 0
+        item = self._items.get(product.id)
+        if item is None:
+            return 0
+        return item.quantity
 
     def add_stock(self, product: Product, quantity: int) -> None:
         if quantity <= 0:
             raise ValueError('Quantity must be > 0')
 
-        for item in self._items:
-            if item.product == product:
-                item.quantity += quantity
-                return
-
-        item = StockItem(product=product, quantity=quantity)
-        self._items.append(item)
+        item = self._items.get(product.id)
+        if item is None:
+            item = StockItem(product=product, quantity=quantity)
+            self._items[product.id] = item
+            self._stocked_count += 1
+        else:
+            if item.quantity == 0:
+                self._stocked_count += 1
+            item.quantity += quantity
+        self._used_space.add(product.space, quantity)
 
     def remove_stock(self, product: Product, quantity: int) -> None:
         if quantity <= 0:
             raise ValueError('Quantity must be > 0')
 
-        for item in self._items:
-            if item.product == product:
-                if item.quantity < quantity:
-                    raise ValueError('Not enough stock')
-                item.quantity -= quantity
-                return
+        item = self._items.get(product.id)
+        if item is None:
+            raise ValueError('Product not found in Warehouse')
+
+        if item.quantity < quantity:
+            raise ValueError('Not enough stock')
+        item.quantity -= quantity
+        if item.quantity == 0:
+            self._stocked_count -= 1
+        self._used_space.add(item.product.space, -quantity)
 
-        raise ValueError('Product not found in Warehouse')
+    def get_stocked_count(self) -> int:
+        return self._stocked_count
 
     def get_used_space(self) -> float:
-        used_space = 0
-        for item in self._items:
-            used_space += item.product.space * item.quantity
-        return used_space
-    # return sum(item.product.space * item.quantity for item in self._items)
+        return self._used_space.value()
 
     def get_available_space(self) -> float:
         return self._capacity - self.get_used_space()
@@ -1,11 +1,20 @@
 from src.shop_ops.customer_order_generator import CustomerOrderGenerator
 from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
 from src.shop_ops.product import Product
 from src.shop_ops.shop import Shop
 from src.shop_ops.warehouse import Warehouse
+from src.shop_ops.array_warehouse import ArrayWarehouse
 from src.shop_ops.supplier_order import SupplierOrder
 from src.shop_ops.supplier_order_draft import SupplierOrderDraft
 from src.shop_ops.supplier_fulfillment_simulation import SupplierFulfillmentSimulation
+from src.shop_ops.day_result import DayResult, DaySummary
+from src.simulation.instrumentation import Instrumentation
+# is_shop_bankrupt jest tu importowane także dla zgodności wstecznej
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                PurchasingPolicy,
+                                                SimulationSink,
+                                                is_shop_bankrupt)
 
 
 def create_default_products() -> list[Product]:
@@ -38,8 +47,22 @@ def create_default_products() -> list[Product]:
     return products
 
 
-def create_shop_with_initial_stock(products: list[Product]) -> Shop:
-    warehouse = Warehouse(capacity=100.0)
+WAREHOUSE_ENGINES = {
+    "object": Warehouse,
+    "numpy": ArrayWarehouse,
+}
+
+
+def create_warehouse(capacity: float, engine: str = "object"):
+    """Tworzy magazyn wybranego typu ("object" albo "numpy")."""
+    if engine not in WAREHOUSE_ENGINES:
+        raise ValueError(f"Unknown warehouse engine: {engine}")
+    return WAREHOUSE_ENGINES[engine](capacity=capacity)
+
+
+def create_shop_with_initial_stock(products: list[Product],
+                                   warehouse_engine: str = "object") -> Shop:
+    warehouse = create_warehouse(capacity=100.0, engine=warehouse_engine)
 
     for product in products:
         warehouse.add_stock(product, 120)
@@ -48,13 +71,13 @@ def create_shop_with_initial_stock(products: list[Product]) -> Shop:
     return shop
 
 
-def create_order_generator() -> CustomerOrderGenerator:
+def create_order_generator(seed: int = 123) -> CustomerOrderGenerator:
     generator = CustomerOrderGenerator(
         min_orders_per_day=3,
         max_orders_per_day=12,
         min_quantity_per_order=1,
         max_quantity_per_order=6,
-        seed=123,
+        seed=seed,
     )
     return generator
 
@@ -62,26 +85,20 @@ def create_order_generator() -> CustomerOrderGenerator:
 def run_supplier_fulfillment_phase(shop: Shop,
                                    supplier_orders: list[SupplierOrder]) -> None:
     """Realizuje dostawy wszystkich zamówień na bieżący dzień."""
-    if not supplier_orders:
-        print("\nBrak dostaw od dostawcy dzisiaj.")
-        return
-
     simulation = SupplierFulfillmentSimulation(supplier_orders)
     delivered_today = simulation.run_for_day(shop, current_day=shop.day_number)
-
-    if delivered_today:
-        print("\nDostawy od dostawcy:")
-        for order in delivered_today:
-            print(f"- Dostarczono zamówienie z dniem dostawy {order.delivery_day}.")
-    else:
-        print("\nBrak dostaw od dostawcy dzisiaj.")
+    ConsoleSink().deliveries(delivered_today)
 
 
 def run_supplier_order_phase(
         shop: Shop,
         products: list[Product],
-        supplier_orders: list[SupplierOrder]) -> None:
-    """Faza dnia, w której gracz może złożyć zamówienie u dostawcy."""
+        supplier_orders: list[SupplierOrder],
+        delivery_day: int | None = None) -> None:
+    """Faza dnia, w której gracz może złożyć zamówienie u dostawcy.
+
+    Domyślnie dostawa następuje następnego dnia.
+    """
     print("\n=== Faza zakupów u dostawcy ===")
     print(f"Aktualny budżet: {shop.budget:.2f}")
     print(f"Dostępne miejsce w magazynie: {shop.warehouse.get_available_space():.2f}")
@@ -142,15 +159,20 @@ def run_supplier_order_phase(
         print("Koszyk jest pusty. Zamówienie nie zostało złożone.")
         return
 
+    if delivery_day is None:
+        delivery_day = shop.day_number + 1
+    if delivery_day == shop.day_number + 1:
+        when = "na następny dzień"
+    else:
+        when = f"na dzień {delivery_day}"
     confirm = input(
-        "Zatwierdzić koszyk i złożyć zamówienie na następny dzień? (t/n): "
+        f"Zatwierdzić koszyk i złożyć zamówienie {when}? (t/n): "
     ).strip().lower()
 
     if confirm not in ("t", "tak"):
         print("Koszyk odrzucony. Zamówienie nie zostało złożone.")
         return
 
-    delivery_day = shop.day_number + 1
     try:
         order = draft.confirm(shop, delivery_day=delivery_day)
         supplier_orders.append(order)
@@ -163,96 +185,103 @@ def run_supplier_order_phase(
         print(f"Nie udało się potwierdzić zamówienia: {e}")
 
 
-def is_shop_bankrupt(shop: Shop, products: list[Product]) -> bool:
-    """
-    Sklep jest uznany za 'bankruta' w sensie gry, jeśli:
-    - nie ma żadnego towaru w magazynie
-    - nie jest w stanie kupić choć jednej sztuki jakiegokolwiek produktu
-      (ze względu na budżet lub brak miejsca).
-    """
-
-    # Czy jest jeszcze jakikolwiek towar?
-    any_stock = any(shop.warehouse.get_quantity(p) > 0 for p in products)
-    if any_stock:
-        return False
-
-    # Jeżeli nie ma towaru, sprawdzamy, czy da się kupić chociaż jedną sztukę
-    available_space = shop.warehouse.get_available_space()
-    if available_space <= 0:
-        return True  # brak miejsca + brak towaru = koniec gry
-
-    # Czy istnieje produkt, na który nas stać i mamy na niego miejsce?
-    for p in products:
-        if shop.budget >= p.purchase_price and available_space >= p.space:
-            return False
-
-    # Nie ma żadnej kombinacji "1 sztuka produktu", którą można kupić
-    return True
+class InteractivePolicy(PurchasingPolicy):
+    """Polityka zakupów sterowana przez gracza z konsoli (input())."""
 
+    def place_order(self,
+                    shop: Shop,
+                    products: list[Product],
+                    delivery_day: int) -> SupplierOrder | None:
+        placed: list[SupplierOrder] = []
+        run_supplier_order_phase(shop, products, placed, delivery_day)
+        return placed[0] if placed else None
 
-def run_simulation(num_days: int) -> None:
-    products = create_default_products()
-    shop = create_shop_with_initial_stock(products)
-    order_generator = create_order_generator()
-    customer_simulation = CustomerDemandSimulation(order_generator)
 
-    # lista wszystkich zamówień do dostawcy w grze
-    supplier_orders: list[SupplierOrder] = []
-
-    print(
-        f"Budget (Start): {shop.budget:.2f}         Warehouse (Start): "
-        f"{[shop.warehouse.get_quantity(product) for product in products]}"
-    )
+class ConsoleSink(SimulationSink):
+    """Wypisuje przebieg symulacji na konsolę (lub do podanego strumienia)."""
 
-    game_over = False
+    def __init__(self, stream=None) -> None:
+        self._stream = stream
 
-    for _ in range(num_days):
-        print("\n==============================")
-        print(f"=== Dzień {shop.day_number} ===")
+    def _print(self, *args) -> None:
+        print(*args, file=self._stream)
 
-        # 1. Dostawy od dostawcy (na początku dnia)
-        run_supplier_fulfillment_phase(shop, supplier_orders)
-
-        # 2. Faza zakupów gracza u dostawcy
-        run_supplier_order_phase(shop, products, supplier_orders)
-
-        # 3. Popyt klientów
-        day_result = customer_simulation.run_day(shop=shop, products=products)
-        total_orders = len(day_result.orders)
-        fulfilled = day_result.fulfilled_count
-        rejected = day_result.rejected_count
-        day_revenue = day_result.day_revenue
-        starting_budget = day_result.starting_budget
-        ending_budget = day_result.ending_budget
-
-        print("\n=== Podsumowanie dnia (klienci) ===")
-        print(f"Zamówienia klientów: {total_orders}")
-        print(f"Zrealizowane:        {fulfilled}")
-        print(f"Odrzucone:           {rejected}")
-        print(f"Przychód dnia:       {day_revenue:.2f}")
-        print(f"Budżet: {starting_budget:.2f} -> {ending_budget:.2f}")
+    def started(self, shop: Shop, products: list[Product]) -> None:
+        self._print(
+            f"Budget (Start): {shop.budget:.2f}         Warehouse (Start): "
+            f"{[shop.warehouse.get_quantity(product) for product in products]}"
+        )
 
-        print("\nStan magazynu:")
+    def day_started(self, shop: Shop) -> None:
+        self._print("\n==============================")
+        self._print(f"=== Dzień {shop.day_number} ===")
+
+    def deliveries(self, delivered: list[SupplierOrder]) -> None:
+        if delivered:
+            self._print("\nDostawy od dostawcy:")
+            for order in delivered:
+                self._print(f"- Dostarczono zamówienie z dniem dostawy "
+                            f"{order.delivery_day}.")
+        else:
+            self._print("\nBrak dostaw od dostawcy dzisiaj.")
+
+    def backorders_filled(self, orders: list[CustomerOrder]) -> None:
+        self._print(f"Zrealizowane zaległe zamówienia: {len(orders)}")
+
+    def day_finished(self,
+                     day_result: DayResult | DaySummary,
+                     shop: Shop,
+                     products: list[Product]) -> None:
+        self._print("\n=== Podsumowanie dnia (klienci) ===")
+        total_orders = (day_result.fulfilled_count
+                         + day_result.rejected_count
+                         + day_result.backordered_count)
+        self._print(f"Zamówienia klientów: {total_orders}")
+        self._print(f"Zrealizowane:        {day_result.fulfilled_count}")
+        self._print(f"Odrzucone:           {day_result.rejected_count}")
+        if day_result.backordered_count:
+            self._print(f"Zaległe:             "
+                        f"{day_result.backordered_count}")
+        self._print(f"Przychód dnia:       {day_result.day_revenue:.2f}")
+        self._print(f"Budżet: {day_result.starting_budget:.2f} -> "
+                    f"{day_result.ending_budget:.2f}")
+
+        self._print("\nStan magazynu:")
         for product in products:
             product_qty = shop.warehouse.get_quantity(product)
-            print(f"{product.name}: {product_qty}")
-        print("----------------------------")
-
-        # Warunek przegranej / bankructwa
-        if is_shop_bankrupt(shop, products):
-            print("\nSklep zbankrutował!")
-            print("Brak towaru w magazynie i brak możliwości zakupu nowych produktów.")
-            print("Koniec gry.")
-            game_over = True
-            break
-
-    # Jeżeli pętla zakończyła się przez wyczerpanie liczby dni (a nie bankructwo)
-    if not game_over:
-        print("\n==============================")
-        print("Symulacja zakończona – osiągnięto limit dni.")
-        print(f"Ostateczny budżet: {shop.budget:.2f}")
-        print("Stan końcowy magazynu:")
+            self._print(f"{product.name}: {product_qty}")
+        self._print("----------------------------")
+
+    def bankrupt(self, shop: Shop) -> None:
+        self._print("\nSklep zbankrutował!")
+        self._print("Brak towaru w magazynie i brak możliwości zakupu "
+                    "nowych produktów.")
+        self._print("Koniec gry.")
+
+    def finished(self, shop: Shop, products: list[Product]) -> None:
+        # pętla zakończyła się przez wyczerpanie liczby dni (a nie bankructwo)
+        self._print("\n==============================")
+        self._print("Symulacja zakończona – osiągnięto limit dni.")
+        self._print(f"Ostateczny budżet: {shop.budget:.2f}")
+        self._print("Stan końcowy magazynu:")
         for product in products:
             product_qty = shop.warehouse.get_quantity(product)
-            print(f"{product.name}: {product_qty}")
-        print("Koniec symulacji.")
+            self._print(f"{product.name}: {product_qty}")
+        self._print("Koniec symulacji.")
+
+
+def run_simulation(num_days: int,
+                   warehouse_engine: str = "object",
+                   instrumentation: Instrumentation | None = None) -> None:
+    products = create_default_products()
+    shop = create_shop_with_initial_stock(products, warehouse_engine)
+    order_generator = create_order_generator()
+    customer_simulation = CustomerDemandSimulation(order_generator)
+
+    simulation = HeadlessSimulation(shop=shop,
+                                    products=products,
+                                    customer_simulation=customer_simulation,
+                                    policy=InteractivePolicy(),
+                                    sink=ConsoleSink(),
+                                    instrumentation=instrumentation)
+    simulation.run(num_days)
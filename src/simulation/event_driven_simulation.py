@@ -0,0 +1,182 @@
+import heapq
+import itertools
+import random
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.feasibility_index import FeasibilityIndex
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.simulation.headless_simulation import (PurchasingPolicy,
+                                                SimulationResult,
+                                                is_shop_bankrupt)
+
+# przy równym czasie: dostawy, potem przegląd polityki, potem klienci
+DELIVERY = 0
+REVIEW = 1
+ARRIVAL = 2
+
+
+class PoissonDemand:
+    """Napływ klientów jako proces Poissona z czasem w ułamkach dnia."""
+
+    def __init__(self,
+                 rate_per_day: float,
+                 min_quantity_per_order: int,
+                 max_quantity_per_order: int,
+                 seed=123) -> None:
+
+        if rate_per_day <= 0:
+            raise ValueError('Rate must be > 0')
+
+        if min_quantity_per_order <= 0:
+            raise ValueError('Minimum Quantity must be > 0')
+
+        if max_quantity_per_order < min_quantity_per_order:
+            raise ValueError('Maximum Quantity must be > Minimum Quantity')
+
+        self.rate_per_day: float = rate_per_day
+        self.min_quantity_per_order: int = min_quantity_per_order
+        self.max_quantity_per_order: int = max_quantity_per_order
+        self._rng = random.Random(seed)
+
+    def next_arrival(self,
+                     now: float,
+                     products: list[Product]) -> tuple[float, Product, int]:
+        time = now + self._rng.expovariate(self.rate_per_day)
+        product = products[self._rng.randint(0, len(products) - 1)]
+        quantity = self._rng.randrange(self.min_quantity_per_order,
+                                       self.max_quantity_per_order + 1)
+        return time, product, quantity
+
+
+class EventDrivenSimulation:
+    """Symulacja sterowana zdarzeniami z kolejki priorytetowej.
+
+    Zamiast iterować dzień po dniu, pętla przeskakuje do najbliższego
+    zdarzenia (klient, dostawa, przegląd polityki). Polityka jest pytana
+    na początku dnia tylko wtedy, gdy od poprzedniego przeglądu zmienił
+    się stan sklepu - dla deterministycznej polityki decyzja bez zmian
+    byłaby taka sama. Dni bez zdarzeń są jedynie zamykane
+    (``start_new_day``), a test bankructwa robiony po dniach ze zdarzeniami.
+    """
+
+    def __init__(self,
+                 shop: Shop,
+                 products: list[Product],
+                 demand: PoissonDemand,
+                 policy: PurchasingPolicy,
+                 lead_time: int = 1) -> None:
+
+        if lead_time < 1:
+            raise ValueError('Lead time must be >= 1')
+
+        self.shop = shop
+        self.products = products
+        self.demand = demand
+        self.policy = policy
+        self.lead_time = lead_time
+        self.events_processed = 0
+        self.feasibility = FeasibilityIndex(products)
+        self._queue: list[tuple] = []
+        self._sequence = itertools.count()
+        self._review_day: int | None = None
+
+        start = shop.day_number
+        self._schedule_review(start)
+        self._schedule_next_arrival(start)
+
+    def _schedule(self, time: float, kind: int, payload=None) -> None:
+        heapq.heappush(self._queue,
+                       (time, kind, next(self._sequence), payload))
+
+    def _schedule_review(self, day: int) -> None:
+        if self._review_day != day:
+            self._review_day = day
+            self._schedule(day, REVIEW)
+
+    def _schedule_next_arrival(self, now: float) -> None:
+        time, product, quantity = self.demand.next_arrival(now, self.products)
+        self._schedule(time, ARRIVAL, (product, quantity))
+
+    def _process(self, time: float, kind: int, payload) -> tuple[bool, int]:
+        """Zwraca (czy zmienił się stan sklepu, wynik zamówienia klienta)."""
+        day = int(time)
+        if kind == DELIVERY:
+            payload.deliver(self.shop)
+            return True, 0
+
+        if kind == REVIEW:
+            order = self.policy.place_order(
+                self.shop, self.products, delivery_day=day + self.lead_time)
+            if order is None:
+                return False, 0
+            self._schedule(order.delivery_day, DELIVERY, order)
+            return True, 0
+
+        self._schedule_next_arrival(time)
+        product, quantity = payload
+        order = CustomerOrder(product=product, quantity=quantity)
+        if order.can_be_fulfilled(self.shop.warehouse):
+            self.shop.register_sale(order.fulfill_order(self.shop.warehouse))
+            return True, 1
+        order.reject_order()
+        return False, -1
+
+    def _close_days(self, until_day: int) -> tuple[int, float, bool]:
+        """Zamyka bieżący dzień i dni bez zdarzeń aż do `until_day`.
+
+        Test bankructwa wystarczy po pierwszym zamkniętym dniu - w dniach
+        bez zdarzeń stan sklepu się nie zmienia.
+        """
+        shop = self.shop
+        days_closed = 0
+        revenue = 0
+        while shop.day_number < until_day:
+            revenue += shop.get_today_revenue()
+            shop.start_new_day()
+            days_closed += 1
+            if days_closed == 1 and is_shop_bankrupt(shop, self.products,
+                                                        self.feasibility):
+                return days_closed, revenue, True
+        return days_closed, revenue, False
+
+    def run(self, num_days: int) -> SimulationResult:
+        shop = self.shop
+        end = shop.day_number + num_days
+        days_simulated = 0
+        fulfilled_count = 0
+        rejected_count = 0
+        total_revenue = 0
+        bankrupt = False
+
+        while self._queue and self._queue[0][0] < end:
+            day = int(self._queue[0][0])
+            if day > shop.day_number:
+                days_closed, revenue, bankrupt = self._close_days(day)
+                days_simulated += days_closed
+                total_revenue += revenue
+                if bankrupt:
+                    break
+
+            time, kind, _, payload = heapq.heappop(self._queue)
+            self.events_processed += 1
+            changed, outcome = self._process(time, kind, payload)
+            if outcome > 0:
+                fulfilled_count += 1
+            elif outcome < 0:
+                rejected_count += 1
+            if changed:
+                # dostawa przychodzi przed przeglądem tego samego dnia
+                self._schedule_review(day if kind == DELIVERY else day + 1)
+
+        if not bankrupt:
+            days_closed, revenue, bankrupt = self._close_days(end)
+            days_simulated += days_closed
+            total_revenue += revenue
+
+        return SimulationResult(days_simulated=days_simulated,
+                                bankrupt=bankrupt,
+                                final_budget=shop.budget,
+                                total_orders=fulfilled_count + rejected_count,
+                                fulfilled_count=fulfilled_count,
+                                rejected_count=rejected_count,
+                                total_revenue=total_revenue)
@@ -0,0 +1,183 @@
+import os
+import numpy as np
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.day_result import DayResult, DaySummary
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_order import SupplierOrder
+from src.simulation.headless_simulation import SimulationSink
+
+# Układ rekordów (little-endian, bez wyrównania). Pliki nie mają nagłówka,
+# więc można je czytać bezpośrednio przez np.memmap z tym samym dtype.
+ORDER_RECORD = np.dtype([('day', '<i4'),
+                         ('order_id', '<i8'),
+                         ('product_id', '<i8'),
+                         ('quantity', '<i4'),
+                         ('status', 'u1')])
+
+DELIVERY_RECORD = np.dtype([('day', '<i4'),
+                            ('delivery_day', '<i4'),
+                            ('product_id', '<i8'),
+                            ('quantity', '<i4'),
+                            ('unit_price', '<f8')])
+
+DAY_RECORD = np.dtype([('day', '<i4'),
+                       ('fulfilled_count', '<i8'),
+                       ('rejected_count', '<i8'),
+                       ('day_revenue', '<f8'),
+                       ('starting_budget', '<f8'),
+                       ('ending_budget', '<f8')])
+
+ORDERS_FILE = 'orders.bin'
+DELIVERIES_FILE = 'deliveries.bin'
+DAYS_FILE = 'days.bin'
+
+
+class _RecordWriter:
+    """Bufor rekordów jednego typu dopisywany do pliku w całych blokach."""
+
+    def __init__(self, path: str, dtype: np.dtype, capacity: int) -> None:
+        self._file = open(path, 'ab')
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._size = 0
+
+    def reserve(self, count: int) -> np.ndarray:
+        """Zwraca widok na `count` kolejnych wolnych rekordów bufora."""
+        if self._size + count > len(self._buffer):
+            self.flush()
+        if count > len(self._buffer):
+            self._buffer = np.zeros(count, dtype=self._buffer.dtype)
+        rows = self._buffer[self._size:self._size + count]
+        self._size += count
+        return rows
+
+    def flush(self) -> None:
+        if self._size:
+            self._file.write(self._buffer[:self._size].tobytes())
+            self._size = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+class EventLog:
+    """Dziennik zdarzeń tylko do dopisywania: zamówienia, dostawy, dni."""
+
+    def __init__(self, directory: str, buffer_records: int = 65536) -> None:
+        if buffer_records <= 0:
+            raise ValueError('Buffer size must be > 0')
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._orders = _RecordWriter(os.path.join(directory, ORDERS_FILE),
+                                     ORDER_RECORD, buffer_records)
+        self._deliveries = _RecordWriter(
+            os.path.join(directory, DELIVERIES_FILE),
+            DELIVERY_RECORD, buffer_records)
+        self._days = _RecordWriter(os.path.join(directory, DAYS_FILE),
+                                   DAY_RECORD, buffer_records)
+
+    def log_orders(self, day: int, orders: list[CustomerOrder]) -> None:
+        count = len(orders)
+        if count == 0:
+            return
+        rows = self._orders.reserve(count)
+        rows['day'] = day
+        rows['order_id'] = np.fromiter((o.id for o in orders),
+                                       dtype=np.int64, count=count)
+        rows['product_id'] = np.fromiter((o.product.id for o in orders),
+                                         dtype=np.int64, count=count)
+        rows['quantity'] = np.fromiter((o.quantity for o in orders),
+                                       dtype=np.int32, count=count)
+        rows['status'] = np.fromiter((o.status.value for o in orders),
+                                     dtype=np.uint8, count=count)
+
+    def log_delivery(self, day: int, supplier_order: SupplierOrder) -> None:
+        rows = self._deliveries.reserve(len(supplier_order.lines))
+        rows['day'] = day
+        rows['delivery_day'] = supplier_order.delivery_day
+        for row, line in zip(rows, supplier_order.lines):
+            row['product_id'] = line.product.id
+            row['quantity'] = line.quantity
+            row['unit_price'] = line.unit_price
+
+    def log_day(self, day_result: DayResult | DaySummary) -> None:
+        row = self._days.reserve(1)[0]
+        row['day'] = day_result.day_number
+        row['fulfilled_count'] = (day_result.fulfilled_count
+                                  + day_result.backorders_filled_count)
+        row['rejected_count'] = day_result.rejected_count
+        row['day_revenue'] = day_result.day_revenue
+        row['starting_budget'] = day_result.starting_budget
+        row['ending_budget'] = day_result.ending_budget
+
+    def flush(self) -> None:
+        for writer in (self._orders, self._deliveries, self._days):
+            writer.flush()
+
+    def close(self) -> None:
+        for writer in (self._orders, self._deliveries, self._days):
+            writer.close()
+
+    def __enter__(self) -> 'EventLog':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _read_records(directory: str, file_name: str,
+                  dtype: np.dtype) -> np.ndarray:
+    path = os.path.join(directory, file_name)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    # np.memmap nie kopiuje danych - strony są czytane z dysku na żądanie
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def read_order_events(directory: str) -> np.ndarray:
+    return _read_records(directory, ORDERS_FILE, ORDER_RECORD)
+
+
+def read_delivery_events(directory: str) -> np.ndarray:
+    return _read_records(directory, DELIVERIES_FILE, DELIVERY_RECORD)
+
+
+def read_day_events(directory: str) -> np.ndarray:
+    return _read_records(directory, DAYS_FILE, DAY_RECORD)
+
+
+class EventLogSink(SimulationSink):
+    """Zapisuje zdarzenia HeadlessSimulation do EventLog."""
+
+    def __init__(self, event_log: EventLog) -> None:
+        self._log = event_log
+        self._day = 0
+
+    def day_started(self, shop: Shop) -> None:
+        self._day = shop.day_number
+
+    def deliveries(self, delivered: list[SupplierOrder]) -> None:
+        for supplier_order in delivered:
+            self._log.log_delivery(self._day, supplier_order)
+
+    def backorders_filled(self, orders: list[CustomerOrder]) -> None:
+        # drugi rekord zamówienia, tym razem ze statusem FULFILLED
+        self._log.log_orders(self._day, orders)
+
+    def day_finished(self,
+                     day_result: DayResult | DaySummary,
+                     shop: Shop,
+                     products: list[Product]) -> None:
+        # DaySummary nie przechowuje zamówień - zapisujemy tylko wynik dnia
+        if isinstance(day_result, DayResult):
+            self._log.log_orders(day_result.day_number, day_result.orders)
+        self._log.log_day(day_result)
+
+    def bankrupt(self, shop: Shop) -> None:
+        self._log.flush()
+
+    def finished(self, shop: Shop, products: list[Product]) -> None:
+        self._log.flush()
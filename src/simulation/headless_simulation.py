@@ -0,0 +1,264 @@
+from dataclasses import dataclass
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.day_result import DayResult, DaySummary
+from src.shop_ops.feasibility_index import FeasibilityIndex
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_fulfillment_simulation import (
+    SupplierFulfillmentSimulation, filled_backorders)
+from src.shop_ops.supplier_order import SupplierOrder
+from src.shop_ops.supplier_order_draft import SupplierOrderDraft
+from src.simulation.instrumentation import Instrumentation
+
+
+class PurchasingPolicy:
+    """Decyduje o zamówieniu u dostawcy; domyślnie nic nie zamawia."""
+
+    def place_order(self,
+                    shop: Shop,
+                    products: list[Product],
+                    delivery_day: int) -> SupplierOrder | None:
+        return None
+
+
+class NoOrderPolicy(PurchasingPolicy):
+    pass
+
+
+class ReorderPointPolicy(PurchasingPolicy):
+    """Polityka (s, S): gdy stan <= reorder_point, domawiamy do order_up_to."""
+
+    def __init__(self, reorder_point: int, order_up_to: int) -> None:
+        if reorder_point < 0:
+            raise ValueError('Reorder point must be >= 0')
+
+        if order_up_to <= reorder_point:
+            raise ValueError('Order-up-to level must be > reorder point')
+
+        self.reorder_point: int = reorder_point
+        self.order_up_to: int = order_up_to
+
+    def place_order(self,
+                    shop: Shop,
+                    products: list[Product],
+                    delivery_day: int) -> SupplierOrder | None:
+        draft = SupplierOrderDraft()
+        for product in products:
+            quantity = shop.warehouse.get_quantity(product)
+            if quantity > self.reorder_point:
+                continue
+            try:
+                draft.add_line(shop, product, self.order_up_to - quantity)
+            except ValueError:
+                continue
+
+        if not draft.lines:
+            return None
+        return draft.confirm(shop, delivery_day=delivery_day)
+
+
+class SimulationSink:
+    """Odbiorca zdarzeń symulacji; bazowa wersja niczego nie wypisuje."""
+
+    def started(self, shop: Shop, products: list[Product]) -> None:
+        pass
+
+    def day_started(self, shop: Shop) -> None:
+        pass
+
+    def deliveries(self, delivered: list[SupplierOrder]) -> None:
+        pass
+
+    def backorders_filled(self, orders: list[CustomerOrder]) -> None:
+        """Zaległe zamówienia zrealizowane przez dzisiejsze dostawy."""
+        pass
+
+    def supplier_order_placed(self, order: SupplierOrder) -> None:
+        pass
+
+    def day_finished(self,
+                     day_result: DayResult | DaySummary,
+                     shop: Shop,
+                     products: list[Product]) -> None:
+        pass
+
+    def bankrupt(self, shop: Shop) -> None:
+        pass
+
+    def finished(self, shop: Shop, products: list[Product]) -> None:
+        pass
+
+
+@dataclass
+class SimulationResult:
+    days_simulated: int
+    bankrupt: bool
+    final_budget: float
+    total_orders: int
+    fulfilled_count: int
+    rejected_count: int
+    total_revenue: float
+
+
+def is_shop_bankrupt(shop: Shop,
+                     products: list[Product],
+                     index: FeasibilityIndex | None = None) -> bool:
+    """
+    Sklep jest uznany za 'bankruta' w sensie gry, jeśli:
+    - nie ma żadnego towaru w magazynie
+    - nie jest w stanie kupić choć jednej sztuki jakiegokolwiek produktu
+      (ze względu na budżet lub brak miejsca).
+
+    Towar liczy się cały, także produktów spoza `products` - obie wersje
+    testu biorą go z licznika magazynu. `products` (albo `index`,
+    FeasibilityIndex dla `products`) określa tylko, co można dokupić;
+    z indeksem zakup jednej sztuki sprawdza wyszukiwanie binarne.
+    """
+
+    # Czy jest jeszcze jakikolwiek towar?
+    if shop.warehouse.get_stocked_count() > 0:
+        return False
+
+    # Jeżeli nie ma towaru, sprawdzamy, czy da się kupić chociaż jedną sztukę
+    available_space = shop.warehouse.get_available_space()
+    if available_space <= 0:
+        return True  # brak miejsca + brak towaru = koniec gry
+
+    if index is not None:
+        return not index.can_buy_any(shop.budget, available_space)
+
+    # Czy istnieje produkt, na który nas stać i mamy na niego miejsce?
+    for p in products:
+        if shop.budget >= p.purchase_price and available_space >= p.space:
+            return False
+
+    # Nie ma żadnej kombinacji "1 sztuka produktu", którą można kupić
+    return True
+
+
+class HeadlessSimulation:
+    """Pętla dni bez input() i print(): decyzje daje polityka, wyjście sink."""
+
+    def __init__(self,
+                 shop: Shop,
+                 products: list[Product],
+                 customer_simulation: CustomerDemandSimulation,
+                 policy: PurchasingPolicy,
+                 sink: SimulationSink | None = None,
+                 lead_time: int = 1,
+                 summary_only: bool = False,
+                 instrumentation: Instrumentation | None = None) -> None:
+
+        # dostawy są realizowane na początku dnia, przed fazą zakupów
+        if lead_time < 1:
+            raise ValueError('Lead time must be >= 1')
+
+        self.shop = shop
+        self.products = products
+        self.customer_simulation = customer_simulation
+        self.policy = policy
+        self.sink = sink if sink is not None else SimulationSink()
+        self.lead_time = lead_time
+        # summary_only=True: sink dostaje DaySummary zamiast DayResult
+        self.summary_only = summary_only
+        self.fulfillment = SupplierFulfillmentSimulation()
+        self.feasibility = FeasibilityIndex(products)
+        # pomiary faz dnia; None = pętla bez żadnego narzutu
+        self.instrumentation = instrumentation
+
+    def __getstate__(self) -> dict:
+        # sink (np. otwarty plik lub konsola) i pomiary nie są częścią
+        # stanu symulacji
+        state = self.__dict__.copy()
+        state['sink'] = SimulationSink()
+        state['instrumentation'] = None
+        return state
+
+    def run(self, num_days: int) -> SimulationResult:
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._run(num_days)
+
+        # liczniki operacji są podpięte tylko na czas przebiegu
+        instrumentation.attach(self.shop.warehouse)
+        try:
+            return self._run(num_days)
+        finally:
+            instrumentation.detach(self.shop.warehouse)
+
+    def _run(self, num_days: int) -> SimulationResult:
+        shop = self.shop
+        products = self.products
+        sink = self.sink
+        instrumentation = self.instrumentation
+        days_simulated = 0
+        total_orders = 0
+        fulfilled_count = 0
+        rejected_count = 0
+        total_revenue = 0
+        bankrupt = False
+
+        sink.started(shop, products)
+        for _ in range(num_days):
+            if instrumentation is not None:
+                instrumentation.start_day(shop.day_number)
+            sink.day_started(shop)
+            delivered = self.fulfillment.run_for_day(
+                shop, current_day=shop.day_number)
+            sink.deliveries(delivered)
+            backorders = filled_backorders(delivered)
+            if backorders:
+                sink.backorders_filled(backorders)
+            if instrumentation is not None:
+                instrumentation.phase_done('supplier_fulfillment')
+
+            order = self.policy.place_order(
+                shop, products, delivery_day=shop.day_number + self.lead_time)
+            if order is not None:
+                self.fulfillment.add_order(order)
+                sink.supplier_order_placed(order)
+            if instrumentation is not None:
+                instrumentation.phase_done('supplier_order')
+
+            day_result = self.customer_simulation.run_day(
+                shop=shop, products=products, summary_only=self.summary_only)
+            if instrumentation is not None:
+                instrumentation.phase_done('customer_demand')
+            # zaległe zamówienia liczą się jako zrealizowane w dniu dostawy;
+            # do total_orders trafiły w dniu złożenia (backordered_count)
+            day_result.backorders_filled_count = len(backorders)
+            days_simulated += 1
+            total_orders += (day_result.fulfilled_count
+                             + day_result.rejected_count
+                             + day_result.backordered_count)
+            fulfilled_count += (day_result.fulfilled_count
+                                + day_result.backorders_filled_count)
+            rejected_count += day_result.rejected_count
+            total_revenue += day_result.day_revenue
+            sink.day_finished(day_result, shop, products)
+            if instrumentation is not None:
+                instrumentation.phase_done('reporting')
+
+            day_bankrupt = is_shop_bankrupt(shop, products, self.feasibility)
+            if instrumentation is not None:
+                instrumentation.phase_done('bankruptcy_check')
+                instrumentation.end_day(day_result.fulfilled_count
+                                        + day_result.backorders_filled_count,
+                                        day_result.rejected_count)
+
+            if day_bankrupt:
+                bankrupt = True
+                sink.bankrupt(shop)
+                break
+
+        if not bankrupt:
+            sink.finished(shop, products)
+
+        return SimulationResult(days_simulated=days_simulated,
+                                bankrupt=bankrupt,
+                                final_budget=shop.budget,
+                                total_orders=total_orders,
+                                fulfilled_count=fulfilled_count,
+                                rejected_count=rejected_count,
+                                total_revenue=total_revenue)
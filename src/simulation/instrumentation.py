@@ -0,0 +1,145 @@
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+
+PHASES = ('supplier_fulfillment',
+          'supplier_order',
+          'customer_demand',
+          'reporting',
+          'bankruptcy_check')
+
+WAREHOUSE_OPERATIONS = ('add_stock',
+                        'remove_stock',
+                        'get_quantity',
+                        'get_used_space',
+                        'get_available_space',
+                        # tylko ArrayWarehouse
+                        'get_quantities',
+                        'apply_deltas')
+
+
+@dataclass
+class DayTimings:
+    day: int
+    start_ns: int
+    phase_ns: dict[str, int] = field(default_factory=dict)
+    orders: int = 0
+    fulfilled: int = 0
+    rejected: int = 0
+    warehouse_ops: dict[str, int] = field(default_factory=dict)
+
+
+class Instrumentation:
+    """Czasy faz dnia i liczniki operacji dla HeadlessSimulation.
+
+    Gdy symulacja nie dostaje obiektu Instrumentation, pętla dnia nie
+    wykonuje żadnych pomiarów. HeadlessSimulation wywołuje
+    ``attach(warehouse)`` na początku ``run`` i ``detach`` na jego końcu,
+    więc poza przebiegiem magazyn ma swoje zwykłe metody.
+    """
+
+    def __init__(self) -> None:
+        self.days: list[DayTimings] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._last_ns = self._origin_ns
+        self._warehouse_counts = dict.fromkeys(WAREHOUSE_OPERATIONS, 0)
+        self._counts_at_day_start = dict(self._warehouse_counts)
+
+    def attach(self, warehouse) -> None:
+        """Podmienia metody magazynu (na instancji) na wersje liczące.
+
+        Wcześniej podpięte liczniki są najpierw zdejmowane, więc ponowne
+        ``attach`` (także innej instancji) nie liczy operacji podwójnie.
+        """
+        self.detach(warehouse)
+        counts = self._warehouse_counts
+        for name in WAREHOUSE_OPERATIONS:
+            method = getattr(warehouse, name, None)
+            if method is None:
+                continue
+
+            def counted(*args, _name=name, _method=method, **kwargs):
+                counts[_name] += 1
+                return _method(*args, **kwargs)
+            setattr(warehouse, name, counted)
+
+    def detach(self, warehouse) -> None:
+        for name in WAREHOUSE_OPERATIONS:
+            warehouse.__dict__.pop(name, None)
+
+    def start_day(self, day: int) -> None:
+        self._last_ns = time.perf_counter_ns()
+        self._counts_at_day_start = dict(self._warehouse_counts)
+        self.days.append(DayTimings(day=day, start_ns=self._last_ns))
+
+    def phase_done(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self.days[-1].phase_ns[phase] = now - self._last_ns
+        self._last_ns = now
+
+    def end_day(self, fulfilled: int, rejected: int) -> None:
+        current = self.days[-1]
+        current.orders = fulfilled + rejected
+        current.fulfilled = fulfilled
+        current.rejected = rejected
+        current.warehouse_ops = {
+            name: self._warehouse_counts[name]
+            - self._counts_at_day_start[name]
+            for name in WAREHOUSE_OPERATIONS}
+
+    def slowest_phase(self) -> tuple[int, str, int] | None:
+        """(dzień, faza, czas w ns) najdłuższej zmierzonej fazy."""
+        slowest = None
+        for day in self.days:
+            for phase, duration in day.phase_ns.items():
+                if slowest is None or duration > slowest[2]:
+                    slowest = (day.day, phase, duration)
+        return slowest
+
+    def to_chrome_trace(self) -> dict:
+        """Zdarzenia w formacie Trace Event (chrome://tracing, Perfetto)."""
+        events = []
+        for day in self.days:
+            ts_ns = day.start_ns
+            for phase in PHASES:
+                if phase not in day.phase_ns:
+                    continue
+                duration = day.phase_ns[phase]
+                events.append({'name': phase,
+                               'cat': 'phase',
+                               'ph': 'X',
+                               'ts': (ts_ns - self._origin_ns) / 1000,
+                               'dur': duration / 1000,
+                               'pid': 1,
+                               'tid': 1,
+                               'args': {'day': day.day}})
+                ts_ns += duration
+            events.append({'name': 'orders',
+                           'ph': 'C',
+                           'ts': (day.start_ns - self._origin_ns) / 1000,
+                           'pid': 1,
+                           'args': {'fulfilled': day.fulfilled,
+                                    'rejected': day.rejected}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def write_csv(self, path: str) -> None:
+        """Jeden wiersz na dzień: czasy faz w µs i liczniki."""
+        header = (['day']
+                  + [f'{phase}_us' for phase in PHASES]
+                  + ['orders', 'fulfilled', 'rejected']
+                  + [f'warehouse_{name}' for name in WAREHOUSE_OPERATIONS])
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            for day in self.days:
+                writer.writerow(
+                    [day.day]
+                    + [day.phase_ns.get(phase, 0) / 1000 for phase in PHASES]
+                    + [day.orders, day.fulfilled, day.rejected]
+                    + [day.warehouse_ops.get(name, 0)
+                       for name in WAREHOUSE_OPERATIONS])
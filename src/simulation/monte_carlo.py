@@ -0,0 +1,108 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
+import numpy as np
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.simulation_context import SimulationContext
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                PurchasingPolicy,
+                                                SimulationResult)
+
+
+@dataclass
+class Scenario:
+    """Opis jednego przebiegu; musi dać się zserializować (pickle) do procesu.
+
+    Domyślnie używa produktów, sklepu i generatora z ``cli_simulation``.
+    Inne scenariusze nadpisują ``build``.
+    """
+    num_days: int
+    policy: PurchasingPolicy = field(default_factory=PurchasingPolicy)
+    warehouse_engine: str = "object"
+
+    def build(self, seed: int) -> HeadlessSimulation:
+        products = create_default_products()
+        shop = create_shop_with_initial_stock(products, self.warehouse_engine)
+        customer_simulation = CustomerDemandSimulation(
+            create_order_generator(seed=seed))
+        return HeadlessSimulation(shop=shop,
+                                  products=products,
+                                  customer_simulation=customer_simulation,
+                                  policy=self.policy)
+
+    def run(self, seed: int) -> SimulationResult:
+        return self.build(seed).run(self.num_days)
+
+
+@dataclass
+class MonteCarloSummary:
+    runs: int
+    mean_final_budget: float
+    final_budget_percentiles: dict[int, float]
+    stockout_rate: float
+    bankruptcy_probability: float
+
+
+def derive_seeds(base_seed: int, runs: int) -> list[int]:
+    """Niezależne ziarna dla przebiegów, zawsze te same dla base_seed."""
+    children = np.random.SeedSequence(base_seed).spawn(runs)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+
+def summarize(results: list[SimulationResult],
+              percentiles: tuple[int, ...] = (5, 50, 95)
+              ) -> MonteCarloSummary:
+    if not results:
+        raise ValueError('Results list must not be empty')
+
+    budgets = np.array([result.final_budget for result in results])
+    stockout_rates = [result.rejected_count / result.total_orders
+                      if result.total_orders else 0.0
+                      for result in results]
+    bankrupt = [result.bankrupt for result in results]
+    return MonteCarloSummary(
+        runs=len(results),
+        mean_final_budget=float(budgets.mean()),
+        final_budget_percentiles={
+            p: float(np.percentile(budgets, p)) for p in percentiles},
+        stockout_rate=float(np.mean(stockout_rates)),
+        bankruptcy_probability=float(np.mean(bankrupt)))
+
+
+def _run_scenario(scenario: Scenario, seed: int) -> SimulationResult:
+    # osobne liczniki id dla każdego przebiegu, niezależnie od procesu
+    with SimulationContext(seed).activate():
+        return scenario.run(seed)
+
+
+def run_monte_carlo(scenario: Scenario,
+                    runs: int,
+                    base_seed: int = 0,
+                    max_workers: int | None = None) -> MonteCarloSummary:
+    """Uruchamia ``runs`` przebiegów scenariusza równolegle w procesach.
+
+    ``max_workers=1`` liczy wszystko w bieżącym procesie, bez puli.
+    """
+    if runs <= 0:
+        raise ValueError('Number of runs must be > 0')
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 0:
+        raise ValueError('Number of workers must be > 0')
+
+    seeds = derive_seeds(base_seed, runs)
+    if max_workers == 1:
+        results = [_run_scenario(scenario, seed) for seed in seeds]
+    else:
+        # większe paczki zadań = mniej komunikacji między procesami
+        chunksize = max(1, runs // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_scenario,
+                                        [scenario] * runs,
+                                        seeds,
+                                        chunksize=chunksize))
+    return summarize(results)
@@ -0,0 +1,204 @@
+from dataclasses import dataclass
+import numpy as np
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.demand_batch import DemandBatch
+from src.shop_ops.product import Product
+from src.shop_ops.warehouse import space_units_array, units_to_space
+
+
+@dataclass
+class SweepResult:
+    """Wyniki przeglądu polityk; każda tablica ma pierwszy wymiar = polityka."""
+    days_simulated: np.ndarray
+    bankrupt: np.ndarray
+    final_budget: np.ndarray
+    total_orders: np.ndarray
+    fulfilled_count: np.ndarray
+    rejected_count: np.ndarray
+    total_revenue: np.ndarray
+    final_stock: np.ndarray
+
+
+def record_demand(generator: CustomerOrderGenerator,
+                  products: list[Product],
+                  num_days: int) -> list[DemandBatch]:
+    """Zapisuje popyt z generate_orders jako tablice (ten sam strumień,
+    który zobaczyłaby CustomerDemandSimulation)."""
+    index_of = {product.id: i for i, product in enumerate(products)}
+    stream = []
+    for _ in range(num_days):
+        orders = generator.generate_orders(products)
+        stream.append(DemandBatch(
+            product_indices=np.array([index_of[o.product.id]
+                                      for o in orders], dtype=np.int64),
+            quantities=np.array([o.quantity for o in orders],
+                                dtype=np.int64)))
+    return stream
+
+
+class PolicySweep:
+    """Symuluje wiele polityk (s, S) naraz na tym samym strumieniu popytu.
+
+    Stan magazynu to macierz (polityki x produkty). Każdy dzień przebiega
+    jak w HeadlessSimulation z ReorderPointPolicy: dostawy, zamówienie
+    (pozycje odrzucane jak w SupplierOrderDraft.add_line, gdy brakuje
+    budżetu lub miejsca), popyt obsługiwany po kolei, test bankructwa.
+    Polityka, która zbankrutowała, przestaje się zmieniać.
+    """
+
+    def __init__(self,
+                 purchase_prices,
+                 sell_prices,
+                 spaces,
+                 initial_stock,
+                 budget: float,
+                 capacity: float,
+                 lead_time: int = 1) -> None:
+
+        self.purchase_prices = np.asarray(purchase_prices, dtype=np.float64)
+        self.sell_prices = np.asarray(sell_prices, dtype=np.float64)
+        self.spaces = np.asarray(spaces, dtype=np.float64)
+        self._space_units, self._space_scale = space_units_array(self.spaces)
+        self.initial_stock = np.asarray(initial_stock, dtype=np.int64)
+        n = len(self.purchase_prices)
+        if not (len(self.sell_prices) == len(self.spaces)
+                == len(self.initial_stock) == n):
+            raise ValueError('Product arrays must have the same length')
+
+        if lead_time < 1:
+            raise ValueError('Lead time must be >= 1')
+
+        self.budget = budget
+        self.capacity = capacity
+        self.lead_time = lead_time
+
+    @classmethod
+    def from_products(cls,
+                      products: list[Product],
+                      initial_stock,
+                      budget: float,
+                      capacity: float,
+                      lead_time: int = 1) -> 'PolicySweep':
+        return cls(purchase_prices=[p.purchase_price for p in products],
+                   sell_prices=[p.sell_price for p in products],
+                   spaces=[p.space for p in products],
+                   initial_stock=initial_stock,
+                   budget=budget,
+                   capacity=capacity,
+                   lead_time=lead_time)
+
+    def _policy_levels(self, levels, num_policies: int) -> np.ndarray:
+        array = np.asarray(levels, dtype=np.int64)
+        if array.ndim == 1:
+            array = array[:, None]
+        return np.broadcast_to(array, (num_policies,
+                                       len(self.purchase_prices)))
+
+    def run(self,
+            reorder_points,
+            order_up_to,
+            demand: list[DemandBatch]) -> SweepResult:
+        """``reorder_points``/``order_up_to``: (P,) albo (P, produkty)."""
+        num_policies = len(np.asarray(reorder_points))
+        s = self._policy_levels(reorder_points, num_policies)
+        big_s = self._policy_levels(order_up_to, num_policies)
+        if np.any(s < 0):
+            raise ValueError('Reorder point must be >= 0')
+        if np.any(big_s <= s):
+            raise ValueError('Order-up-to level must be > reorder point')
+
+        shape = (num_policies, len(self.purchase_prices))
+        stock = np.zeros(shape, dtype=np.int64)
+        for j, quantity in enumerate(self.initial_stock.tolist()):
+            if quantity > 0:
+                stock[:, j] = quantity
+
+        budget = np.full(num_policies, float(self.budget))
+        pipeline = np.zeros((self.lead_time,) + shape, dtype=np.int64)
+        active = np.ones(num_policies, dtype=bool)
+        bankrupt = np.zeros(num_policies, dtype=bool)
+        days_simulated = np.zeros(num_policies, dtype=np.int64)
+        fulfilled = np.zeros(num_policies, dtype=np.int64)
+        rejected = np.zeros(num_policies, dtype=np.int64)
+        total_revenue = np.zeros(num_policies)
+
+        for day, batch in enumerate(demand):
+            if not active.any():
+                break
+            slot = day % self.lead_time
+            self._deliver(pipeline[slot], stock, active)
+            self._place_orders(pipeline[slot], stock, budget,
+                               s, big_s, active)
+            day_revenue = self._serve_demand(batch, stock, budget,
+                                             fulfilled, rejected, active)
+            total_revenue += day_revenue
+            days_simulated += active
+
+            newly_bankrupt = active & self._is_bankrupt(stock, budget)
+            bankrupt |= newly_bankrupt
+            active &= ~newly_bankrupt
+
+        return SweepResult(days_simulated=days_simulated,
+                           bankrupt=bankrupt,
+                           final_budget=budget,
+                           total_orders=fulfilled + rejected,
+                           fulfilled_count=fulfilled,
+                           rejected_count=rejected,
+                           total_revenue=total_revenue,
+                           final_stock=stock)
+
+    def _deliver(self, arrivals, stock, active) -> None:
+        for j in np.flatnonzero(arrivals.any(axis=0)).tolist():
+            delivered = active & (arrivals[:, j] > 0)
+            stock[delivered, j] += arrivals[delivered, j]
+        arrivals[:] = 0
+
+    def _used_space(self, stock) -> np.ndarray:
+        # liczone ze stanów, dokładnie jak Warehouse.get_used_space - suma
+        # prowadzona na bieżąco gromadziłaby błędy zaokrągleń
+        units = stock.astype(object).dot(self._space_units)
+        return units_to_space(units, self._space_scale)
+
+    def _place_orders(self, pipeline_slot, stock, budget,
+                      s, big_s, active) -> None:
+        # miejsce potrzebne tylko tam, gdzie coś jest do zamówienia
+        ordering = active & (stock <= s).any(axis=1)
+        available_space = np.full(len(budget), self.capacity)
+        available_space[ordering] -= self._used_space(stock[ordering])
+        total_cost = np.zeros(len(budget))
+        total_space = np.zeros(len(budget))
+        for j in range(stock.shape[1]):
+            quantity = big_s[:, j] - stock[:, j]
+            wants = active & (stock[:, j] <= s[:, j])
+            new_cost = total_cost + self.purchase_prices[j] * quantity
+            new_space = total_space + self.spaces[j] * quantity
+            accepted = (wants
+                        & (new_space <= available_space)
+                        & (new_cost <= budget))
+            total_cost = np.where(accepted, new_cost, total_cost)
+            total_space = np.where(accepted, new_space, total_space)
+            pipeline_slot[accepted, j] = quantity[accepted]
+        budget -= total_cost
+
+    def _serve_demand(self, batch, stock, budget,
+                      fulfilled, rejected, active) -> np.ndarray:
+        day_revenue = np.zeros(len(budget))
+        for j, quantity in zip(batch.product_indices.tolist(),
+                               batch.quantities.tolist()):
+            value = self.sell_prices[j] * quantity
+            ok = active & (stock[:, j] >= quantity)
+            stock[ok, j] -= quantity
+            day_revenue[ok] += value
+            budget[ok] += value
+            fulfilled += ok
+            rejected += active & ~ok
+        return day_revenue
+
+    def _is_bankrupt(self, stock, budget) -> np.ndarray:
+        any_stock = (stock > 0).any(axis=1)
+        # bez towaru magazyn jest pusty, więc wolne jest całe miejsce
+        available_space = np.full(len(budget), self.capacity)
+        can_buy = ((budget[:, None] >= self.purchase_prices[None, :])
+                   & (available_space[:, None] >= self.spaces[None, :])
+                   ).any(axis=1)
+        return ~any_stock & ((available_space <= 0) | ~can_buy)
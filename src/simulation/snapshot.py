@@ -0,0 +1,158 @@
+import io
+import pickle
+from src.shop_ops.alias_table import AliasTable
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.backorder_book import BackorderBook
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.demand_statistics import DemandStatistics
+from src.shop_ops.feasibility_index import FeasibilityIndex
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.simulation_context import current_context
+from src.shop_ops.stock_item import StockItem
+from src.shop_ops.supplier_fulfillment_simulation import (
+    SupplierFulfillmentSimulation)
+from src.shop_ops.supplier_order import SupplierOrder, SupplierOrderStatus
+from src.shop_ops.supplier_order_line import SupplierOrderLine
+from src.shop_ops.warehouse import SpaceTotal, Warehouse
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                NoOrderPolicy,
+                                                ReorderPointPolicy,
+                                                SimulationSink)
+
+SNAPSHOT_MAGIC = b'SHOPSNAP'
+SNAPSHOT_VERSION = 1
+
+# globalne liczniki id zapisywane razem ze stanem symulacji
+# (gdy nie ma aktywnego SimulationContext)
+_ID_COUNTERS = (Product, CustomerOrder, StockItem)
+
+# klasy projektu, z których składa się stan symulacji - tylko one są
+# tworzone przy wczytywaniu (nie dowolny typ z pakietów src.*)
+_STATE_CLASSES = {
+    (cls.__module__, cls.__qualname__): cls
+    for cls in (AliasTable, ArrayWarehouse, BackorderBook,
+                CustomerDemandSimulation, CustomerOrder, CustomerOrderStatus,
+                CustomerOrderGenerator, DemandStatistics, FeasibilityIndex,
+                Product, Shop, SpaceTotal, StockItem,
+                SupplierFulfillmentSimulation, SupplierOrder,
+                SupplierOrderLine, SupplierOrderStatus, Warehouse,
+                HeadlessSimulation, NoOrderPolicy, ReorderPointPolicy,
+                SimulationSink)
+}
+# poza nimi tylko to, czego potrzebuje stan (tablice, generatory losowe
+# numpy); moduły numpy.core to nazwy z migawek zapisanych przy numpy < 2
+_ALLOWED_GLOBALS = {
+    ('array', 'array'),
+    ('array', '_array_reconstructor'),
+    ('collections', 'deque'),
+    ('random', 'Random'),
+    ('numpy', 'dtype'),
+    ('numpy', 'ndarray'),
+    ('numpy._core.multiarray', '_reconstruct'),
+    ('numpy._core.multiarray', 'scalar'),
+    ('numpy._core.numeric', '_frombuffer'),
+    ('numpy.core.multiarray', '_reconstruct'),
+    ('numpy.core.multiarray', 'scalar'),
+    ('numpy.core.numeric', '_frombuffer'),
+    ('numpy.random._pcg64', 'PCG64'),
+    ('numpy.random._pickle', '__bit_generator_ctor'),
+    ('numpy.random._pickle', '__generator_ctor'),
+    ('numpy.random.bit_generator', 'SeedSequence'),
+    ('numpy.random.bit_generator', '__pyx_unpickle_SeedSequence'),
+}
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler, który tworzy tylko obiekty z listy dozwolonych."""
+
+    def find_class(self, module: str, name: str):
+        cls = _STATE_CLASSES.get((module, name))
+        if cls is not None:
+            return cls
+
+        if (module, name) in _ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f'Global {module}.{name} is not allowed '
+                                     f'in a snapshot')
+
+
+def _get_next_ids() -> dict[str, int]:
+    context = current_context()
+    if context is not None:
+        return context.get_next_ids()
+    return {cls.__name__: cls._next_id for cls in _ID_COUNTERS}
+
+
+def _set_next_ids(next_ids: dict[str, int]) -> None:
+    context = current_context()
+    if context is not None:
+        context.set_next_ids(next_ids)
+        return
+    # globalne liczniki współdzielą wszystkie obiekty w procesie - cofnięcie
+    # ich dałoby powtórzone id, więc mogą tylko rosnąć
+    for cls in _ID_COUNTERS:
+        cls._next_id = max(cls._next_id, next_ids.get(cls.__name__, 1))
+
+
+def snapshot(simulation: HeadlessSimulation) -> bytes:
+    """Zapisuje pełny stan symulacji (bez sinka) do postaci binarnej.
+
+    Obejmuje sklep, magazyn, oczekujące zamówienia u dostawcy, stan
+    generatorów losowych i liczniki id (globalne ``_next_id`` albo
+    aktywnego SimulationContext). Id po ``restore`` są identyczne jak
+    w oryginalnym przebiegu tylko w SimulationContext; globalne liczniki
+    nie są cofane.
+    """
+    state = {
+        'simulation': simulation,
+        'next_ids': _get_next_ids(),
+    }
+    payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    return SNAPSHOT_MAGIC + bytes([SNAPSHOT_VERSION]) + payload
+
+
+def restore(data: bytes,
+            sink: SimulationSink | None = None) -> HeadlessSimulation:
+    """Odtwarza symulację z migawki; dalszy przebieg jest identyczny.
+
+    UWAGA: migawka to pickle. Wczytywane są tylko klasy stanu symulacji
+    i z krótkiej listy dozwolonych, ale nie chroni to przed
+    spreparowanymi danymi w pełni - wczytuj wyłącznie migawki z zaufanego
+    źródła.
+    """
+    header_size = len(SNAPSHOT_MAGIC) + 1
+    if (len(data) < header_size
+            or data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC):
+        raise ValueError('Data is not a simulation snapshot')
+
+    if data[len(SNAPSHOT_MAGIC)] != SNAPSHOT_VERSION:
+        raise ValueError('Unsupported snapshot version')
+
+    try:
+        state = _SnapshotUnpickler(io.BytesIO(data[header_size:])).load()
+    except (pickle.UnpicklingError, EOFError) as error:
+        raise ValueError(f'Corrupted snapshot: {error}') from None
+    if (not isinstance(state, dict)
+            or not isinstance(state.get('simulation'), HeadlessSimulation)
+            or not isinstance(state.get('next_ids'), dict)):
+        raise ValueError('Snapshot does not contain a simulation')
+    _set_next_ids(state['next_ids'])
+
+    simulation = state['simulation']
+    if sink is not None:
+        simulation.sink = sink
+    return simulation
+
+
+def save_snapshot(simulation: HeadlessSimulation, path: str) -> None:
+    with open(path, 'wb') as file:
+        file.write(snapshot(simulation))
+
+
+def load_snapshot(path: str,
+                  sink: SimulationSink | None = None) -> HeadlessSimulation:
+    with open(path, 'rb') as file:
+        return restore(file.read(), sink=sink)
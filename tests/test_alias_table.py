@@ -0,0 +1,43 @@
+import random
+import numpy as np
+import pytest
+from src.shop_ops.alias_table import AliasTable, zipf_weights
+
+
+class TestAliasTable:
+    def test_invalid_weights_raise_error(self):
+        for weights in ([], [0, 0], [1, -1], [1, float('nan')]):
+            with pytest.raises(ValueError):
+                AliasTable(weights)
+
+    def test_column_probabilities_reproduce_weights(self):
+        weights = [5, 1, 0, 2, 8, 4]
+        table = AliasTable(weights)
+        n = len(weights)
+        mass = [0.0] * n
+        for column in range(n):
+            mass[column] += table._prob[column] / n
+            mass[table._alias[column]] += (1 - table._prob[column]) / n
+        assert mass == pytest.approx([w / sum(weights) for w in weights])
+
+    def test_samples_follow_weights(self):
+        table = AliasTable([1, 0, 3])
+        rng = random.Random(1)
+        counts = [0, 0, 0]
+        for _ in range(20_000):
+            counts[table.sample(rng)] += 1
+        assert counts[1] == 0
+        assert counts[2] / counts[0] == pytest.approx(3, rel=0.1)
+
+    def test_array_samples_follow_weights(self):
+        table = AliasTable([1, 0, 3])
+        samples = table.sample_array(np.random.default_rng(1), 20_000)
+        counts = np.bincount(samples, minlength=3)
+        assert counts[1] == 0
+        assert counts[2] / counts[0] == pytest.approx(3, rel=0.1)
+
+    def test_zipf_weights(self):
+        assert zipf_weights(3, exponent=1.0) == [1.0, 0.5, 1 / 3]
+        assert zipf_weights(2, exponent=0.0) == [1.0, 1.0]
+        with pytest.raises(ValueError):
+            zipf_weights(0)
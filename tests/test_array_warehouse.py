@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from src.shop_ops.product import Product
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_order_draft import SupplierOrderDraft
+
+
+@pytest.fixture
+def product() -> Product:
+    return Product(name="Mleko",
+                   purchase_price=10,
+                   sell_price=15,
+                   space=0.1)
+
+
+@pytest.fixture
+def product_bread() -> Product:
+    return Product(name="Chleb",
+                   purchase_price=11,
+                   sell_price=14,
+                   space=0.2)
+
+
+@pytest.fixture
+def warehouse() -> ArrayWarehouse:
+    return ArrayWarehouse(capacity=100.0, initial_slots=1)
+
+
+class TestArrayWarehouse:
+    def test_empty_warehouse_returns_zero_quantity(self, product, warehouse):
+        assert warehouse.get_quantity(product) == 0
+
+    def test_add_and_remove_stock(self, product, warehouse):
+        warehouse.add_stock(product, 5)
+        warehouse.add_stock(product, 3)
+        warehouse.remove_stock(product, 2)
+        assert warehouse.get_quantity(product) == 6
+        assert warehouse.get_used_space() == pytest.approx(0.6)
+        assert warehouse.get_available_space() == pytest.approx(99.4)
+
+    def test_used_space_does_not_drift(self, product):
+        warehouse = ArrayWarehouse(capacity=1.0)
+        warehouse.add_stock(product, 5)
+        warehouse.add_stock(product, 7)
+        warehouse.remove_stock(product, 7)
+        warehouse.apply_deltas([product.id], [-5])
+
+        assert warehouse.get_used_space() == 0.0
+        SupplierOrderDraft().add_line(Shop(warehouse=warehouse), product, 10)
+
+    def test_invalid_quantities_raise_error(self, product, warehouse):
+        with pytest.raises(ValueError):
+            warehouse.add_stock(product, 0)
+        with pytest.raises(ValueError):
+            warehouse.remove_stock(product, -1)
+
+    def test_remove_unknown_product_raises_error(self, product, warehouse):
+        with pytest.raises(ValueError):
+            warehouse.remove_stock(product, 1)
+
+    def test_remove_more_than_available_raises_error(self, product, warehouse):
+        warehouse.add_stock(product, 3)
+        with pytest.raises(ValueError):
+            warehouse.remove_stock(product, 5)
+        assert warehouse.get_quantity(product) == 3
+
+    def test_slots_grow_past_initial_size(self, product, product_bread,
+                                          warehouse):
+        warehouse.add_stock(product, 1)
+        warehouse.add_stock(product_bread, 2)
+        assert len(warehouse) == 2
+        assert warehouse.get_quantity(product) == 1
+        assert warehouse.get_quantity(product_bread) == 2
+
+    def test_get_quantities_for_array_of_ids(self, product, product_bread,
+                                             warehouse):
+        warehouse.add_stock(product, 4)
+        warehouse.add_stock(product_bread, 7)
+        ids = np.array([product_bread.id, 10_000, product.id])
+        assert warehouse.get_quantities(ids).tolist() == [7, 0, 4]
+
+    def test_apply_deltas_sums_repeated_ids(self, product, product_bread,
+                                            warehouse):
+        warehouse.add_stock(product, 10)
+        warehouse.register_product(product_bread)
+        warehouse.apply_deltas([product.id, product_bread.id, product.id],
+                               [-3, 5, -2])
+        assert warehouse.get_quantity(product) == 5
+        assert warehouse.get_quantity(product_bread) == 5
+        assert warehouse.get_used_space() == pytest.approx(1.5)
+
+    def test_apply_deltas_is_all_or_nothing(self, product, product_bread,
+                                            warehouse):
+        warehouse.add_stock(product, 2)
+        warehouse.add_stock(product_bread, 2)
+        with pytest.raises(ValueError):
+            warehouse.apply_deltas([product.id, product_bread.id], [1, -3])
+        assert warehouse.get_quantity(product) == 2
+        assert warehouse.get_quantity(product_bread) == 2
+
+    def test_apply_deltas_unknown_product_raises_error(self, product,
+                                                       warehouse):
+        with pytest.raises(ValueError):
+            warehouse.apply_deltas([product.id], [1])
+
+    def test_register_columns_without_product_objects(self, warehouse):
+        warehouse.register_columns([50_001, 50_002],
+                                   [1.0, 2.0],
+                                   [2.0, 3.0],
+                                   [0.5, 1.0])
+        warehouse.apply_deltas([50_001, 50_002], [4, 1])
+        assert warehouse.get_quantities([50_001, 50_002]).tolist() == [4, 1]
+        assert warehouse.get_used_space() == pytest.approx(3.0)
+
+    def test_stocked_count_follows_all_updates(self, product, product_bread,
+                                               warehouse):
+        warehouse.add_stock(product, 2)
+        warehouse.add_stock(product_bread, 1)
+        assert warehouse.get_stocked_count() == 2
+        warehouse.apply_deltas([product.id, product_bread.id, product.id],
+                               [-1, -1, -1])
+        assert warehouse.get_stocked_count() == 0
+        warehouse.apply_deltas([product_bread.id], [3])
+        assert warehouse.get_stocked_count() == 1
+        warehouse.remove_stock(product_bread, 3)
+        assert warehouse.get_stocked_count() == 0
@@ -0,0 +1,173 @@
+import pytest
+from src.shop_ops.backorder_book import BackorderBook
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_order import SupplierOrder
+from src.shop_ops.supplier_order_line import SupplierOrderLine
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy,
+                                                SimulationSink)
+
+
+@pytest.fixture
+def product() -> Product:
+    return Product(name="Mleko", purchase_price=10, sell_price=15,
+                   space=0.1)
+
+
+@pytest.fixture
+def shop() -> Shop:
+    return Shop(Warehouse(capacity=100.0), budget=0,
+                backorders=BackorderBook())
+
+
+class FakeOrderGenerator:
+    def __init__(self, days):
+        self._days = list(days)
+
+    def generate_orders(self, products):
+        return self._days.pop(0)
+
+
+class TestBackorderBook:
+    def test_queue_length_quantity_and_age(self, product):
+        book = BackorderBook()
+        book.add(CustomerOrder(product, 3), day=2)
+        book.add(CustomerOrder(product, 4), day=5)
+
+        assert len(book) == 2
+        assert book.queue_length(product) == 2
+        assert book.waiting_quantity(product) == 7
+        assert book.oldest_age(product, current_day=6) == 4
+        assert book.max_age(current_day=6) == 4
+
+    def test_empty_book(self, product):
+        book = BackorderBook()
+        assert not book.has_waiting(product)
+        assert book.oldest_age(product, current_day=3) == 0
+        assert book.max_age(current_day=3) == 0
+
+    def test_drain_keeps_fifo_order(self, product, shop):
+        orders = [CustomerOrder(product, q) for q in (4, 6, 1)]
+        for order in orders:
+            shop.backorders.add(order, day=1)
+        shop.warehouse.add_stock(product, 9)
+
+        drained = shop.backorders.drain(shop, [product, product])
+
+        # trzecie zamówienie czeka za drugim, choć samo by się zmieściło
+        assert drained == [orders[0]]
+        assert shop.warehouse.get_quantity(product) == 5
+        assert shop.backorders.waiting_quantity(product) == 7
+
+        shop.warehouse.add_stock(product, 2)
+        assert shop.backorders.drain(shop, [product]) == orders[1:]
+        assert len(shop.backorders) == 0
+        assert not shop.backorders.has_waiting(product)
+        assert shop.budget == 11 * 15
+
+    def test_day_without_stock_backorders_orders(self, product, shop):
+        simulation = CustomerDemandSimulation(FakeOrderGenerator(
+            [[CustomerOrder(product, 2), CustomerOrder(product, 1)]]))
+
+        result = simulation.run_day(shop=shop, products=[product])
+
+        assert result.fulfilled_count == 0
+        assert result.rejected_count == 0
+        assert result.backordered_count == 2
+        assert all(order.status == CustomerOrderStatus.BACKORDERED
+                   for order in result.orders)
+        assert shop.backorders.oldest_age(product, shop.day_number) == 1
+
+    def test_new_orders_wait_behind_existing_queue(self, product, shop):
+        shop.warehouse.add_stock(product, 3)
+        simulation = CustomerDemandSimulation(FakeOrderGenerator(
+            [[CustomerOrder(product, 5), CustomerOrder(product, 1)]]))
+
+        result = simulation.run_day(shop=shop, products=[product])
+
+        assert result.backordered_count == 2
+        assert shop.warehouse.get_quantity(product) == 3
+
+    def test_delivery_fulfills_waiting_orders(self, product, shop):
+        simulation = CustomerDemandSimulation(FakeOrderGenerator(
+            [[CustomerOrder(product, 2)], []]))
+        simulation.run_day(shop=shop, products=[product])
+
+        drained = SupplierOrder([SupplierOrderLine(product, 5)],
+                                delivery_day=2).deliver(shop)
+        result = simulation.run_day(shop=shop, products=[product])
+
+        assert len(drained) == 1
+        assert result.day_revenue == 30
+        assert shop.warehouse.get_quantity(product) == 3
+
+    def test_summary_counts_backorders(self, product, shop):
+        simulation = CustomerDemandSimulation(FakeOrderGenerator(
+            [[CustomerOrder(product, 2)]]))
+
+        summary = simulation.run_day(shop=shop, products=[product],
+                                     summary_only=True)
+
+        assert summary.backordered_count == 1
+        assert summary.fulfilled_quantities.tolist() == [0]
+
+    def test_batched_fulfillment_rejects_backorder_mode(self, product, shop):
+        simulation = CustomerDemandSimulation(
+            FakeOrderGenerator([[CustomerOrder(product, 1)]]), batched=True)
+
+        with pytest.raises(ValueError):
+            simulation.run_day(shop=shop, products=[product])
+        assert shop.day_number == 1
+
+    def test_summary_does_not_count_backorders_as_rejected(self, product,
+                                                           shop):
+        simulation = CustomerDemandSimulation(FakeOrderGenerator(
+            [[CustomerOrder(product, 2)]]))
+
+        summary = simulation.run_day(shop=shop, products=[product],
+                                     summary_only=True)
+
+        assert summary.rejected_quantities.tolist() == [0]
+
+
+class FilledBackorderSink(SimulationSink):
+    def __init__(self):
+        self.filled = []
+        self.filled_per_day = 0
+
+    def backorders_filled(self, orders):
+        self.filled.extend(orders)
+
+    def day_finished(self, day_result, shop, products):
+        self.filled_per_day += day_result.backorders_filled_count
+
+
+class TestHeadlessSimulationWithBackorders:
+    def test_every_order_is_accounted_for(self):
+        products = create_default_products()
+        shop = create_shop_with_initial_stock(products)
+        shop.backorders = BackorderBook()
+        sink = FilledBackorderSink()
+        simulation = HeadlessSimulation(
+            shop=shop,
+            products=products,
+            customer_simulation=CustomerDemandSimulation(
+                create_order_generator()),
+            policy=ReorderPointPolicy(5, 40),
+            sink=sink)
+
+        result = simulation.run(num_days=30)
+
+        assert sink.filled
+        assert all(order.status == CustomerOrderStatus.FULFILLED
+                   for order in sink.filled)
+        assert sink.filled_per_day == len(sink.filled)
+        assert (result.fulfilled_count + result.rejected_count
+                + len(shop.backorders)) == result.total_orders
@@ -0,0 +1,36 @@
+from benchmarks.hot_paths import find_regressions, run_suite
+
+
+def make_report(ns_per_op):
+    return {'results': [{'name': 'warehouse.add_stock',
+                         'catalog_size': 10,
+                         'orders_per_day': None,
+                         'ns_per_op': ns_per_op}]}
+
+
+class TestHotPathBenchmarks:
+    def test_suite_reports_every_benchmark(self):
+        report = run_suite(sizes=[5], orders=[3], repeat=1)
+
+        names = {result['name'] for result in report['results']}
+        assert names == {'warehouse.add_stock',
+                         'warehouse.remove_stock',
+                         'warehouse.get_quantity',
+                         'warehouse.get_used_space',
+                         'bankruptcy.is_shop_bankrupt',
+                         'generator.generate_orders',
+                         'demand.run_day',
+                         'draft.add_line',
+                         'fulfillment.run_for_day'}
+        assert all(result['ns_per_op'] > 0 for result in report['results'])
+
+    def test_find_regressions_uses_tolerance(self):
+        baseline = make_report(100.0)
+
+        assert find_regressions(make_report(120.0), baseline, 0.25) == []
+        regressions = find_regressions(make_report(130.0), baseline, 0.25)
+        assert len(regressions) == 1
+        assert regressions[0]['ratio'] == 1.3
+
+    def test_results_missing_from_baseline_are_ignored(self):
+        assert find_regressions(make_report(100.0), {'results': []}) == []
@@ -0,0 +1,136 @@
+import pytest
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.catalog import (Catalog, load_catalog, read_parquet_catalog,
+                                  save_catalog)
+from src.shop_ops.simulation_context import SimulationContext
+
+CSV = ("name,purchase_price,sell_price,space\n"
+       "Mleko,10,15,0.1\n"
+       "Chleb,11,14,0.2\n"
+       "Masło,12,13,0.3\n")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return str(path)
+
+
+class TestCatalog:
+    def test_csv_is_loaded_into_columns(self, csv_path):
+        catalog = load_catalog(csv_path)
+
+        assert len(catalog) == 3
+        assert catalog.purchase_prices.tolist() == [10.0, 11.0, 12.0]
+        assert catalog.sell_prices.tolist() == [15.0, 14.0, 13.0]
+        assert catalog.spaces.tolist() == [0.1, 0.2, 0.3]
+        assert catalog.name(2) == "Masło"
+
+    def test_products_are_created_lazily_and_cached(self, csv_path):
+        catalog = load_catalog(csv_path)
+        assert catalog.materialized_count() == 0
+
+        bread = catalog.products[1]
+        assert catalog.materialized_count() == 1
+        assert bread is catalog.product(1)
+        assert bread.name == "Chleb"
+        assert bread.margin() == 3.0
+        assert catalog.index_of(bread) == 1
+        assert catalog.products[-1].name == "Masło"
+
+    def test_ids_are_reserved_as_contiguous_range(self, csv_path):
+        with SimulationContext().activate():
+            catalog = load_catalog(csv_path)
+            assert catalog.ids.tolist() == [1, 2, 3]
+            assert catalog.product(2).id == 3
+            assert load_catalog(csv_path).ids.tolist() == [4, 5, 6]
+
+    def test_columns_may_come_in_any_order(self, tmp_path):
+        path = tmp_path / "catalog.csv"
+        path.write_text("space,name,sell_price,extra,purchase_price\r\n"
+                        "0.5,Ser,30,x,20\r\n")
+        catalog = load_catalog(str(path))
+        product = catalog.product(0)
+        assert (product.name, product.purchase_price, product.sell_price,
+                product.space) == ("Ser", 20.0, 30.0, 0.5)
+
+    def test_quoted_names_are_supported(self, tmp_path):
+        path = tmp_path / "catalog.csv"
+        path.write_text('name,purchase_price,sell_price,space\n'
+                        '"Ser, żółty",20,30,0.5\n', encoding="utf-8")
+        assert load_catalog(str(path)).name(0) == "Ser, żółty"
+
+    def test_invalid_files_raise_error(self, tmp_path):
+        missing = tmp_path / "missing.csv"
+        missing.write_text("name,purchase_price,space\nA,1,1\n")
+        broken = tmp_path / "broken.csv"
+        broken.write_text("name,purchase_price,sell_price,space\nA,1,x,1\n")
+        short = tmp_path / "short.csv"
+        short.write_text("name,purchase_price,sell_price,space\nA,1,2\n")
+        for path in (missing, broken, short):
+            with pytest.raises(ValueError):
+                load_catalog(str(path))
+        with pytest.raises(ValueError):
+            load_catalog(str(tmp_path / "catalog.json"))
+
+    @pytest.mark.parametrize("quote", ["", '"'])
+    def test_ragged_rows_raise_error_on_both_paths(self, tmp_path, quote):
+        path = tmp_path / "ragged.csv"
+        path.write_text("name,purchase_price,sell_price,space\n"
+                        f"{quote}A{quote},1,2,3,4\n"
+                        "5,6,7\n")
+        with pytest.raises(ValueError, match="Malformed"):
+            load_catalog(str(path))
+
+    @pytest.mark.parametrize("quote", ["", '"'])
+    def test_blank_lines_are_skipped_on_both_paths(self, tmp_path, quote):
+        path = tmp_path / "blank.csv"
+        path.write_text("name,purchase_price,sell_price,space\n"
+                        f"{quote}A{quote},1,2,0.1\n"
+                        "\n"
+                        "B,3,4,0.2\n"
+                        "\n")
+        catalog = load_catalog(str(path))
+        assert [catalog.name(i) for i in range(len(catalog))] == ["A", "B"]
+        assert catalog.sell_prices.tolist() == [2.0, 4.0]
+
+    def test_saved_catalog_is_memory_mapped(self, csv_path, tmp_path):
+        directory = str(tmp_path / "catalog")
+        save_catalog(load_catalog(csv_path), directory)
+
+        catalog = load_catalog(directory)
+
+        assert catalog.spaces.base is not None
+        assert [catalog.name(i) for i in range(3)] == ["Mleko", "Chleb",
+                                                       "Masło"]
+        assert catalog.sell_prices.tolist() == [15.0, 14.0, 13.0]
+
+    def test_register_in_array_warehouse(self, csv_path):
+        catalog = load_catalog(csv_path)
+        warehouse = ArrayWarehouse(capacity=100.0)
+
+        catalog.register_in(warehouse)
+        warehouse.apply_deltas(catalog.ids, [1, 2, 3])
+
+        assert len(warehouse) == 3
+        assert catalog.materialized_count() == 0
+        assert warehouse.get_quantity(catalog.product(1)) == 2
+        assert warehouse.get_used_space() == pytest.approx(1.4)
+
+    def test_columns_must_have_equal_length(self):
+        with pytest.raises(ValueError):
+            Catalog(["A"], [1.0, 2.0], [2.0], [1.0])
+
+    def test_parquet_round_trip(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "catalog.parquet")
+        pq.write_table(pa.table({"name": ["Mleko"],
+                                 "purchase_price": [10.0],
+                                 "sell_price": [15.0],
+                                 "space": [0.1]}), path)
+
+        catalog = read_parquet_catalog(path)
+
+        assert catalog.product(0).sell_price == 15.0
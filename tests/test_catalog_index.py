@@ -0,0 +1,117 @@
+import random
+import pytest
+from src.shop_ops.catalog import Catalog, load_catalog, save_catalog
+from src.shop_ops.catalog_index import SORT_KEYS, CatalogIndex
+from src.shop_ops.product import Product
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [Product(name="Mleko", purchase_price=10, sell_price=15,
+                    space=0.1),
+            Product(name="Chleb", purchase_price=11, sell_price=14,
+                    space=0.2),
+            Product(name="Masło", purchase_price=12, sell_price=13,
+                    space=0.3),
+            Product(name="Ser", purchase_price=20, sell_price=30,
+                    space=0.5)]
+
+
+@pytest.fixture
+def index(products) -> CatalogIndex:
+    return CatalogIndex.from_products(products)
+
+
+class TestCatalogIndex:
+    def test_lookup_by_id(self, products, index):
+        assert index.get_by_id(products[2].id) is products[2]
+        assert index.position_of(products[3].id) == 3
+        with pytest.raises(ValueError):
+            index.get_by_id(-5)
+
+    def test_lookup_by_name(self, products, index):
+        assert index.find_by_name("Chleb") == [products[1]]
+        assert index.find_by_name("Kawa") == []
+
+    def test_repeated_names_return_all_products(self, products):
+        again = Product(name="Mleko", purchase_price=9, sell_price=16,
+                        space=0.1)
+        index = CatalogIndex.from_products(products + [again])
+        assert index.find_by_name("Mleko") == [products[0], again]
+
+    def test_range_is_sorted_by_key(self, products, index):
+        assert index.range("margin", low=2) == [products[1], products[0],
+                                                products[3]]
+        assert index.range("space", high=0.2) == [products[0], products[1]]
+        assert index.range("sell_price", 14, 15) == [products[1],
+                                                     products[0]]
+
+    def test_query_combines_ranges(self, products, index):
+        assert index.query(margin=(3, None), space=(None, 0.3)) == [
+            products[0], products[1]]
+        assert index.query(margin_percentage=(0.4, None)) == [products[0],
+                                                              products[3]]
+        assert index.query() == products
+
+    def test_unknown_key_raises_error(self, index):
+        with pytest.raises(ValueError):
+            index.range("name", low=1)
+
+    def test_duplicate_ids_raise_error(self, products):
+        with pytest.raises(ValueError):
+            CatalogIndex.from_products(products + [products[0]])
+
+    def test_query_matches_linear_scan(self):
+        rng = random.Random(11)
+        products = [Product(name=f"P{i}",
+                            purchase_price=rng.randint(1, 30),
+                            sell_price=rng.randint(1, 40),
+                            space=rng.choice([0.1, 0.25, 0.5, 1.0]))
+                    for i in range(300)]
+        index = CatalogIndex.from_products(products)
+        for _ in range(50):
+            bounds = {key: (rng.choice([None, rng.uniform(-5, 20)]),
+                            rng.choice([None, rng.uniform(0, 40)]))
+                      for key in rng.sample(SORT_KEYS, 2)}
+
+            def matches(product):
+                for key, (low, high) in bounds.items():
+                    value = getattr(product, key)
+                    value = value() if callable(value) else value
+                    if low is not None and value < low:
+                        return False
+                    if high is not None and value > high:
+                        return False
+                return True
+
+            assert index.query(**bounds) == [p for p in products
+                                             if matches(p)]
+
+    def test_catalog_index_creates_only_returned_products(self):
+        catalog = Catalog(names=[b"A", b"B", b"C"],
+                          purchase_prices=[1.0, 2.0, 3.0],
+                          sell_prices=[2.0, 2.5, 9.0],
+                          spaces=[1.0, 1.0, 0.5])
+        index = CatalogIndex.from_catalog(catalog)
+
+        found = index.query(margin=(1.0, None), space=(None, 0.5))
+
+        assert [p.name for p in found] == ["C"]
+        assert catalog.materialized_count() == 1
+        assert index.find_by_name("B")[0].id == catalog.ids[1]
+
+    def test_names_of_saved_catalog_are_decoded(self, tmp_path):
+        names = ["Mleko", "Masło", "Żółty ser", "Masło", "", "Chleb"]
+        directory = str(tmp_path / "catalog")
+        save_catalog(Catalog(names=names,
+                             purchase_prices=[1.0] * 6,
+                             sell_prices=[2.0] * 6,
+                             spaces=[0.5] * 6), directory)
+        catalog = load_catalog(directory)
+        index = CatalogIndex.from_catalog(catalog)
+
+        assert catalog.names() == names
+        assert [p.id for p in index.find_by_name("Masło")] == [
+            catalog.ids[1], catalog.ids[3]]
+        assert index.find_by_name("Chleb")[0].id == catalog.ids[5]
+        assert catalog.materialized_count() == 3
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from src.shop_ops.product import Product
 from src.shop_ops.customer_order_generator import CustomerOrderGenerator
@@ -166,3 +167,159 @@ class TestCustomerOrderGenerator:
             assert o1.product == o2.product
             assert o1.quantity == o2.quantity
             assert o1.status == o2.status
+
+    def test_order_batch_respects_limits(self):
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=3,
+            max_orders_per_day=5,
+            min_quantity_per_order=2,
+            max_quantity_per_order=4,
+            seed=123
+        )
+
+        batch = generator.generate_order_batch(num_products=3)
+
+        assert 3 <= len(batch) <= 5
+        assert len(batch.quantities) == len(batch.product_indices)
+        assert ((batch.product_indices >= 0) &
+                (batch.product_indices < 3)).all()
+        assert ((batch.quantities >= 2) & (batch.quantities <= 4)).all()
+
+    def test_order_batch_is_deterministic_for_same_seed(self):
+        batches = []
+        for _ in range(2):
+            generator = CustomerOrderGenerator(
+                min_orders_per_day=3,
+                max_orders_per_day=5,
+                min_quantity_per_order=1,
+                max_quantity_per_order=10,
+                seed=7
+            )
+            batches.append([generator.generate_order_batch(100)
+                            for _ in range(3)])
+
+        for b1, b2 in zip(*batches):
+            assert b1.product_indices.tolist() == b2.product_indices.tolist()
+            assert b1.quantities.tolist() == b2.quantities.tolist()
+
+    def test_order_batch_builds_orders_on_request(self):
+        products = create_products()
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=3,
+            max_orders_per_day=5,
+            min_quantity_per_order=1,
+            max_quantity_per_order=10,
+            seed=123
+        )
+
+        batch = generator.generate_order_batch(len(products))
+        orders = batch.to_orders(products)
+
+        assert len(orders) == len(batch)
+        for order, index, quantity in zip(orders, batch.product_indices,
+                                          batch.quantities):
+            assert order.product == products[index]
+            assert order.quantity == quantity
+            assert order.status == CustomerOrderStatus.PENDING
+
+    def test_order_arrays_match_generated_orders(self):
+        products = create_products()
+        generators = [CustomerOrderGenerator(min_orders_per_day=3,
+                                             max_orders_per_day=8,
+                                             min_quantity_per_order=1,
+                                             max_quantity_per_order=10,
+                                             seed=11,
+                                             zipf_exponent=zipf)
+                      for zipf in (None, None, 1.2, 1.2)]
+
+        for objects, arrays in (generators[:2], generators[2:]):
+            for _ in range(5):
+                orders = objects.generate_orders(products)
+                demand = arrays.generate_order_arrays(len(products))
+                assert demand.product_indices.tolist() == \
+                    [products.index(order.product) for order in orders]
+                assert demand.quantities.tolist() == \
+                    [order.quantity for order in orders]
+
+    def test_order_batch_requires_products(self):
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=1,
+            max_orders_per_day=5,
+            min_quantity_per_order=1,
+            max_quantity_per_order=5,
+            seed=123
+        )
+
+        with pytest.raises(ValueError):
+            generator.generate_order_batch(0)
+
+    def test_zero_weight_products_are_never_ordered(self):
+        products = create_products()
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=20,
+            max_orders_per_day=30,
+            min_quantity_per_order=1,
+            max_quantity_per_order=5,
+            seed=123,
+            weights=[0, 1, 3]
+        )
+
+        orders = generator.generate_orders(products)
+        batch = generator.generate_order_batch(len(products))
+
+        assert products[0] not in {order.product for order in orders}
+        assert 0 not in batch.product_indices.tolist()
+
+    def test_weights_must_match_products(self):
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=1,
+            max_orders_per_day=5,
+            min_quantity_per_order=1,
+            max_quantity_per_order=5,
+            seed=123,
+            weights=[1, 2]
+        )
+
+        with pytest.raises(ValueError):
+            generator.generate_orders(create_products())
+
+    def test_weights_and_zipf_are_exclusive(self):
+        with pytest.raises(ValueError):
+            CustomerOrderGenerator(min_orders_per_day=1,
+                                   max_orders_per_day=5,
+                                   min_quantity_per_order=1,
+                                   max_quantity_per_order=5,
+                                   weights=[1, 2, 3],
+                                   zipf_exponent=1.0)
+
+    def test_zipf_favours_first_products(self):
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=2000,
+            max_orders_per_day=2001,
+            min_quantity_per_order=1,
+            max_quantity_per_order=1,
+            seed=5,
+            zipf_exponent=1.0
+        )
+
+        batch = generator.generate_order_batch(num_products=100)
+        counts = np.bincount(batch.product_indices, minlength=100)
+
+        # produkt 1 ma wagę 1, produkt 10 - 0.1 (z sumy ~5.19)
+        assert counts[0] > 5 * counts[9]
+        assert counts[0] / len(batch) == pytest.approx(1 / 5.187, abs=0.03)
+
+    def test_alias_table_is_rebuilt_only_when_weights_change(self):
+        generator = CustomerOrderGenerator(
+            min_orders_per_day=1,
+            max_orders_per_day=5,
+            min_quantity_per_order=1,
+            max_quantity_per_order=5,
+            weights=[1, 2, 3]
+        )
+        table = generator._alias_table
+
+        generator.set_weights([1, 2, 3])
+        assert generator._alias_table is table
+        generator.set_weights([3, 2, 1])
+        assert generator._alias_table is not table
@@ -63,3 +63,6 @@ class TestCustomerOrder:
     def test_new_order_has_pending_status(self, product):
         order = CustomerOrder(product, 5)
         assert order.status == CustomerOrderStatus.PENDING
+
+    def test_order_has_no_instance_dict(self, customer_order):
+        assert not hasattr(customer_order, "__dict__")
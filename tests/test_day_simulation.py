@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
+from src.shop_ops.array_warehouse import ArrayWarehouse
 from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
 from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.demand_batch import DemandBatch
+from src.shop_ops.demand_statistics import DemandStatistics
 from src.shop_ops.warehouse import Warehouse
 from src.shop_ops.product import Product
 from src.shop_ops.shop import Shop
@@ -34,6 +38,16 @@ class FakeOrderGenerator:
         return list(self._orders)
 
 
+class FakeDemandGenerator:
+    def __init__(self, product_indices, quantities):
+        self._demand = DemandBatch(
+            product_indices=np.array(product_indices, dtype=np.int64),
+            quantities=np.array(quantities, dtype=np.int64))
+
+    def generate_order_arrays(self, num_products):
+        return self._demand
+
+
 class TestDaySimulation:
     def test_all_orders_may_be_delivered(self, product, warehouse, shop):
         # Arrange
@@ -191,3 +205,91 @@ class TestDaySimulation:
         # DayResult – budżety
         assert result.starting_budget == starting_budget
         assert result.ending_budget == starting_budget
+
+    def test_summary_only_returns_per_product_aggregates(
+        self, product, warehouse, shop
+    ):
+        other = Product(name="Chleb", purchase_price=11, sell_price=14,
+                        space=0.2)
+        warehouse.add_stock(product=product, quantity=10)
+        simulation = CustomerDemandSimulation(
+            FakeDemandGenerator([0, 1, 0, 0], [5, 2, 7, 4]))
+        next_order_id = CustomerOrder._next_id
+
+        summary = simulation.run_day(shop=shop, products=[product, other],
+                                     summary_only=True)
+
+        assert not hasattr(summary, "orders")
+        assert summary.fulfilled_count == 2
+        assert summary.rejected_count == 2
+        assert summary.requested_quantities.tolist() == [16, 2]
+        assert summary.fulfilled_quantities.tolist() == [9, 0]
+        assert summary.rejected_quantities.tolist() == [7, 2]
+        assert summary.revenue_by_product.tolist() == [135.0, 0.0]
+        assert summary.day_revenue == 135
+        assert summary.ending_budget == summary.starting_budget + 135
+        assert warehouse.get_quantity(product) == 1
+        assert CustomerOrder._next_id == next_order_id
+
+    def test_summary_only_rejects_unknown_product(self, product, shop):
+        simulation = CustomerDemandSimulation(FakeDemandGenerator([1], [1]))
+
+        with pytest.raises(ValueError):
+            simulation.run_day(shop=shop, products=[product],
+                               summary_only=True)
+        assert shop.day_number == 1
+
+    def test_run_day_feeds_demand_statistics(self, product, warehouse, shop):
+        other = Product(name="Chleb", purchase_price=11, sell_price=14,
+                        space=0.2)
+        warehouse.add_stock(product=product, quantity=3)
+        statistics = DemandStatistics(num_products=2)
+        simulation = CustomerDemandSimulation(
+            FakeOrderGenerator([CustomerOrder(product, 5),
+                                CustomerOrder(other, 2),
+                                CustomerOrder(product, 1)]),
+            statistics=statistics)
+
+        simulation.run_day(shop=shop, products=[product, other])
+
+        # liczy się popyt zgłoszony, także odrzucony
+        assert statistics.days_observed == 1
+        assert statistics.mean().tolist() == [6.0, 2.0]
+
+    @pytest.mark.parametrize("summary_only", [False, True])
+    def test_statistics_size_is_checked_before_fulfillment(
+        self, product, warehouse, shop, summary_only
+    ):
+        warehouse.add_stock(product=product, quantity=10)
+        statistics = DemandStatistics(num_products=2)
+        simulation = CustomerDemandSimulation(
+            FakeOrderGenerator([CustomerOrder(product, 4)]),
+            statistics=statistics)
+
+        with pytest.raises(ValueError):
+            simulation.run_day(shop=shop, products=[product],
+                               summary_only=summary_only)
+
+        assert warehouse.get_quantity(product) == 10
+        assert shop.get_today_revenue() == 0
+        assert shop.day_number == 1
+        assert statistics.days_observed == 0
+
+    def test_summary_only_with_unstocked_product_on_array_warehouse(
+        self, product
+    ):
+        other = Product(name="Chleb", purchase_price=11, sell_price=14,
+                        space=0.2)
+        warehouse = ArrayWarehouse(capacity=100.0)
+        warehouse.add_stock(product=product, quantity=10)
+        shop = Shop(warehouse=warehouse)
+        simulation = CustomerDemandSimulation(
+            FakeDemandGenerator([0, 1, 0], [4, 2, 3]))
+
+        summary = simulation.run_day(shop=shop, products=[product, other],
+                                     summary_only=True)
+
+        assert summary.fulfilled_count == 2
+        assert summary.rejected_quantities.tolist() == [0, 2]
+        assert warehouse.get_quantity(product) == 3
+        assert warehouse.get_quantity(other) == 0
@@ -0,0 +1,95 @@
+import random
+import numpy as np
+import pytest
+from src.shop_ops.array_warehouse import ArrayWarehouse
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.demand_fulfillment import allocate_first_come_first_served
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.warehouse import Warehouse
+
+
+def sequential_allocation(slots, quantities, stock):
+    remaining = list(stock)
+    accepted = []
+    for slot, quantity in zip(slots, quantities):
+        if remaining[slot] >= quantity:
+            remaining[slot] -= quantity
+            accepted.append(True)
+        else:
+            accepted.append(False)
+    return accepted
+
+
+class FakeOrderGenerator:
+    def __init__(self, orders_to_return):
+        self._orders = orders_to_return
+
+    def generate_orders(self, products):
+        return list(self._orders)
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [Product(name="Mleko", purchase_price=10, sell_price=15.1,
+                    space=0.1),
+            Product(name="Chleb", purchase_price=11, sell_price=14.3,
+                    space=0.2),
+            Product(name="Masło", purchase_price=12, sell_price=13.7,
+                    space=0.3)]
+
+
+class TestAllocateFirstComeFirstServed:
+    def test_smaller_order_after_rejection_is_accepted(self):
+        accepted = allocate_first_come_first_served(
+            np.array([0, 0, 0]), np.array([8, 5, 2]), np.array([10]))
+        assert accepted.tolist() == [True, False, True]
+
+    def test_matches_sequential_loop_on_random_input(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            n_products = rng.randint(1, 5)
+            n_orders = rng.randint(0, 40)
+            slots = [rng.randrange(n_products) for _ in range(n_orders)]
+            quantities = [rng.randint(1, 9) for _ in range(n_orders)]
+            stock = [rng.randint(0, 40) for _ in range(n_products)]
+
+            accepted = allocate_first_come_first_served(
+                np.array(slots, dtype=np.int64),
+                np.array(quantities, dtype=np.int64),
+                np.array(stock, dtype=np.int64))
+
+            assert accepted.tolist() == sequential_allocation(
+                slots, quantities, stock)
+
+
+class TestBatchedDaySimulation:
+    @pytest.mark.parametrize("warehouse_class", [Warehouse, ArrayWarehouse])
+    @pytest.mark.parametrize("unstocked", [0, 1])
+    def test_batched_run_day_matches_sequential(self, products,
+                                                warehouse_class, unstocked):
+        rng = random.Random(11)
+        plan = [(rng.randrange(len(products)), rng.randint(1, 6))
+                for _ in range(60)]
+        results = []
+        for batched in (False, True):
+            warehouse = warehouse_class(capacity=100.0)
+            # ostatnie `unstocked` produktów nigdy nie trafia do magazynu
+            for product in products[:len(products) - unstocked]:
+                warehouse.add_stock(product, 40)
+            shop = Shop(warehouse=warehouse, budget=300.3)
+            orders = [CustomerOrder(products[i], q) for i, q in plan]
+            simulation = CustomerDemandSimulation(FakeOrderGenerator(orders),
+                                                  batched=batched)
+
+            result = simulation.run_day(shop=shop, products=products)
+
+            results.append((result.fulfilled_count,
+                            result.rejected_count,
+                            result.day_revenue,
+                            result.ending_budget,
+                            [o.status for o in orders],
+                            [warehouse.get_quantity(p) for p in products]))
+
+        assert results[0] == results[1]
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from src.shop_ops.demand_statistics import DemandStatistics
+
+
+@pytest.fixture
+def history() -> np.ndarray:
+    rng = np.random.default_rng(3)
+    return rng.integers(0, 40, size=(30, 4))
+
+
+def feed(statistics, history):
+    for day in history:
+        statistics.observe(day)
+    return statistics
+
+
+class TestDemandStatistics:
+    def test_invalid_parameters_raise_error(self):
+        with pytest.raises(ValueError):
+            DemandStatistics(num_products=0)
+        with pytest.raises(ValueError):
+            DemandStatistics(num_products=2, window=0)
+        with pytest.raises(ValueError):
+            DemandStatistics(num_products=2, alpha=0)
+
+    def test_observation_must_cover_all_products(self):
+        statistics = DemandStatistics(num_products=2)
+        with pytest.raises(ValueError):
+            statistics.observe([1, 2, 3])
+        with pytest.raises(ValueError):
+            statistics.observe([1, -2])
+
+    def test_running_moments_match_full_history(self, history):
+        statistics = feed(DemandStatistics(num_products=4), history)
+
+        assert statistics.mean() == pytest.approx(history.mean(axis=0))
+        assert statistics.variance() == pytest.approx(
+            history.var(axis=0, ddof=1))
+        assert statistics.std(2) == pytest.approx(
+            history[:, 2].std(ddof=1))
+
+    def test_rolling_window_matches_last_days(self, history):
+        statistics = feed(DemandStatistics(num_products=4, window=7),
+                          history)
+
+        recent = history[-7:]
+        assert statistics.rolling_mean() == pytest.approx(
+            recent.mean(axis=0))
+        assert statistics.rolling_variance() == pytest.approx(
+            recent.var(axis=0, ddof=1))
+        assert statistics.rolling_mean(1) == pytest.approx(
+            recent[:, 1].mean())
+
+    def test_short_history_uses_available_days(self):
+        statistics = DemandStatistics(num_products=1, window=5)
+        assert statistics.rolling_mean(0) == 0.0
+        statistics.observe([4])
+        assert statistics.variance(0) == 0.0
+        statistics.observe([8])
+        assert statistics.rolling_mean(0) == 6.0
+        assert statistics.rolling_variance(0) == 8.0
+
+    def test_smoothing_follows_holt_recursion(self, history):
+        alpha, beta = 0.4, 0.2
+        statistics = feed(DemandStatistics(num_products=4, alpha=alpha,
+                                           beta=beta), history)
+
+        level = history[0].astype(float)
+        trend = np.zeros(4)
+        for x in history[1:]:
+            previous = level
+            level = alpha * x + (1 - alpha) * (previous + trend)
+            trend = beta * (level - previous) + (1 - beta) * trend
+
+        assert statistics.smoothed() == pytest.approx(level)
+        assert statistics.trend() == pytest.approx(trend)
+        assert statistics.forecast(3, horizon=2) == pytest.approx(
+            max(level[3] + 2 * trend[3], 0.0))
+
+    def test_forecast_follows_linear_growth(self):
+        statistics = DemandStatistics(num_products=1, alpha=0.5, beta=0.5)
+        for day in range(60):
+            statistics.observe([10 + 2 * day])
+
+        assert statistics.trend(0) == pytest.approx(2.0, abs=0.01)
+        assert statistics.forecast(0) == pytest.approx(10 + 2 * 60, abs=0.5)
+
+    def test_observe_orders_aggregates_per_product(self):
+        statistics = DemandStatistics(num_products=3)
+        statistics.observe_orders([0, 2, 0], [5, 1, 2])
+        statistics.observe_orders([], [])
+        assert statistics.mean().tolist() == [3.5, 0.0, 0.5]
@@ -0,0 +1,128 @@
+import pytest
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.event_driven_simulation import (EventDrivenSimulation,
+                                                    PoissonDemand)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                NoOrderPolicy,
+                                                ReorderPointPolicy)
+
+
+class ReplayGenerator:
+    """Podaje HeadlessSimulation te same zamówienia, dzień po dniu."""
+
+    def __init__(self, arrivals_by_day):
+        self._arrivals_by_day = arrivals_by_day
+        self._day = 1
+
+    def generate_orders(self, products):
+        arrivals = self._arrivals_by_day.get(self._day, [])
+        self._day += 1
+        return [CustomerOrder(product, quantity)
+                for product, quantity in arrivals]
+
+
+def create_products():
+    return [Product(name="Mleko", purchase_price=10, sell_price=15.5,
+                    space=0.1),
+            Product(name="Chleb", purchase_price=11, sell_price=14.25,
+                    space=0.2)]
+
+
+def create_shop(products, stock=10, budget=100.0):
+    warehouse = Warehouse(capacity=100.0)
+    for product in products:
+        warehouse.add_stock(product, stock)
+    return Shop(warehouse, budget=budget)
+
+
+def record_arrivals(rate, num_days, products, seed):
+    demand = PoissonDemand(rate, 1, 4, seed=seed)
+    arrivals_by_day = {}
+    now = 1.0
+    while True:
+        now, product, quantity = demand.next_arrival(now, products)
+        if now >= num_days + 1:
+            return arrivals_by_day
+        arrivals_by_day.setdefault(int(now), []).append((product, quantity))
+
+
+class TestEventDrivenSimulation:
+    def test_poisson_demand_validates_arguments(self):
+        with pytest.raises(ValueError):
+            PoissonDemand(0, 1, 2)
+        with pytest.raises(ValueError):
+            PoissonDemand(1, 0, 2)
+        with pytest.raises(ValueError):
+            PoissonDemand(1, 3, 2)
+
+    @pytest.mark.parametrize("rate,policy", [
+        (0.05, ReorderPointPolicy(2, 12)),
+        (3.0, ReorderPointPolicy(5, 30)),
+        (0.5, NoOrderPolicy()),
+    ])
+    def test_matches_day_by_day_simulation(self, rate, policy):
+        num_days = 400
+        products = create_products()
+        event_shop = create_shop(products)
+        event_simulation = EventDrivenSimulation(
+            event_shop, products, PoissonDemand(rate, 1, 4, seed=9), policy)
+
+        day_shop = create_shop(products)
+        arrivals = record_arrivals(rate, num_days, products, seed=9)
+        day_simulation = HeadlessSimulation(
+            day_shop, products,
+            CustomerDemandSimulation(ReplayGenerator(arrivals)), policy)
+
+        event_result = event_simulation.run(num_days)
+        day_result = day_simulation.run(num_days)
+
+        assert event_result == day_result
+        assert event_shop.day_number == day_shop.day_number
+        assert list(event_shop.revenue_history) == \
+            list(day_shop.revenue_history)
+        assert [event_shop.warehouse.get_quantity(p) for p in products] == \
+            [day_shop.warehouse.get_quantity(p) for p in products]
+
+    def test_sparse_demand_skips_idle_days(self):
+        products = create_products()
+        simulation = EventDrivenSimulation(
+            create_shop(products), products,
+            PoissonDemand(0.01, 1, 2, seed=3), ReorderPointPolicy(2, 12))
+
+        result = simulation.run(num_days=1000)
+
+        assert result.days_simulated == 1000
+        assert simulation.events_processed < 100
+
+    def test_run_can_be_continued(self):
+        products = create_products()
+        whole = EventDrivenSimulation(
+            create_shop(products), products,
+            PoissonDemand(1.0, 1, 4, seed=4), ReorderPointPolicy(3, 20))
+        split = EventDrivenSimulation(
+            create_shop(products), products,
+            PoissonDemand(1.0, 1, 4, seed=4), ReorderPointPolicy(3, 20))
+
+        whole.run(60)
+        split.run(25)
+        split.run(35)
+
+        assert whole.shop.budget == split.shop.budget
+        assert list(whole.shop.revenue_history) == \
+            list(split.shop.revenue_history)
+
+    def test_empty_shop_without_budget_goes_bankrupt(self):
+        products = create_products()
+        warehouse = Warehouse(capacity=100.0)
+        simulation = EventDrivenSimulation(
+            Shop(warehouse, budget=0.0), products,
+            PoissonDemand(1.0, 1, 4), ReorderPointPolicy(2, 12))
+
+        result = simulation.run(num_days=50)
+
+        assert result.bankrupt is True
+        assert result.days_simulated == 1
@@ -0,0 +1,117 @@
+import pytest
+from src.shop_ops.backorder_book import BackorderBook
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.day_result import DayResult
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_order import SupplierOrder
+from src.shop_ops.supplier_order_line import SupplierOrderLine
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.event_log import (EventLog, EventLogSink,
+                                      read_day_events, read_delivery_events,
+                                      read_order_events)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy)
+
+
+@pytest.fixture
+def product() -> Product:
+    return Product(name="Mleko", purchase_price=10, sell_price=15, space=0.1)
+
+
+class TestEventLog:
+    def test_missing_log_reads_as_empty(self, tmp_path):
+        assert len(read_order_events(str(tmp_path))) == 0
+        assert len(read_delivery_events(str(tmp_path))) == 0
+        assert len(read_day_events(str(tmp_path))) == 0
+
+    def test_records_round_trip(self, tmp_path, product):
+        orders = [CustomerOrder(product, 3), CustomerOrder(product, 4)]
+        orders[1].reject_order()
+        supplier_order = SupplierOrder([SupplierOrderLine(product, 7)],
+                                       delivery_day=2)
+        day_result = DayResult(day_number=2, orders=orders,
+                               fulfilled_count=1, rejected_count=1,
+                               day_revenue=45.0, starting_budget=100.0,
+                               ending_budget=145.0)
+
+        with EventLog(str(tmp_path), buffer_records=1) as log:
+            log.log_orders(2, orders)
+            log.log_delivery(2, supplier_order)
+            log.log_day(day_result)
+
+        order_events = read_order_events(str(tmp_path))
+        assert order_events['order_id'].tolist() == [o.id for o in orders]
+        assert order_events['quantity'].tolist() == [3, 4]
+        assert order_events['status'].tolist() == [
+            CustomerOrderStatus.PENDING.value,
+            CustomerOrderStatus.REJECTED.value]
+        assert set(order_events['product_id'].tolist()) == {product.id}
+
+        delivery_events = read_delivery_events(str(tmp_path))
+        assert delivery_events['quantity'].tolist() == [7]
+        assert delivery_events['unit_price'].tolist() == [10.0]
+
+        day_events = read_day_events(str(tmp_path))
+        assert day_events['day'].tolist() == [2]
+        assert day_events['ending_budget'].tolist() == [145.0]
+
+    def test_log_is_append_only(self, tmp_path, product):
+        for _ in range(2):
+            with EventLog(str(tmp_path)) as log:
+                log.log_orders(1, [CustomerOrder(product, 1)])
+
+        assert len(read_order_events(str(tmp_path))) == 2
+
+    def test_sink_records_simulation(self, tmp_path, product):
+        warehouse = Warehouse(capacity=100.0)
+        warehouse.add_stock(product, 20)
+        shop = Shop(warehouse, budget=300.0)
+        generator = CustomerOrderGenerator(min_orders_per_day=3,
+                                           max_orders_per_day=12,
+                                           min_quantity_per_order=1,
+                                           max_quantity_per_order=6,
+                                           seed=123)
+
+        with EventLog(str(tmp_path)) as log:
+            simulation = HeadlessSimulation(
+                shop=shop,
+                products=[product],
+                customer_simulation=CustomerDemandSimulation(generator),
+                policy=ReorderPointPolicy(10, 40),
+                sink=EventLogSink(log))
+            result = simulation.run(num_days=15)
+
+        day_events = read_day_events(str(tmp_path))
+        order_events = read_order_events(str(tmp_path))
+        assert day_events['day'].tolist() == list(range(1, 16))
+        assert len(order_events) == result.total_orders
+        assert day_events['fulfilled_count'].sum() == result.fulfilled_count
+        assert len(read_delivery_events(str(tmp_path))) > 0
+
+    def test_sink_records_filled_backorders(self, tmp_path, product):
+        shop = Shop(Warehouse(capacity=100.0), budget=300.0,
+                    backorders=BackorderBook())
+        generator = CustomerOrderGenerator(min_orders_per_day=3,
+                                           max_orders_per_day=12,
+                                           min_quantity_per_order=1,
+                                           max_quantity_per_order=6,
+                                           seed=123)
+
+        with EventLog(str(tmp_path)) as log:
+            simulation = HeadlessSimulation(
+                shop=shop,
+                products=[product],
+                customer_simulation=CustomerDemandSimulation(generator),
+                policy=ReorderPointPolicy(10, 40),
+                sink=EventLogSink(log))
+            result = simulation.run(num_days=15)
+
+        order_events = read_order_events(str(tmp_path))
+        fulfilled = (order_events['status']
+                     == CustomerOrderStatus.FULFILLED.value)
+        day_events = read_day_events(str(tmp_path))
+        assert fulfilled.sum() == result.fulfilled_count
+        assert day_events['fulfilled_count'].sum() == result.fulfilled_count
@@ -0,0 +1,69 @@
+import random
+import pytest
+from src.shop_ops.feasibility_index import FeasibilityIndex
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.headless_simulation import is_shop_bankrupt
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [Product(name="Mleko", purchase_price=10, sell_price=15,
+                    space=0.5),
+            Product(name="Chleb", purchase_price=4, sell_price=6,
+                    space=2.0),
+            Product(name="Ser", purchase_price=20, sell_price=30,
+                    space=0.1)]
+
+
+class TestFeasibilityIndex:
+    def test_nothing_affordable(self, products):
+        index = FeasibilityIndex(products)
+        assert not index.can_buy_any(budget=3, available_space=100)
+
+    def test_cheapest_product_does_not_fit(self, products):
+        index = FeasibilityIndex(products)
+        assert not index.can_buy_any(budget=5, available_space=1.0)
+        assert index.can_buy_any(budget=10, available_space=1.0)
+
+    def test_smallest_product_needs_larger_budget(self, products):
+        index = FeasibilityIndex(products)
+        assert not index.can_buy_any(budget=19, available_space=0.2)
+        assert index.can_buy_any(budget=20, available_space=0.1)
+
+    def test_empty_catalog(self):
+        assert not FeasibilityIndex([]).can_buy_any(100, 100)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(7)
+        products = [Product(name=f"P{i}",
+                            purchase_price=rng.randint(1, 50),
+                            sell_price=60,
+                            space=rng.choice([0.1, 0.5, 1.0, 3.0]))
+                    for i in range(40)]
+        index = FeasibilityIndex(products)
+        for _ in range(500):
+            capacity = rng.choice([0.0, 0.05, 0.5, 1.0, 5.0])
+            budget = rng.choice([0, 1, 5, 12.5, 49, 100])
+            shop = Shop(Warehouse(capacity=capacity), budget=budget)
+            assert (is_shop_bankrupt(shop, products, index)
+                    == is_shop_bankrupt(shop, products))
+
+    def test_shop_with_stock_is_not_bankrupt(self, products):
+        warehouse = Warehouse(capacity=1.0)
+        warehouse.add_stock(products[0], 1)
+        shop = Shop(warehouse, budget=0)
+        assert not is_shop_bankrupt(shop, products,
+                                    FeasibilityIndex(products))
+
+    def test_stock_outside_products_counts_on_both_paths(self, products):
+        other = Product(name="Spoza listy", purchase_price=1, sell_price=2,
+                        space=0.1)
+        warehouse = Warehouse(capacity=1.0)
+        warehouse.add_stock(other, 1)
+        shop = Shop(warehouse, budget=0)
+
+        assert not is_shop_bankrupt(shop, products)
+        assert not is_shop_bankrupt(shop, products,
+                                    FeasibilityIndex(products))
@@ -0,0 +1,167 @@
+import io
+import pytest
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.warehouse import Warehouse
+from src.simulation import headless_simulation
+from src.simulation.cli_simulation import (ConsoleSink, InteractivePolicy,
+                                           is_shop_bankrupt)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                NoOrderPolicy,
+                                                ReorderPointPolicy,
+                                                SimulationSink)
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [Product(name="Mleko", purchase_price=10, sell_price=15,
+                    space=0.1),
+            Product(name="Chleb", purchase_price=11, sell_price=14,
+                    space=0.2)]
+
+
+def create_simulation(products, policy, stock=20, budget=300.0, sink=None,
+                      summary_only=False):
+    warehouse = Warehouse(capacity=100.0)
+    if stock > 0:
+        for product in products:
+            warehouse.add_stock(product, stock)
+    shop = Shop(warehouse, budget=budget)
+    generator = CustomerOrderGenerator(min_orders_per_day=3,
+                                       max_orders_per_day=12,
+                                       min_quantity_per_order=1,
+                                       max_quantity_per_order=6,
+                                       seed=123)
+    return HeadlessSimulation(shop=shop,
+                              products=products,
+                              customer_simulation=CustomerDemandSimulation(
+                                  generator),
+                              policy=policy,
+                              sink=sink,
+                              summary_only=summary_only)
+
+
+class RecordingSink(SimulationSink):
+    def __init__(self):
+        self.events = []
+
+    def supplier_order_placed(self, order):
+        self.events.append(("order", order.delivery_day))
+
+    def deliveries(self, delivered):
+        if delivered:
+            self.events.append(("delivered", len(delivered)))
+
+    def bankrupt(self, shop):
+        self.events.append(("bankrupt", shop.day_number))
+
+
+class TestReorderPointPolicy:
+    def test_invalid_levels_raise_error(self):
+        with pytest.raises(ValueError):
+            ReorderPointPolicy(reorder_point=-1, order_up_to=5)
+        with pytest.raises(ValueError):
+            ReorderPointPolicy(reorder_point=5, order_up_to=5)
+
+    def test_orders_up_to_level_for_low_stock(self, products):
+        shop = Shop(Warehouse(capacity=100.0), budget=1000.0)
+        shop.warehouse.add_stock(products[0], 2)
+        shop.warehouse.add_stock(products[1], 50)
+
+        order = ReorderPointPolicy(5, 20).place_order(shop, products, 2)
+
+        assert [(line.product, line.quantity) for line in order.lines] == [
+            (products[0], 18)]
+        assert order.delivery_day == 2
+        assert shop.budget == pytest.approx(1000.0 - 180)
+
+    def test_no_order_when_stock_is_high(self, products):
+        shop = Shop(Warehouse(capacity=100.0), budget=1000.0)
+        for product in products:
+            shop.warehouse.add_stock(product, 50)
+
+        assert ReorderPointPolicy(5, 20).place_order(shop, products, 2) is None
+
+
+class TestInteractivePolicy:
+    def test_order_uses_given_delivery_day(self, products, monkeypatch,
+                                           capsys):
+        answers = iter(["t", "1", "5", "", "t"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        shop = Shop(Warehouse(capacity=100.0), budget=1000.0)
+
+        order = InteractivePolicy().place_order(shop, products, 4)
+
+        assert order.delivery_day == 4
+        assert [(line.product, line.quantity) for line in order.lines] == [
+            (products[0], 5)]
+        assert "na dzień 4" in capsys.readouterr().out
+
+    def test_is_shop_bankrupt_is_still_exported(self):
+        assert is_shop_bankrupt is headless_simulation.is_shop_bankrupt
+
+
+class TestHeadlessSimulation:
+    def test_empty_shop_without_budget_goes_bankrupt(self, products):
+        sink = RecordingSink()
+        simulation = create_simulation(products, NoOrderPolicy(), stock=0,
+                                       budget=0.0, sink=sink)
+
+        result = simulation.run(num_days=100)
+
+        assert result.bankrupt is True
+        assert result.days_simulated == 1
+        assert sink.events == [("bankrupt", 2)]
+
+    def test_no_order_policy_runs_out_of_stock(self, products):
+        simulation = create_simulation(products, NoOrderPolicy())
+
+        result = simulation.run(num_days=30)
+
+        assert result.days_simulated == 30
+        assert result.rejected_count > 0
+        assert result.fulfilled_count + result.rejected_count == \
+            result.total_orders
+        assert all(simulation.shop.warehouse.get_quantity(p) < 20
+                   for p in products)
+
+    def test_reorder_policy_keeps_shop_running(self, products):
+        sink = RecordingSink()
+        simulation = create_simulation(products, ReorderPointPolicy(10, 40),
+                                       sink=sink)
+
+        result = simulation.run(num_days=60)
+
+        assert result.bankrupt is False
+        assert result.days_simulated == 60
+        assert ("delivered", 1) in sink.events
+        assert result.final_budget == pytest.approx(simulation.shop.budget)
+        assert result.total_revenue == pytest.approx(
+            simulation.shop.get_total_revenue())
+
+    def test_runs_are_reproducible(self, products):
+        results = [create_simulation(products, ReorderPointPolicy(10, 40))
+                   .run(num_days=30) for _ in range(2)]
+
+        assert results[0] == results[1]
+
+    def test_summary_only_run_matches_full_run(self, products):
+        full, summary = [
+            create_simulation(products, ReorderPointPolicy(10, 40),
+                              summary_only=summary_only).run(num_days=30)
+            for summary_only in (False, True)]
+
+        assert summary == full
+
+    def test_console_sink_writes_to_stream(self, products):
+        stream = io.StringIO()
+        simulation = create_simulation(products, NoOrderPolicy(),
+                                       sink=ConsoleSink(stream))
+
+        simulation.run(num_days=2)
+
+        output = stream.getvalue()
+        assert "=== Dzień 1 ===" in output
+        assert "Koniec symulacji." in output
@@ -0,0 +1,114 @@
+import csv
+import json
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy)
+from src.simulation.instrumentation import (PHASES, WAREHOUSE_OPERATIONS,
+                                             Instrumentation)
+from src.simulation.snapshot import restore, snapshot
+
+
+def create_simulation(instrumentation=None, warehouse_engine="object"):
+    products = create_default_products()
+    batched = warehouse_engine == "numpy"
+    return HeadlessSimulation(
+        shop=create_shop_with_initial_stock(products, warehouse_engine),
+        products=products,
+        customer_simulation=CustomerDemandSimulation(
+            create_order_generator(), batched=batched),
+        policy=ReorderPointPolicy(20, 90),
+        instrumentation=instrumentation)
+
+
+class TestInstrumentation:
+    def test_records_every_phase_and_counts(self):
+        instrumentation = Instrumentation()
+        result = create_simulation(instrumentation).run(num_days=5)
+
+        assert [day.day for day in instrumentation.days] == [1, 2, 3, 4, 5]
+        for day in instrumentation.days:
+            assert set(day.phase_ns) == set(PHASES)
+            assert day.warehouse_ops['get_quantity'] > 0
+        assert sum(day.orders for day in instrumentation.days) == \
+            result.total_orders
+        assert instrumentation.slowest_phase()[1] in PHASES
+
+    def test_results_do_not_depend_on_instrumentation(self):
+        plain = create_simulation().run(num_days=10)
+        measured = create_simulation(Instrumentation()).run(num_days=10)
+
+        assert plain == measured
+
+    def test_exports_chrome_trace_and_csv(self, tmp_path):
+        instrumentation = Instrumentation()
+        create_simulation(instrumentation).run(num_days=3)
+        trace_path = tmp_path / "trace.json"
+        csv_path = tmp_path / "days.csv"
+
+        instrumentation.write_chrome_trace(str(trace_path))
+        instrumentation.write_csv(str(csv_path))
+
+        trace = json.loads(trace_path.read_text())
+        phases = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+        assert len(phases) == 3 * len(PHASES)
+        rows = list(csv.DictReader(csv_path.open()))
+        assert [row['day'] for row in rows] == ['1', '2', '3']
+        assert 'customer_demand_us' in rows[0]
+
+    def test_snapshot_of_instrumented_simulation(self):
+        instrumentation = Instrumentation()
+        simulation = create_simulation(instrumentation)
+        simulation.run(num_days=3)
+
+        restored = restore(snapshot(simulation))
+
+        assert restored.instrumentation is None
+        assert restored.run(num_days=3) == simulation.run(num_days=3)
+        assert len(instrumentation.days) == 6
+
+    def test_warehouse_methods_are_restored_after_run(self):
+        simulation = create_simulation(Instrumentation())
+        simulation.run(num_days=2)
+
+        for name in WAREHOUSE_OPERATIONS:
+            assert name not in vars(simulation.shop.warehouse)
+
+    def test_second_instrumentation_does_not_double_count(self):
+        first = Instrumentation()
+        simulation = create_simulation(first)
+        simulation.run(num_days=3)
+        first_counts = dict(first._warehouse_counts)
+        reference = create_simulation()
+        reference.run(num_days=3)
+        reference.instrumentation = Instrumentation()
+
+        second = Instrumentation()
+        simulation.instrumentation = second
+        second.attach(simulation.shop.warehouse)
+        simulation.run(num_days=3)
+        reference.run(num_days=3)
+
+        assert first._warehouse_counts == first_counts
+        assert second._warehouse_counts == \
+            reference.instrumentation._warehouse_counts
+
+    def test_attach_is_idempotent(self):
+        instrumentation = Instrumentation()
+        warehouse = create_simulation().shop.warehouse
+        instrumentation.attach(warehouse)
+        instrumentation.attach(warehouse)
+
+        warehouse.get_used_space()
+
+        assert instrumentation._warehouse_counts['get_used_space'] == 1
+
+    def test_counts_array_warehouse_bulk_operations(self):
+        instrumentation = Instrumentation()
+        create_simulation(instrumentation, "numpy").run(num_days=3)
+
+        for day in instrumentation.days:
+            assert day.warehouse_ops['get_quantities'] == 1
+            assert day.warehouse_ops['apply_deltas'] == 1
@@ -0,0 +1,57 @@
+import pytest
+from src.simulation.headless_simulation import (ReorderPointPolicy,
+                                                SimulationResult)
+from src.simulation.monte_carlo import (Scenario, derive_seeds,
+                                        run_monte_carlo, summarize)
+
+
+def make_result(final_budget, bankrupt, total_orders, rejected_count):
+    return SimulationResult(days_simulated=10,
+                            bankrupt=bankrupt,
+                            final_budget=final_budget,
+                            total_orders=total_orders,
+                            fulfilled_count=total_orders - rejected_count,
+                            rejected_count=rejected_count,
+                            total_revenue=0)
+
+
+class TestMonteCarlo:
+    def test_derived_seeds_are_reproducible_and_distinct(self):
+        seeds = derive_seeds(42, 50)
+        assert seeds == derive_seeds(42, 50)
+        assert len(set(seeds)) == 50
+        assert seeds != derive_seeds(43, 50)
+
+    def test_summarize_aggregates_results(self):
+        summary = summarize([make_result(100, False, 10, 0),
+                             make_result(300, True, 10, 5)],
+                            percentiles=(50,))
+
+        assert summary.runs == 2
+        assert summary.mean_final_budget == pytest.approx(200)
+        assert summary.final_budget_percentiles == {50: pytest.approx(200)}
+        assert summary.stockout_rate == pytest.approx(0.25)
+        assert summary.bankruptcy_probability == pytest.approx(0.5)
+
+    def test_summarize_requires_results(self):
+        with pytest.raises(ValueError):
+            summarize([])
+
+    def test_pool_matches_serial_run(self):
+        scenario = Scenario(num_days=20,
+                            policy=ReorderPointPolicy(10, 60))
+
+        serial = run_monte_carlo(scenario, runs=6, base_seed=1,
+                                 max_workers=1)
+        parallel = run_monte_carlo(scenario, runs=6, base_seed=1,
+                                   max_workers=2)
+
+        assert serial == parallel
+        assert serial.runs == 6
+
+    def test_invalid_arguments_raise_error(self):
+        scenario = Scenario(num_days=5)
+        with pytest.raises(ValueError):
+            run_monte_carlo(scenario, runs=0)
+        with pytest.raises(ValueError):
+            run_monte_carlo(scenario, runs=2, max_workers=0)
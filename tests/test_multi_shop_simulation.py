@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order_generator import CustomerOrderGenerator
+from src.shop_ops.demand_batch import DemandBatch
+from src.shop_ops.multi_shop_simulation import MultiShopSimulation
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.warehouse import Warehouse
+
+
+class FakeOrderGenerator:
+    def __init__(self):
+        self.orders = []
+
+    def generate_orders(self, products):
+        return list(self.orders)
+
+
+@pytest.fixture
+def products() -> list[Product]:
+    return [Product(name="Mleko", purchase_price=10, sell_price=15.3,
+                    space=0.1),
+            Product(name="Chleb", purchase_price=11, sell_price=14.1,
+                    space=0.2),
+            Product(name="Masło", purchase_price=12, sell_price=13.7,
+                    space=0.3)]
+
+
+def create_generator(seed):
+    return CustomerOrderGenerator(min_orders_per_day=3,
+                                  max_orders_per_day=15,
+                                  min_quantity_per_order=1,
+                                  max_quantity_per_order=6,
+                                  seed=seed)
+
+
+class TestMultiShopSimulation:
+    def test_matches_single_shop_classes(self, products):
+        initial_stock = np.array([[30, 10, 5], [0, 40, 40], [60, 60, 60]])
+        budgets = [100.0, 250.5, 0.0]
+        multi = MultiShopSimulation(products, initial_stock, budgets,
+                                    capacities=100.0, num_shops=3)
+
+        singles = []
+        for stock, budget in zip(initial_stock, budgets):
+            warehouse = Warehouse(capacity=100.0)
+            for product, quantity in zip(products, stock.tolist()):
+                if quantity > 0:
+                    warehouse.add_stock(product, quantity)
+            generator = FakeOrderGenerator()
+            singles.append((Shop(warehouse, budget=budget), generator,
+                            CustomerDemandSimulation(generator)))
+
+        batch_generators = [create_generator(seed) for seed in (1, 2, 3)]
+        for day in range(15):
+            demand = [g.generate_order_batch(len(products))
+                      for g in batch_generators]
+            if day == 7:
+                multi.add_stock([1, 1], [0, 2], [9, 4])
+                singles[1][0].warehouse.add_stock(products[0], 9)
+                singles[1][0].warehouse.add_stock(products[2], 4)
+
+            result = multi.run_day(demand)
+
+            for i, (shop, generator, simulation) in enumerate(singles):
+                generator.orders = demand[i].to_orders(products)
+                expected = simulation.run_day(shop=shop, products=products)
+                assert result.day_number[i] == expected.day_number
+                assert result.fulfilled_count[i] == expected.fulfilled_count
+                assert result.rejected_count[i] == expected.rejected_count
+                assert result.day_revenue[i] == expected.day_revenue
+                assert result.starting_budget[i] == expected.starting_budget
+                assert result.ending_budget[i] == expected.ending_budget
+                assert multi.stock[i].tolist() == [
+                    shop.warehouse.get_quantity(p) for p in products]
+                assert multi.get_available_space()[i] == \
+                    shop.warehouse.get_available_space()
+                assert multi.day_number[i] == shop.day_number
+
+        for i, (shop, _, _) in enumerate(singles):
+            assert multi.total_revenue[i] == pytest.approx(
+                shop.get_total_revenue())
+
+    def test_run_day_with_generators(self, products):
+        multi = MultiShopSimulation(products, [50, 50, 50], 0.0, 100.0,
+                                    num_shops=2)
+
+        result = multi.run_day_with_generators([create_generator(1),
+                                                create_generator(2)])
+
+        assert result.day_number.tolist() == [1, 1]
+        assert multi.day_number.tolist() == [2, 2]
+        assert len(multi.revenue_history) == 1
+
+    def test_invalid_arguments_raise_error(self, products):
+        with pytest.raises(ValueError):
+            MultiShopSimulation(products, [1, 1, 1], 0.0, 10.0, num_shops=0)
+        multi = MultiShopSimulation(products, [1, 1, 1], 0.0, 10.0,
+                                    num_shops=2)
+        with pytest.raises(ValueError):
+            multi.run_day([])
+        with pytest.raises(ValueError):
+            multi.add_stock([0], [0], [0])
+
+    @pytest.mark.parametrize("index", [-1, 3])
+    def test_out_of_range_product_index_changes_nothing(self, products,
+                                                        index):
+        multi = MultiShopSimulation(products, [5, 5, 5], 100.0, 10.0,
+                                    num_shops=2)
+        demand = [DemandBatch(np.array([0, index]), np.array([1, 1])),
+                  DemandBatch(np.array([1]), np.array([1]))]
+
+        with pytest.raises(ValueError):
+            multi.run_day(demand)
+
+        assert multi.stock.tolist() == [[5, 5, 5], [5, 5, 5]]
+        assert multi.budget.tolist() == [100.0, 100.0]
+        assert multi.day_number.tolist() == [1, 1]
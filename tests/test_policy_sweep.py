@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy)
+from src.simulation.policy_sweep import PolicySweep, record_demand
+
+POLICIES = [(0, 10), (5, 40), (20, 90), (30, 200), (60, 150)]
+
+
+def run_single(reorder_point, order_up_to, num_days, seed):
+    products = create_default_products()
+    simulation = HeadlessSimulation(
+        shop=create_shop_with_initial_stock(products),
+        products=products,
+        customer_simulation=CustomerDemandSimulation(
+            create_order_generator(seed=seed)),
+        policy=ReorderPointPolicy(reorder_point, order_up_to))
+    result = simulation.run(num_days)
+    return result, [simulation.shop.warehouse.get_quantity(p)
+                    for p in products]
+
+
+class TestPolicySweep:
+    @pytest.mark.parametrize("seed", [123, 7])
+    def test_matches_headless_simulation_for_each_policy(self, seed):
+        num_days = 80
+        products = create_default_products()
+        demand = record_demand(create_order_generator(seed=seed), products,
+                               num_days)
+        sweep = PolicySweep.from_products(products,
+                                          initial_stock=[120] * 3,
+                                          budget=300,
+                                          capacity=100.0)
+
+        result = sweep.run(reorder_points=[p[0] for p in POLICIES],
+                           order_up_to=[p[1] for p in POLICIES],
+                           demand=demand)
+
+        for i, (s, big_s) in enumerate(POLICIES):
+            expected, stock = run_single(s, big_s, num_days, seed)
+            assert result.days_simulated[i] == expected.days_simulated
+            assert result.bankrupt[i] == expected.bankrupt
+            assert result.final_budget[i] == expected.final_budget
+            assert result.total_orders[i] == expected.total_orders
+            assert result.fulfilled_count[i] == expected.fulfilled_count
+            assert result.rejected_count[i] == expected.rejected_count
+            assert result.total_revenue[i] == expected.total_revenue
+            assert result.final_stock[i].tolist() == stock
+
+    def test_per_product_levels(self):
+        products = create_default_products()
+        demand = record_demand(create_order_generator(), products, 20)
+        sweep = PolicySweep.from_products(products, [120] * 3, 300, 100.0)
+
+        per_product = sweep.run(reorder_points=np.array([[20, 20, 20]]),
+                                order_up_to=np.array([[90, 90, 90]]),
+                                demand=demand)
+        scalar = sweep.run(reorder_points=[20], order_up_to=[90],
+                           demand=demand)
+
+        assert per_product.final_budget.tolist() == \
+            scalar.final_budget.tolist()
+
+    def test_invalid_levels_raise_error(self):
+        sweep = PolicySweep.from_products(create_default_products(),
+                                          [1] * 3, 300, 100.0)
+        with pytest.raises(ValueError):
+            sweep.run(reorder_points=[5], order_up_to=[5], demand=[])
+        with pytest.raises(ValueError):
+            sweep.run(reorder_points=[-1], order_up_to=[5], demand=[])
+
+    def test_mismatched_product_arrays_raise_error(self):
+        with pytest.raises(ValueError):
+            PolicySweep([1, 2], [2, 3], [0.1], [0, 0], 100, 10.0)
@@ -66,3 +66,8 @@ class TestProduct:
         p2.id = 1
 
         assert hash(p1) == hash(p2)
+
+    def test_product_has_no_instance_dict(self):
+        p = Product("Mleko", 10, 15, 0.1)
+
+        assert not hasattr(p, "__dict__")
@@ -47,3 +47,37 @@ class TestShop:
     def test_is_bankrupt(self, shop):
         shop.budget = -100
         assert shop.is_bankrupt() is True
+
+    def test_revenue_history_is_read_only(self, shop):
+        shop.register_sale(100)
+        shop.start_new_day()
+
+        with pytest.raises(AttributeError):
+            shop.revenue_history.append(50)
+        with pytest.raises(TypeError):
+            shop.revenue_history[0] = 50
+        assert list(shop.revenue_history) == [100]
+
+    def test_get_revenue_range(self, shop):
+        for revenue in (100, 50, 25, 10):
+            shop.register_sale(revenue)
+            shop.start_new_day()
+
+        assert shop.get_revenue_range(0, 4) == 185
+        assert shop.get_revenue_range(1, 3) == 75
+        assert shop.get_revenue_range(2, 2) == 0
+        with pytest.raises(ValueError):
+            shop.get_revenue_range(3, 5)
+        with pytest.raises(ValueError):
+            shop.get_revenue_range(2, 1)
+
+    def test_get_rolling_average(self, shop):
+        assert shop.get_rolling_average(3) == 0
+        for revenue in (100, 50, 25, 10):
+            shop.register_sale(revenue)
+            shop.start_new_day()
+
+        assert shop.get_rolling_average(2) == pytest.approx(17.5)
+        assert shop.get_rolling_average(10) == pytest.approx(46.25)
+        with pytest.raises(ValueError):
+            shop.get_rolling_average(0)
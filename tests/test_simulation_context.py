@@ -0,0 +1,85 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.simulation_context import SimulationContext, current_context
+from src.shop_ops.stock_item import StockItem
+from src.shop_ops.warehouse import Warehouse
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy,
+                                                SimulationSink)
+
+
+class OrderIdSink(SimulationSink):
+    def __init__(self, barrier=None):
+        self.records = []
+        self._barrier = barrier
+
+    def day_finished(self, day_result, shop, products):
+        self.records.append([(o.id, o.product.id, o.quantity)
+                             for o in day_result.orders])
+        if self._barrier is not None:
+            # wymusza przeplatanie się wątków dzień po dniu
+            self._barrier.wait()
+
+
+def run_scenario(seed, barrier=None):
+    context = SimulationContext(seed)
+    with context.activate():
+        products = create_default_products()
+        sink = OrderIdSink(barrier)
+        simulation = HeadlessSimulation(
+            shop=create_shop_with_initial_stock(products),
+            products=products,
+            customer_simulation=CustomerDemandSimulation(
+                create_order_generator(seed=context.derive_seed('customers'))),
+            policy=ReorderPointPolicy(20, 90),
+            sink=sink)
+        result = simulation.run(num_days=30)
+        return result, sink.records
+
+
+class TestSimulationContext:
+    def test_ids_start_from_one_in_each_context(self):
+        with SimulationContext().activate():
+            product = Product("Mleko", 10, 15, 0.1)
+            order = CustomerOrder(product, 1)
+            item = StockItem(product, 1)
+            assert (product.id, order.id, item.id) == (1, 1, 1)
+            assert Product("Chleb", 11, 14, 0.2).id == 2
+        assert current_context() is None
+
+    def test_global_counters_are_used_without_context(self):
+        next_id = Product._next_id
+        assert Product("Mleko", 10, 15, 0.1).id == next_id
+        assert Product._next_id == next_id + 1
+
+    def test_derived_seeds_are_stable_and_distinct(self):
+        context = SimulationContext(seed=4)
+        assert context.derive_seed('a') == SimulationContext(4).derive_seed('a')
+        assert context.derive_seed('a') != context.derive_seed('b')
+        assert context.random('a').random() == context.random('a').random()
+
+    def test_concurrent_runs_match_isolated_runs(self):
+        seeds = [1, 2, 3, 4]
+        alone = [run_scenario(seed) for seed in seeds]
+
+        barrier = threading.Barrier(len(seeds))
+        with ThreadPoolExecutor(max_workers=len(seeds)) as executor:
+            concurrent = list(executor.map(
+                lambda seed: run_scenario(seed, barrier), seeds))
+
+        assert concurrent == alone
+
+    def test_shop_objects_keep_working_inside_context(self):
+        with SimulationContext().activate():
+            product = Product("Mleko", 10, 15, 0.1)
+            warehouse = Warehouse(capacity=10.0)
+            warehouse.add_stock(product, 3)
+            shop = Shop(warehouse)
+            assert shop.warehouse.get_quantity(product) == 3
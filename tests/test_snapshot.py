@@ -0,0 +1,125 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from src.shop_ops.customer_demand_simulation import CustomerDemandSimulation
+from src.shop_ops.customer_order import CustomerOrder
+from src.shop_ops.product import Product
+from src.shop_ops.simulation_context import SimulationContext
+from src.simulation.cli_simulation import (create_default_products,
+                                           create_order_generator,
+                                           create_shop_with_initial_stock)
+from src.simulation.event_log import EventLog
+from src.simulation.headless_simulation import (HeadlessSimulation,
+                                                ReorderPointPolicy,
+                                                SimulationSink)
+from src.simulation.snapshot import (load_snapshot, restore, save_snapshot,
+                                     snapshot)
+
+
+class CreateEventLog:
+    """Obiekt, który przy wczytaniu wywołałby EventLog(path)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return EventLog, (self.path,)
+
+
+class RecordingSink(SimulationSink):
+    def __init__(self):
+        self.days = []
+
+    def day_finished(self, day_result, shop, products):
+        self.days.append((day_result.day_number,
+                          [(o.id, o.product.id, o.quantity, o.status)
+                           for o in day_result.orders],
+                          shop.budget,
+                          [shop.warehouse.get_quantity(p) for p in products]))
+
+
+def create_simulation(warehouse_engine="object", batched=False):
+    products = create_default_products()
+    shop = create_shop_with_initial_stock(products, warehouse_engine)
+    return HeadlessSimulation(
+        shop=shop,
+        products=products,
+        customer_simulation=CustomerDemandSimulation(
+            create_order_generator(seed=5), batched=batched),
+        policy=ReorderPointPolicy(20, 90))
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("warehouse_engine,batched",
+                             [("object", False), ("numpy", True)])
+    def test_restored_run_continues_identically(self, warehouse_engine,
+                                                batched):
+        # id zamówień są identyczne tylko przy licznikach SimulationContext
+        with SimulationContext(seed=1).activate():
+            simulation = create_simulation(warehouse_engine, batched)
+            simulation.run(num_days=10)
+            data = snapshot(simulation)
+
+            original_sink = RecordingSink()
+            simulation.sink = original_sink
+            original = simulation.run(num_days=20)
+
+            restored_sink = RecordingSink()
+            restored = restore(data, sink=restored_sink).run(num_days=20)
+
+        assert restored == original
+        assert restored_sink.days == original_sink.days
+
+    def test_snapshot_can_branch_several_times(self):
+        simulation = create_simulation()
+        simulation.run(num_days=5)
+        data = snapshot(simulation)
+
+        first = restore(data).run(num_days=10)
+        second = restore(data).run(num_days=10)
+
+        assert first == second
+
+    def test_save_and_load_file(self, tmp_path):
+        simulation = create_simulation()
+        simulation.run(num_days=5)
+        path = str(tmp_path / "state.snap")
+        save_snapshot(simulation, path)
+
+        expected = simulation.run(num_days=5)
+        assert load_snapshot(path).run(num_days=5) == expected
+
+    def test_global_id_counters_only_move_forward(self):
+        simulation = create_simulation()
+        simulation.run(num_days=5)
+        data = snapshot(simulation)
+        simulation.run(num_days=5)
+        next_order_id = CustomerOrder._next_id
+
+        restore(data)
+
+        assert CustomerOrder._next_id == next_order_id
+
+    def test_invalid_data_raises_error(self):
+        for data in (b"not a snapshot", b"SHOPSNAP", b"SHOPSNAP\x01",
+                     snapshot(create_simulation())[:-10]):
+            with pytest.raises(ValueError):
+                restore(data)
+
+    def test_only_allowed_classes_are_loaded(self, tmp_path):
+        path = tmp_path / "events"
+        for value in (os.system, ProcessPoolExecutor, CreateEventLog(str(path))):
+            payload = pickle.dumps({'simulation': value, 'next_ids': {}})
+            with pytest.raises(ValueError, match="not allowed"):
+                restore(b"SHOPSNAP\x01" + payload)
+        assert not path.exists()
+
+    def test_state_must_contain_simulation(self):
+        for state in ({'simulation': Product("Mleko", 10, 15, 0.1),
+                       'next_ids': {}},
+                      {'next_ids': {}},
+                      [create_simulation()]):
+            payload = pickle.dumps(state)
+            with pytest.raises(ValueError, match="does not contain"):
+                restore(b"SHOPSNAP\x01" + payload)
@@ -109,3 +109,59 @@ class TestSupplierFulfillmentSimulation:
 
         with pytest.raises(ValueError):
             simulation.run_for_day(shop, current_day=-1)
+
+    def test_delivered_orders_leave_the_schedule(self, shop, product_milk):
+        order_day2 = SupplierOrder([SupplierOrderLine(product_milk, 1)],
+                                   delivery_day=2)
+        order_day4 = SupplierOrder([SupplierOrderLine(product_milk, 2)],
+                                   delivery_day=4)
+        simulation = SupplierFulfillmentSimulation([order_day4])
+        simulation.add_order(order_day2)
+
+        assert simulation.pending_count() == 2
+        assert simulation.pending_orders() == [order_day2, order_day4]
+
+        assert simulation.run_for_day(shop, current_day=2) == [order_day2]
+        assert simulation.pending_orders() == [order_day4]
+        assert simulation.run_for_day(shop, current_day=2) == []
+
+        assert simulation.run_for_day(shop, current_day=4) == [order_day4]
+        assert simulation.pending_count() == 0
+        assert shop.warehouse.get_quantity(product_milk) == 3
+
+    def test_supplier_orders_lists_pending_orders(self, shop, product_milk):
+        order_day2 = SupplierOrder([SupplierOrderLine(product_milk, 1)],
+                                   delivery_day=2)
+        order_day3 = SupplierOrder([SupplierOrderLine(product_milk, 1)],
+                                   delivery_day=3)
+        simulation = SupplierFulfillmentSimulation([order_day3, order_day2])
+
+        assert simulation.supplier_orders == (order_day2, order_day3)
+        simulation.run_for_day(shop, current_day=2)
+        assert simulation.supplier_orders == (order_day3,)
+        with pytest.raises(AttributeError):
+            simulation.supplier_orders.append(order_day2)
+
+    def test_order_for_past_day_is_rejected(self, shop, product_milk):
+        simulation = SupplierFulfillmentSimulation()
+        simulation.run_for_day(shop, current_day=3)
+
+        for day in (1, 3):
+            with pytest.raises(ValueError):
+                simulation.add_order(SupplierOrder(
+                    [SupplierOrderLine(product_milk, 1)], delivery_day=day))
+        assert simulation.pending_count() == 0
+
+    def test_orders_of_skipped_days_leave_the_schedule(self, shop,
+                                                       product_milk):
+        order_day2 = SupplierOrder([SupplierOrderLine(product_milk, 1)],
+                                   delivery_day=2)
+        order_day5 = SupplierOrder([SupplierOrderLine(product_milk, 2)],
+                                   delivery_day=5)
+        simulation = SupplierFulfillmentSimulation([order_day2, order_day5])
+
+        assert simulation.run_for_day(shop, current_day=4) == []
+
+        assert simulation.pending_orders() == [order_day5]
+        assert simulation.pending_count() == 1
+        assert order_day2.status == SupplierOrderStatus.ORDERED
@@ -1,4 +1,6 @@
 import pytest
+from src.shop_ops.backorder_book import BackorderBook
+from src.shop_ops.customer_order import CustomerOrder, CustomerOrderStatus
 from src.shop_ops.supplier_order import SupplierOrder, SupplierOrderStatus
 from src.shop_ops.supplier_order_line import SupplierOrderLine
 from src.shop_ops.product import Product
@@ -90,3 +92,22 @@ class TestSupplierOrder:
 
         with pytest.raises(ValueError):
             supplier_order.deliver(shop)
+
+    def test_deliver_drains_backorders_of_delivered_products(self, product,
+                                                             product2):
+        shop = Shop(Warehouse(capacity=100.0), budget=0,
+                    backorders=BackorderBook())
+        waiting = [CustomerOrder(product, 8), CustomerOrder(product, 5),
+                   CustomerOrder(product2, 1)]
+        for customer_order in waiting:
+            shop.backorders.add(customer_order, day=1)
+
+        drained = SupplierOrder([SupplierOrderLine(product, 10)],
+                                delivery_day=2).deliver(shop)
+
+        assert drained == [waiting[0]]
+        assert waiting[0].status == CustomerOrderStatus.FULFILLED
+        assert shop.warehouse.get_quantity(product) == 2
+        assert shop.budget == 120
+        assert shop.backorders.queue_length(product) == 1
+        assert shop.backorders.queue_length(product2) == 1
@@ -147,3 +147,37 @@ class TestSupplierOrderDraft:
 
         with pytest.raises(ValueError):
             draft.confirm(shop, delivery_day=2)
+
+    def test_repeated_product_adds_separate_lines_by_default(self, shop, product_milk):
+        draft = SupplierOrderDraft()
+
+        draft.add_line(shop, product_milk, 2)
+        draft.add_line(shop, product_milk, 3)
+
+        assert len(draft.lines) == 2
+        assert draft.total_cost() == pytest.approx(50.0)
+
+    def test_merge_lines_combines_repeated_product(self, shop, product_milk, product_bread):
+        draft = SupplierOrderDraft(merge_lines=True)
+
+        first = draft.add_line(shop, product_milk, 2)
+        draft.add_line(shop, product_bread, 1)
+        merged = draft.add_line(shop, product_milk, 3)
+
+        assert merged is first
+        assert len(draft.lines) == 2
+        assert first.quantity == 5
+        assert draft.total_cost() == pytest.approx(55.0)
+        assert draft.total_space() == pytest.approx(5.5)
+
+    def test_rejected_merge_keeps_line_and_totals(self, warehouse, product_milk):
+        shop = Shop(warehouse=warehouse, budget=40.0)
+        draft = SupplierOrderDraft(merge_lines=True)
+
+        line = draft.add_line(shop, product_milk, 2)  # cost: 20
+        with pytest.raises(ValueError):
+            draft.add_line(shop, product_milk, 3)     # 20 + 30 > 40
+
+        assert line.quantity == 2
+        assert draft.total_cost() == pytest.approx(20.0)
+        assert draft.total_space() == pytest.approx(2.0)
@@ -1,4 +1,6 @@
 from src.shop_ops.product import Product
+from src.shop_ops.shop import Shop
+from src.shop_ops.supplier_order_draft import SupplierOrderDraft
 from src.shop_ops.warehouse import Warehouse
 import pytest
 
@@ -72,3 +74,41 @@ class TestWarehouse:
     def test_get_available_space(self, product, warehouse):
         warehouse.add_stock(product, 10)
         assert warehouse.get_available_space() == pytest.approx(99.0)
+
+    def test_used_space_follows_add_and_remove(self, product, warehouse):
+        warehouse.add_stock(product, 10)
+        warehouse.remove_stock(product, 4)
+        assert warehouse.get_used_space() == pytest.approx(0.6)
+        warehouse.remove_stock(product, 6)
+        assert warehouse.get_used_space() == pytest.approx(0.0)
+
+    def test_used_space_does_not_drift(self, product):
+        warehouse = Warehouse(capacity=1.0)
+        warehouse.add_stock(product, 5)
+        warehouse.add_stock(product, 7)
+        warehouse.remove_stock(product, 7)
+        warehouse.remove_stock(product, 5)
+
+        assert warehouse.get_used_space() == 0.0
+        SupplierOrderDraft().add_line(Shop(warehouse=warehouse), product, 10)
+
+    def test_failed_remove_does_not_change_state(self, product, warehouse):
+        warehouse.add_stock(product, 3)
+        with pytest.raises(ValueError):
+            warehouse.remove_stock(product, 5)
+        assert warehouse.get_quantity(product) == 3
+        assert warehouse.get_used_space() == pytest.approx(0.3)
+
+    def test_stocked_count_tracks_products_with_stock(self, product,
+                                                      warehouse):
+        bread = Product(name="Chleb", purchase_price=11, sell_price=14,
+                        space=0.2)
+        assert warehouse.get_stocked_count() == 0
+        warehouse.add_stock(product, 2)
+        warehouse.add_stock(bread, 1)
+        warehouse.add_stock(product, 1)
+        assert warehouse.get_stocked_count() == 2
+        warehouse.remove_stock(product, 3)
+        assert warehouse.get_stocked_count() == 1
+        warehouse.add_stock(product, 1)
+        assert warehouse.get_stocked_count() == 2